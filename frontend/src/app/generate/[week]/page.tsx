@@ -49,7 +49,7 @@ export default function GenerateWeekPage() {
       setCurrentStep("Calling backend API...");
       setProgress(5);
 
-      // Call the backend generation API
+      // Queue the generation job (returns immediately with a job id)
       const response = await fetch(
         `http://localhost:8000/api/v1/gen/weeks/${weekId}/generate`,
         {
@@ -64,73 +64,62 @@ export default function GenerateWeekPage() {
         throw new Error(`API returned ${response.status}: ${response.statusText}`);
       }
 
-      const data = await response.json();
-
-      // Parse stdout logs
-      if (data.stdout) {
-        const lines = data.stdout.split("\n");
-        let progressValue = 10;
-
-        for (const line of lines) {
-          if (!line.trim()) continue;
-
-          // Parse log level and message
-          let level: LogEntry["level"] = "info";
-          let message = line;
-
-          if (line.includes("ERROR") || line.includes("Failed")) {
-            level = "error";
-          } else if (line.includes("SUCCESS") || line.includes("✓") || line.includes("completed")) {
-            level = "success";
-          } else if (line.includes("WARNING") || line.includes("⚠")) {
-            level = "warning";
-          }
-
-          addLog(level, message);
+      let job = await response.json();
+      if (job.deduplicated) {
+        addLog("info", `Week ${weekId} is already generating (job ${job.id})`);
+      } else {
+        addLog("info", `Queued job ${job.id}`);
+      }
 
-          // Update progress based on content
-          if (line.includes("Phase 1") || line.includes("week_spec")) {
-            setCurrentStep("Phase 1: Generating week planning...");
-            progressValue = Math.min(progressValue + 5, 40);
-          } else if (line.includes("Day 1") || line.includes("Day1")) {
-            setCurrentStep("Phase 2: Generating Day 1...");
-            progressValue = 45;
-          } else if (line.includes("Day 2") || line.includes("Day2")) {
-            setCurrentStep("Phase 2: Generating Day 2...");
-            progressValue = 60;
-          } else if (line.includes("Day 3") || line.includes("Day3")) {
-            setCurrentStep("Phase 2: Generating Day 3...");
-            progressValue = 75;
-          } else if (line.includes("Day 4") || line.includes("Day4")) {
-            setCurrentStep("Phase 2: Generating Day 4...");
-            progressValue = 90;
+      // Poll the job's status and stream its output until it finishes
+      let offset = 0;
+      let pending = "";
+      while (true) {
+        const logsResponse = await fetch(
+          `http://localhost:8000/api/v1/jobs/${job.id}/logs?offset=${offset}`
+        );
+        if (logsResponse.ok) {
+          const chunk = await logsResponse.json();
+          offset = chunk.offset;
+          const lines = (pending + chunk.text).split("\n");
+          pending = lines.pop() ?? "";
+
+          for (const line of lines) {
+            if (!line.trim()) continue;
+
+            // Parse log level and message
+            let level: LogEntry["level"] = "info";
+            if (line.includes("ERROR") || line.includes("Failed") || line.includes("✗")) {
+              level = "error";
+            } else if (line.includes("SUCCESS") || line.includes("✓") || line.includes("completed")) {
+              level = "success";
+            } else if (line.includes("WARNING") || line.includes("⚠")) {
+              level = "warning";
+            }
+            addLog(level, line);
           }
-
-          setProgress(progressValue);
-
-          // Small delay to make logs readable
-          await new Promise((resolve) => setTimeout(resolve, 50));
         }
-      }
 
-      // Parse stderr for errors
-      if (data.stderr && data.stderr.trim()) {
-        const errorLines = data.stderr.split("\n");
-        for (const line of errorLines) {
-          if (line.trim()) {
-            addLog("error", line);
-          }
+        const statusResponse = await fetch(`http://localhost:8000/api/v1/jobs/${job.id}`);
+        if (!statusResponse.ok) {
+          throw new Error(`API returned ${statusResponse.status}: ${statusResponse.statusText}`);
         }
+        job = await statusResponse.json();
+        setCurrentStep(job.message || job.status);
+        setProgress(Math.max(5, Math.round((job.step / job.total_steps) * 100)));
+
+        if (!["queued", "running"].includes(job.status)) break;
+        await new Promise((resolve) => setTimeout(resolve, 2000));
       }
 
       // Check final status
-      if (data.success) {
+      if (job.status === "succeeded") {
         setProgress(100);
         setCurrentStep("Generation complete!");
         setCompleted(true);
         addLog("success", `Week ${weekId} generation completed successfully!`);
       } else {
-        throw new Error(`Generation failed with return code ${data.return_code}`);
+        throw new Error(job.error || `Generation ${job.status}`);
       }
 
       setIsGenerating(false);
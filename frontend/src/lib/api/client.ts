@@ -196,14 +196,26 @@ class TequilaApiClient {
 
   connectWebSocket(
     onMessage: (data: any) => void,
-    onError?: (error: Event) => void
+    onError?: (error: Event) => void,
+    weeks?: number[]
   ): WebSocket {
     const wsUrl = this.baseUrl.replace("http", "ws") + "/ws";
     const ws = new WebSocket(wsUrl);
+    // Server messages arrive as binary frames holding UTF-8 JSON
+    ws.binaryType = "arraybuffer";
+    const decoder = new TextDecoder();
+
+    // Only receive progress for these weeks (default: all weeks)
+    if (weeks) {
+      ws.onopen = () => ws.send(JSON.stringify({ type: "subscribe", weeks }));
+    }
 
     ws.onmessage = (event) => {
+      if (event.data === "pong") return;
       try {
-        const data = JSON.parse(event.data);
+        const text =
+          typeof event.data === "string" ? event.data : decoder.decode(event.data);
+        const data = JSON.parse(text);
         onMessage(data);
       } catch (e) {
         console.error("Failed to parse WebSocket message:", e);
@@ -1,6 +1,7 @@
 """FastAPI application for Latin A curriculum management."""
-from fastapi import FastAPI, HTTPException, Path as PathParam, Header, Depends, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Path as PathParam, Query, Header, Depends, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, FileResponse, Response, StreamingResponse
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -30,20 +31,66 @@ from .services.storage import (
     write_file,
     read_json,
     write_json,
+    path_exists,
+    week_dir,
     DAY_FIELDS,
     WEEK_SPEC_PARTS,
     ROLE_CONTEXT_PARTS
 )
 from .services.validator import validate_week
-from .services.exporter import export_week_to_zip
+from .services.exporter import export_week_to_zip, export_weeks, stream_weeks_zip
 from .services.usage_tracker import get_tracker
 from .services.websocket import manager
+from .services.curriculum_index import get_curriculum_index
+from .services.job_queue import get_job_queue
+from .services.progress_bus import get_progress_bus
+from .services.metrics import get_registry
+import asyncio
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the curriculum index watcher and the generation job queue for the app's lifetime."""
+    index = get_curriculum_index()
+    index.build()
+    index.start_watcher()
+
+    # Progress is published from worker threads; hop onto the event loop
+    loop = asyncio.get_running_loop()
+    bus = get_progress_bus()
+    bus_token = bus.subscribe(
+        lambda event: asyncio.run_coroutine_threadsafe(manager.publish_event(event), loop)
+    )
+    jobs = get_job_queue()
+    jobs.on_progress = _publish_job_progress
+
+    yield
+
+    jobs.shutdown()
+    bus.unsubscribe(bus_token)
+    index.stop_watcher()
+
+
+def _publish_job_progress(event: Dict[str, Any]):
+    """Forward a job queue progress event to the progress bus."""
+    get_progress_bus().publish(
+        event["week"],
+        day=event["day"],
+        phase="job",
+        status=event["status"],
+        message=event["message"],
+        job_id=event["job_id"],
+        step=event["step"],
+        total_steps=event["total_steps"],
+        percentage=round((event["step"] / event["total_steps"]) * 100, 1)
+    )
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Latin A Curriculum API",
     description="API for managing 36-week Latin A curriculum with per-field file structure",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware for frontend
@@ -87,6 +134,14 @@ def require_api_key(x_api_key: Optional[str] = Header(None)):
         )
 
 
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header lists etag (or *), so a 304 can be sent."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates or "*" in candidates
+
+
 @app.get("/")
 def root():
     """API root endpoint."""
@@ -97,64 +152,59 @@ def root():
     }
 
 
+@app.get("/metrics")
+def metrics():
+    """Prometheus metrics in the text exposition format."""
+    return Response(
+        get_registry().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.get("/api/v1/weeks")
-def list_weeks():
-    """List all weeks with their current status."""
-    curriculum_path = settings.curriculum_base_path / "LatinA"
-    weeks = []
-
-    for week_num in range(1, 36):
-        week_path = curriculum_path / f"Week{week_num:02d}"
-
-        # Check if week exists
-        if not week_path.exists():
-            weeks.append({
-                "week_number": week_num,
-                "status": "not_generated",
-                "has_spec": False,
-                "has_days": 0,
-                "last_modified": None
-            })
-            continue
-
-        # Check for internal_documents/week_spec.json
-        spec_path = week_path / "internal_documents" / "week_spec.json"
-        has_spec = spec_path.exists()
-
-        # Count day folders
-        day_folders = list(week_path.glob("Day*"))
-        day_count = len([d for d in day_folders if d.is_dir()])
-
-        # Determine status
-        if day_count == 4 and has_spec:
-            status = "complete"
-        elif day_count > 0 or has_spec:
-            status = "partial"
-        else:
-            status = "not_generated"
+def list_weeks(if_none_match: Optional[str] = Header(None)):
+    """
+    List all weeks with their current status.
 
-        # Get last modified time
-        last_modified = None
-        if week_path.exists():
-            last_modified = week_path.stat().st_mtime
-            from datetime import datetime
-            last_modified = datetime.fromtimestamp(last_modified).isoformat()
+    Served from the in-process curriculum index. Send the returned ETag back
+    as If-None-Match to get a 304 while nothing has changed.
+    """
+    payload, etag = get_curriculum_index().snapshot()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
 
-        weeks.append({
-            "week_number": week_num,
-            "status": status,
-            "has_spec": has_spec,
-            "has_days": day_count,
-            "last_modified": last_modified
-        })
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
 
-    return {"weeks": weeks}
+    return JSONResponse(payload, headers=headers)
 
 
 @app.get("/api/v1/usage")
 def get_usage():
     """Get LLM usage statistics and cost estimates."""
-    return get_tracker().get_summary()
+    tracker = get_tracker()
+    tracker.refresh()  # include spend recorded by generation job processes
+    return tracker.get_summary()
+
+
+@app.get("/api/v1/usage/breakdown")
+def get_usage_breakdown(
+    group_by: str = Query("week,phase,task", description="Comma-separated: week, day, phase, task, model, cache_hit"),
+    week: Optional[int] = Query(None, ge=1, le=36),
+    day: Optional[int] = Query(None, ge=0, le=4),
+    phase: Optional[str] = None,
+    task: Optional[str] = None
+):
+    """Cost and latency of LLM calls grouped by week, day, phase, prompt task, model or cache hit."""
+    filters = {"week": week, "day": day, "phase": phase, "task": task}
+    tracker = get_tracker()
+    tracker.refresh()
+    try:
+        return tracker.breakdown(
+            group_by=[dim.strip() for dim in group_by.split(",") if dim.strip()],
+            **{dim: value for dim, value in filters.items() if value is not None}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/api/v1/usage/reset")
@@ -177,14 +227,15 @@ async def websocket_endpoint(websocket: WebSocket):
     - Progress updates during generation
     - Validation results
     - Error notifications
+
+    Send {"type": "subscribe", "weeks": [N]} to receive only those weeks.
     """
     await manager.connect(websocket)
     try:
         while True:
-            # Keep connection alive and listen for ping/pong
+            # Keep connection alive; answer ping and subscription commands
             data = await websocket.receive_text()
-            if data == "ping":
-                await websocket.send_text("pong")
+            await manager.handle_message(websocket, data)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
@@ -456,6 +507,9 @@ def validate_week_endpoint(
 ):
     """Validate a complete week structure."""
     result = validate_week(week)
+    get_curriculum_index().record_validation(
+        week, result.is_valid(), len(result.errors), len(result.warnings)
+    )
 
     return {
         "week": week,
@@ -495,25 +549,113 @@ def export_week_endpoint(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/v1/exports")
+def export_weeks_endpoint(
+    weeks: str = Query("1-35", description="Week specification such as 1-5,7"),
+    jobs: Optional[int] = Query(None, ge=0, le=64, description="Worker processes (0 = one per CPU)"),
+    incremental: bool = Query(True, description="Reuse unchanged files from the previous archives"),
+    deterministic: Optional[bool] = Query(None, description="Reproducible archives (default: EXPORT_DETERMINISTIC)"),
+    _auth: None = Depends(require_api_key)
+):
+    """
+    Export several weeks at once, packaging them on a process pool. Requires API key.
+
+    Unlike POST /api/v1/weeks/{week}/export, weeks are not validated first.
+    Per-week failures are listed under "errors" instead of failing the request.
+    """
+    from .cli.gen import parse_week_spec
+
+    try:
+        week_numbers = parse_week_spec(weeks)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    report = export_weeks(
+        week_numbers,
+        jobs=settings.EXPORT_JOBS if jobs is None else jobs,
+        incremental=incremental,
+        deterministic=deterministic
+    )
+    for result in report["results"]:
+        result["zip_path"] = str(result["zip_path"])
+    return report
+
+
+@app.get("/api/v1/exports/download")
+def stream_weeks_export(
+    weeks: str = Query(..., description="Week specification such as 3 or 1-5,7"),
+    deterministic: Optional[bool] = Query(None, description="Reproducible archive (default: EXPORT_DETERMINISTIC)"),
+    _auth: None = Depends(require_api_key)
+):
+    """
+    Stream a ZIP of one or more weeks, built on the fly.
+
+    Nothing is staged in exports/ and memory stays constant whatever the
+    selection; each week carries its manifest.json as in exported archives.
+    Building a week recompiles its specs and materializes it, so like the
+    other export endpoints this requires the API key.
+    The response is chunked, so it has no Content-Length and no Range support
+    (use /api/v1/weeks/{week}/export/download for a resumable download).
+    """
+    from .cli.gen import parse_week_spec
+
+    try:
+        week_numbers = parse_week_spec(weeks)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    missing = [week for week in week_numbers if not path_exists(week_dir(week))]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Weeks not found: {missing}")
+
+    if len(week_numbers) == 1:
+        filename = f"LatinA_Week{week_numbers[0]:02d}.zip"
+    else:
+        filename = f"LatinA_Weeks{week_numbers[0]:02d}-{week_numbers[-1]:02d}.zip"
+
+    return StreamingResponse(
+        stream_weeks_zip(week_numbers, deterministic=deterministic),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @app.get("/api/v1/weeks/{week}/export/download")
 def download_week_export(
-    week: int = PathParam(..., ge=1, le=36)
+    week: int = PathParam(..., ge=1, le=36),
+    if_none_match: Optional[str] = Header(None)
 ):
-    """Download the exported zip file for a week."""
-    from .services.exporter import get_exports_dir
+    """
+    Download the exported zip file for a week.
+
+    Supports Range requests (resumable and partial downloads, If-Range) and
+    conditional requests: send the ETag back as If-None-Match to get a 304
+    while the archive is unchanged. Deterministic archives use the manifest's
+    content hash as ETag, so it survives rebuilds of unchanged content.
+    """
+    from .services.exporter import archive_etag, archive_name, get_exports_dir
 
-    zip_path = get_exports_dir() / f"LatinA_Week{week:02d}.zip"
+    zip_path = get_exports_dir() / archive_name(week)
 
-    if not zip_path.exists():
+    try:
+        stat = zip_path.stat()
+    except FileNotFoundError:
         raise HTTPException(
             status_code=404,
             detail=f"Export not found for Week {week}. Use POST /api/v1/weeks/{week}/export first."
         )
 
+    etag = archive_etag(zip_path, stat)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
     return FileResponse(
         path=str(zip_path),
         media_type="application/zip",
-        filename=zip_path.name
+        filename=f"LatinA_Week{week:02d}.zip",
+        headers=headers,
+        stat_result=stat
     )
 
 
@@ -577,40 +719,95 @@ def generate_day_document_endpoint(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/v1/gen/weeks/{week}/generate")
-async def generate_week_full(
+@app.post("/api/v1/gen/weeks/{week}/days")
+def generate_week_days_endpoint(
     week: int = PathParam(..., ge=1, le=36),
+    concurrent: bool = Query(True, description="Generate the 4 days in parallel"),
     _auth: None = Depends(require_api_key)
 ):
     """
-    Generate complete week using CLI script.
-    Executes generate_all_weeks.py and returns results.
+    Generate Days 1-4 (plus Day 4 assessment) from existing week planning. Requires API key.
+
+    Per-day failures are reported in that day's result instead of failing the request.
     """
-    import subprocess
-    import sys
+    from .services.generator_day import hydrate_week_days
 
     try:
-        # Run the generation CLI script
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli.generate_all_weeks", "--week", str(week)],
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout
-        )
-
+        client = get_llm_client()
+        if concurrent:
+            days = hydrate_week_days(week, client)
+        else:
+            days = {}
+            for day in range(1, 5):
+                try:
+                    days[day] = hydrate_day_from_llm(week, day, client)
+                except Exception as e:
+                    days[day] = {"week": week, "day": day, "status": "error", "error": str(e)}
         return {
             "week": week,
-            "success": result.returncode == 0,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "return_code": result.returncode
+            "success": all(result["status"] == "success" for result in days.values()),
+            "days": days
         }
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=504, detail="Generation timed out after 10 minutes")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/v1/gen/weeks/{week}/generate", status_code=202)
+def generate_week_full(
+    week: int = PathParam(..., ge=1, le=36),
+    concurrent_days: bool = Query(False, description="Generate the 4 days in parallel"),
+    _auth: None = Depends(require_api_key)
+):
+    """
+    Queue a complete week generation (generate_all_weeks CLI) as a background job.
+
+    Returns the job immediately; poll /api/v1/jobs/{job_id} (or watch /ws) for
+    progress. A week that already has a queued or running job gets that job back.
+    """
+    job = get_job_queue().submit(week, {"concurrent_days": concurrent_days})
+    return job
+
+
+# ============================================================================
+# GENERATION JOBS
+# ============================================================================
+
+@app.get("/api/v1/jobs")
+def list_jobs(
+    week: Optional[int] = Query(None, ge=1, le=36),
+    limit: int = Query(50, ge=1, le=500)
+):
+    """List recent generation jobs, newest first."""
+    return {"jobs": get_job_queue().list(week=week, limit=limit)}
+
+
+@app.get("/api/v1/jobs/{job_id}")
+def get_job(job_id: str):
+    """Get the status of a generation job."""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@app.post("/api/v1/jobs/{job_id}/cancel")
+def cancel_job(job_id: str, _auth: None = Depends(require_api_key)):
+    """Cancel a queued or running generation job. Requires API key."""
+    job = get_job_queue().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@app.get("/api/v1/jobs/{job_id}/logs")
+def get_job_logs(job_id: str, offset: int = Query(0, ge=0)):
+    """Get a job's output from byte offset (pass the returned offset to continue)."""
+    queue = get_job_queue()
+    if queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return queue.logs(job_id, offset=offset)
+
+
 # NOTE: Hydrate endpoint temporarily disabled - use CLI tools instead
 # @app.post("/api/v1/gen/weeks/{week}/hydrate")
 # def hydrate_week_endpoint(
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""CLI tool to export curriculum weeks to ZIP files, packaging them in parallel."""
+import sys
+import argparse
+from pathlib import Path
+
+import orjson
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.config import settings
+from src.cli.gen import parse_week_spec
+from src.services.exporter import export_weeks, format_export_result
+
+
+def main():
+    """Export the selected weeks and print one combined report."""
+    parser = argparse.ArgumentParser(
+        description="Export curriculum weeks to curriculum/LatinA/exports/ (incremental by default)"
+    )
+    parser.add_argument("--weeks", default="1-35", help="Week specification such as 3,5-7 (default: 1-35)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=settings.EXPORT_JOBS,
+        help=f"Worker processes packaging weeks (0 = one per CPU, default: {settings.EXPORT_JOBS})"
+    )
+    parser.add_argument("--full", action="store_true", help="Rebuild every archive instead of reusing unchanged files")
+    parser.add_argument(
+        "--deterministic",
+        action=argparse.BooleanOptionalAction,
+        default=settings.EXPORT_DETERMINISTIC,
+        help="Byte-reproducible archives: sorted members, fixed timestamps, no export_date"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the aggregated report as JSON")
+    args = parser.parse_args()
+
+    try:
+        weeks = parse_week_spec(args.weeks)
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+    if args.jobs < 0:
+        print("✗ Error: --jobs must be >= 0")
+        sys.exit(1)
+
+    report = export_weeks(
+        weeks,
+        jobs=args.jobs,
+        incremental=not args.full,
+        on_result=None if args.json else lambda outcome: print(format_export_result(outcome)),
+        deterministic=args.deterministic
+    )
+
+    if args.json:
+        print(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2).decode())
+    else:
+        if report["skipped"]:
+            print(f"⊘ Skipped {len(report['skipped'])} week(s) that do not exist: {report['skipped']}")
+        print(
+            f"\nExported {report['exported']} week(s), {report['unchanged']} unchanged, "
+            f"{len(report['errors'])} failed in {report['duration_s']:.2f}s with {report['jobs']} job(s)"
+        )
+        print(
+            f"  {report['source_bytes'] / (1024 * 1024):.1f} MB packaged at {report['throughput_mb_s']:.2f} MB/s "
+            f"({report['bytes_read'] / (1024 * 1024):.1f} MB read, "
+            f"{report['archive_bytes'] / (1024 * 1024):.1f} MB of archives)"
+        )
+
+    sys.exit(1 if report["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
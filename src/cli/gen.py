@@ -7,11 +7,11 @@ Usage:
     gen 3,5,7          # Generate Weeks 3, 5, and 7
     gen 3-10           # Generate Weeks 3 through 10
     gen 1-5,11-15      # Generate Weeks 1-5 and 11-15
+    gen 3 --refresh    # Extra flags are passed through to generate_all_weeks
+    gen 3,5,7 --jobs 3 # Run weeks whose prerequisites allow it in parallel
 """
 
 import sys
-import subprocess
-from pathlib import Path
 
 
 def parse_week_spec(spec: str) -> list[int]:
@@ -54,38 +54,24 @@ def parse_week_spec(spec: str) -> list[int]:
     return sorted(list(weeks))
 
 
-def generate_weeks(weeks: list[int]):
-    """Generate specified weeks using the main CLI."""
-    # Get the project root (steel directory)
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent.parent
+def generate_weeks(weeks: list[int], extra_args: list[str] | None = None):
+    """Generate specified weeks in one in-process scheduler run."""
+    from .generate_all_weeks import main as generate_all_weeks_main
 
     print(f"Generating {len(weeks)} week(s): {', '.join(map(str, weeks))}")
     print("=" * 80)
 
-    for week in weeks:
-        print(f"\n📚 Generating Week {week}...")
+    # One run shares the LLM client, response cache and usage tracker across
+    # weeks and lets the scheduler order them by prerequisites.
+    returncode = generate_all_weeks_main([
+        "--weeks",
+        ",".join(map(str, weeks)),
+        *(extra_args or [])
+    ])
 
-        # Run the main generator
-        cmd = [
-            sys.executable,
-            "-m",
-            "src.cli.generate_all_weeks",
-            "--week",
-            str(week)
-        ]
-
-        result = subprocess.run(
-            cmd,
-            cwd=project_root,
-            capture_output=False
-        )
-
-        if result.returncode != 0:
-            print(f"❌ Failed to generate Week {week}")
-            return result.returncode
-
-        print(f"✅ Week {week} complete")
+    if returncode != 0:
+        print("❌ Some weeks failed (see logs/week_status.json)")
+        return returncode
 
     print("\n" + "=" * 80)
     print(f"✨ Successfully generated {len(weeks)} week(s)!")
@@ -107,7 +93,7 @@ def main():
 
     try:
         weeks = parse_week_spec(spec)
-        return generate_weeks(weeks)
+        return generate_weeks(weeks, sys.argv[2:])
     except ValueError as e:
         print(f"Error: {e}")
         print("\nValid formats:")
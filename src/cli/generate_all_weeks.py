@@ -8,21 +8,51 @@ Usage:
     python -m src.cli.generate_all_weeks --from 1 --to 35
     python -m src.cli.generate_all_weeks --from 1 --to 2  # Test with 2 weeks
     python -m src.cli.generate_all_weeks --week 11        # Single week
+    python -m src.cli.generate_all_weeks --week 11 --refresh  # Ignore cached LLM responses
+    python -m src.cli.generate_all_weeks --weeks 3,5-7 --jobs 3  # Parallel where prerequisites allow
+
+Weeks run in prerequisite order (curriculum_outline.json) on an in-process
+scheduler that shares one LLM client and usage tracker; see
+src/services/week_scheduler.py.
 """
 import argparse
+import atexit
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from ..config import get_llm_client, settings
 from ..services.generator_week import (
     scaffold_week,
     generate_week_planning
 )
-from ..services.generator_day import hydrate_day_from_llm
+from ..services.generator_day import hydrate_day_from_llm, hydrate_week_days
 from ..services.validator import validate_week
 from ..services.exporter import export_week_to_zip
 from ..services.usage_tracker import get_tracker
+from ..services.metrics import get_registry
+from ..services.job_queue import ABORTED_EXIT_CODE
+from ..services.week_scheduler import (
+    WeekScheduler,
+    build_week_graph,
+    dependency_depth,
+    STATUS_SUCCESS,
+    STATUS_FAILED,
+    STATUS_ABORTED,
+    STATUS_BLOCKED
+)
+
+
+def print_cache_stats(client):
+    """Print response cache hit/miss counters if the client is cached."""
+    cache = getattr(client, "cache", None)
+    if cache is None:
+        return
+    stats = cache.get_stats()
+    print(
+        f"  Cache: {stats['hits']} hits / {stats['misses']} misses "
+        f"({stats['hit_rate'] * 100:.0f}% hit rate, {stats['tokens_saved']:,} tokens saved)"
+    )
 
 
 def print_banner():
@@ -38,7 +68,26 @@ def print_banner():
     print()
 
 
-def generate_week(week_number: int, client, export: bool = True) -> bool:
+def print_day_result(day: int, result: dict):
+    """Print the outcome of one day's hydration."""
+    if result.get("status") == "success":
+        print(f"    ✓ Generated all fields successfully")
+
+        # Show Day 4 assessment status
+        if day == 4 and "assessment_paths" in result:
+            print(f"    ✓ Quiz packet and teacher key generated")
+        elif day == 4 and "assessment_error" in result:
+            print(f"    ⚠ Assessment generation failed: {result['assessment_error']}")
+    else:
+        print(f"    ⚠ Generation completed with warnings")
+
+
+def generate_week(
+    week_number: int,
+    client,
+    export: bool = True,
+    concurrent_days: bool = False
+) -> bool:
     """
     Generate a complete week with all days, validate, and optionally export.
 
@@ -50,6 +99,7 @@ def generate_week(week_number: int, client, export: bool = True) -> bool:
         week_number: Week number (1-35)
         client: LLM client instance
         export: Whether to export to ZIP after generation
+        concurrent_days: Generate the 4 days in parallel (see hydrate_week_days)
 
     Returns:
         True if successful, False if aborted
@@ -78,28 +128,37 @@ def generate_week(week_number: int, client, export: bool = True) -> bool:
 
     # PHASE 2: Generate all 4 days using planning documents
     print(f"\n  === PHASE 2: Day Generation ===")
-    for day in range(1, 5):
-        print(f"\n  Day {day}:")
-        try:
-            result = hydrate_day_from_llm(week_number, day, client)
-            if result.get("status") == "success":
-                print(f"    ✓ Generated all fields successfully")
-
-                # Show Day 4 assessment status
-                if day == 4 and "assessment_paths" in result:
-                    print(f"    ✓ Quiz packet and teacher key generated")
-                elif day == 4 and "assessment_error" in result:
-                    print(f"    ⚠ Assessment generation failed: {result['assessment_error']}")
+    if concurrent_days:
+        print(f"  Generating Days 1-4 concurrently...")
+        day_results = hydrate_week_days(week_number, client)
+        failed_days = []
+        for day, result in day_results.items():
+            print(f"\n  Day {day}:")
+            if result["status"] == "error":
+                print(f"    ✗ Generation failed: {result['error']}")
+                failed_days.append(day)
             else:
-                print(f"    ⚠ Generation completed with warnings")
-        except ValueError as e:
-            if "aborted by user" in str(e):
-                print(f"    ✗ Generation aborted by user")
-                return False
-            raise
-        except Exception as e:
-            print(f"    ✗ Generation failed: {e}")
-            raise
+                print_day_result(day, result)
+
+        if any("aborted by user" in day_results[day]["error"] for day in failed_days):
+            return False
+        if failed_days:
+            raise RuntimeError(f"Day generation failed for day(s) {failed_days}")
+
+    else:
+        for day in range(1, 5):
+            print(f"\n  Day {day}:")
+            try:
+                result = hydrate_day_from_llm(week_number, day, client)
+                print_day_result(day, result)
+            except ValueError as e:
+                if "aborted by user" in str(e):
+                    print(f"    ✗ Generation aborted by user")
+                    return False
+                raise
+            except Exception as e:
+                print(f"    ✗ Generation failed: {e}")
+                raise
 
     # Validate week
     print(f"\n  Validating Week {week_number}...")
@@ -125,11 +184,12 @@ def generate_week(week_number: int, client, export: bool = True) -> bool:
     tracker = get_tracker()
     summary = tracker.get_summary()
     print(f"\n  Cost estimate: ${summary.get('estimated_cost_usd', 0):.4f}")
+    print_cache_stats(client)
 
     return True
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entrypoint for generate_all_weeks CLI."""
     parser = argparse.ArgumentParser(
         description="Generate Latin A curriculum weeks using OpenAI GPT-4o"
@@ -153,29 +213,78 @@ def main():
         type=int,
         help="Generate a single week (overrides --from/--to)"
     )
+    parser.add_argument(
+        "--weeks",
+        help="Week specification such as 3,5-7 (overrides --from/--to)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Maximum weeks generated concurrently when prerequisites allow (default: 1). "
+            "Only helps for runs over weeks that do not depend on each other: the shipped "
+            "outline makes every week depend on all earlier ones, so with it any run is one "
+            "chain and weeks are generated one at a time"
+        )
+    )
+    parser.add_argument(
+        "--concurrent-days",
+        action="store_true",
+        help="Generate the 4 days of each week in parallel"
+    )
     parser.add_argument(
         "--no-export",
         action="store_true",
         help="Skip ZIP export after generation"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk LLM response cache"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached LLM responses and overwrite them with fresh ones"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        help="Write Prometheus metrics here at exit (default: logs/metrics.prom)"
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    # Determine week range
-    if args.week:
-        start_week = args.week
-        end_week = args.week
+    # Determine weeks to generate
+    if args.weeks:
+        from .gen import parse_week_spec
+        try:
+            weeks = parse_week_spec(args.weeks)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     else:
-        start_week = args.start_week
-        end_week = args.end_week
-
-    # Validate range
-    if start_week < 1 or end_week > 35:
-        print("Error: Week numbers must be between 1 and 35 (v1.0 Pilot scope)")
-        sys.exit(1)
-
-    if start_week > end_week:
-        print("Error: Start week must be <= end week")
+        if args.week:
+            start_week = args.week
+            end_week = args.week
+        else:
+            start_week = args.start_week
+            end_week = args.end_week
+
+        # Validate range
+        if start_week < 1 or end_week > 35:
+            print("Error: Week numbers must be between 1 and 35 (v1.0 Pilot scope)")
+            sys.exit(1)
+
+        if start_week > end_week:
+            print("Error: Start week must be <= end week")
+            sys.exit(1)
+
+        weeks = list(range(start_week, end_week + 1))
+
+    if args.jobs < 1:
+        print("Error: --jobs must be >= 1")
         sys.exit(1)
 
     # Print banner
@@ -184,7 +293,10 @@ def main():
     # Initialize LLM client
     print("Initializing OpenAI GPT-4o client...")
     try:
-        client = get_llm_client()
+        client = get_llm_client(
+            cache=False if args.no_cache else None,
+            refresh_cache=args.refresh
+        )
         print(f"✓ Connected to OpenAI (model: {settings.MODEL_NAME})")
     except ValueError as e:
         print(f"✗ Failed to initialize LLM client: {e}")
@@ -195,31 +307,49 @@ def main():
     settings.logs_path.mkdir(parents=True, exist_ok=True)
     print(f"✓ Logs will be saved to: {settings.logs_path}")
 
-    # Generate weeks
-    print(f"\nGenerating weeks {start_week} to {end_week}...")
-    successful_weeks = []
-    failed_weeks = []
+    # Dump the same metrics GET /metrics serves, however the run ends
+    metrics_file = args.metrics_file or settings.logs_path / "metrics.prom"
+    atexit.register(get_registry().write, metrics_file)
 
-    for week_num in range(start_week, end_week + 1):
+    # Generate weeks
+    graph = build_week_graph(weeks)
+    print(f"\nGenerating {len(weeks)} week(s): {', '.join(map(str, weeks))}")
+    depth = dependency_depth(graph)
+    print(f"  Jobs: {args.jobs} (dependency depth {depth})")
+    if args.jobs > 1 and depth == len(weeks):
+        print("  ⚠ The selected weeks form a single prerequisite chain; they will run one at a time")
+
+    def ask_to_continue(week_num: int, error: BaseException) -> bool:
+        print(f"\n✗ Week {week_num} failed with error: {error}")
+        if not sys.stdin.isatty():
+            return False  # Nobody to ask (e.g. an API job): stop the run
         try:
-            success = generate_week(week_num, client, export=not args.no_export)
-            if success:
-                successful_weeks.append(week_num)
-            else:
-                print(f"\n✗ Week {week_num} generation aborted by user")
-                failed_weeks.append(week_num)
-                break  # Stop on user abort
-        except KeyboardInterrupt:
-            print(f"\n\n⚠ Generation interrupted by user (Ctrl+C)")
-            break
-        except Exception as e:
-            print(f"\n✗ Week {week_num} failed with error: {e}")
-            failed_weeks.append(week_num)
-
-            # Ask user whether to continue
             response = input("\nContinue with next week? (y/n): ").strip().lower()
-            if response != 'y':
-                break
+        except EOFError:
+            return False
+        return response == 'y'  # 'y' lets the weeks after it run anyway
+
+    scheduler = WeekScheduler(
+        lambda week_num: generate_week(
+            week_num,
+            client,
+            export=not args.no_export,
+            concurrent_days=args.concurrent_days
+        ),
+        jobs=args.jobs
+    )
+    try:
+        # Only a sequential run prompts; in parallel, failures block their dependents
+        statuses = scheduler.run(weeks, on_failure=ask_to_continue if args.jobs == 1 else None)
+    except KeyboardInterrupt:
+        print(f"\n\n⚠ Generation interrupted by user (Ctrl+C)")
+        statuses = {
+            int(week): entry["status"] for week, entry in scheduler.journal.items()
+        }
+
+    successful_weeks = [w for w, st in statuses.items() if st == STATUS_SUCCESS]
+    failed_weeks = [w for w, st in statuses.items() if st in (STATUS_FAILED, STATUS_ABORTED)]
+    blocked_weeks = [w for w, st in statuses.items() if st == STATUS_BLOCKED]
 
     # Final summary
     print(f"\n{'=' * 80}")
@@ -228,14 +358,19 @@ def main():
     print(f"Successful: {len(successful_weeks)} weeks")
     if failed_weeks:
         print(f"Failed/Aborted: {len(failed_weeks)} weeks - {failed_weeks}")
+    if blocked_weeks:
+        print(f"Blocked by failed prerequisites: {len(blocked_weeks)} weeks - {blocked_weeks}")
+    print(f"Week status journal: {scheduler.journal_path}")
 
     # Final cost summary
     tracker = get_tracker()
     summary = tracker.get_summary()
     print(f"\nTotal cost estimate: ${summary.get('estimated_cost_usd', 0):.4f}")
     print(f"Total tokens: {summary.get('total_tokens', 0):,}")
+    print_cache_stats(client)
 
     print(f"\nLogs saved to: {settings.logs_path}")
+    print(f"Metrics written at exit to: {metrics_file}")
     if not args.no_export:
         print(f"Exports saved to: {settings.exports_path}")
 
@@ -245,6 +380,10 @@ def main():
     print("  3. Review generated content for quality")
     print("=" * 80)
 
+    if any(st == STATUS_ABORTED for st in statuses.values()):
+        return ABORTED_EXIT_CODE
+    return 1 if failed_weeks or blocked_weeks else 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
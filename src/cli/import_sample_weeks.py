@@ -124,7 +124,7 @@ def main():
     print("\nNext steps:")
     print("  1. Verify imported weeks: ls curriculum/LatinA/Week{11,13,15}")
     print("  2. Validate structure: python -m src.cli.validate_week 11")
-    print("  3. Export to ZIP: python -m src.services.exporter 11")
+    print("  3. Export to ZIP: python -m src.cli.export_weeks --weeks 11")
 
 
 if __name__ == "__main__":
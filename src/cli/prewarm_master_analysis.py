@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""CLI tool to compute the gold standard master-week analysis ahead of a run."""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.config import get_llm_client
+from src.services.prompts.phase0_research import (
+    get_master_analysis,
+    get_master_analysis_path
+)
+
+
+def main():
+    """Compute (or verify) the persisted master-week analysis."""
+    parser = argparse.ArgumentParser(
+        description="Prewarm the gold standard Week 1/Week 11 analysis used by PHASE 0"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute even if the stored analysis matches the sample files"
+    )
+    args = parser.parse_args()
+
+    try:
+        client = get_llm_client()
+        analysis = get_master_analysis(client, force=args.force)
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    if "reused_from" in analysis.get("_metadata", {}):
+        print(f"✓ Master analysis is current: {get_master_analysis_path()}")
+    else:
+        print(f"✓ Master analysis computed: {get_master_analysis_path()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""CLI tool to move curriculum artifacts between the directory tree and the SQLite week store."""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.config import settings
+from src.services.storage import get_curriculum_base
+from src.services.storage_backends import SQLiteBackend
+
+
+def main():
+    """Import the directory tree into SQLite, or materialize SQLite back into files."""
+    parser = argparse.ArgumentParser(
+        description="Sync curriculum artifacts between curriculum/LatinA/ and the SQLite week store"
+    )
+    parser.add_argument(
+        "action",
+        choices=["import", "materialize"],
+        help="import: files -> SQLite; materialize: SQLite -> files"
+    )
+    parser.add_argument("--db", type=Path, help="SQLite store (default: STORAGE_DB_PATH or curriculum.sqlite)")
+    parser.add_argument("--week", type=int, help="Materialize only this week")
+    parser.add_argument("--dest", type=Path, help="Materialize into this directory instead of curriculum/LatinA/")
+    args = parser.parse_args()
+
+    db_path = args.db or settings.STORAGE_DB_PATH or get_curriculum_base() / "curriculum.sqlite"
+    backend = SQLiteBackend(db_path, get_curriculum_base)
+
+    try:
+        if args.action == "import":
+            count = backend.import_tree()
+            print(f"✓ Imported {count} files into {db_path}")
+        else:
+            dest = args.dest or get_curriculum_base()
+            count = backend.materialize(dest, week=args.week)
+            print(f"✓ Materialized {count} changed files into {dest}")
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""CLI report of LLM cost and latency by week, day, phase and prompt task."""
+import sys
+import argparse
+from pathlib import Path
+
+import orjson
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.usage_tracker import DIMENSIONS, get_tracker
+
+
+def format_table(report: dict, top: int = 0) -> str:
+    """Render a breakdown() report as a fixed-width table."""
+    group_by = report["group_by"]
+    rows = report["rows"][:top] if top else report["rows"]
+    headers = group_by + ["calls", "hits", "retries", "tokens", "cost $", "total s", "avg s", "max s"]
+    lines = [[
+        *("-" if row[dim] is None else str(row[dim]) for dim in group_by),
+        str(row["requests"]),
+        str(row["cache_hits"]),
+        str(row["retries"]),
+        f"{row['tokens_prompt'] + row['tokens_completion']:,}",
+        f"{row['cost_usd']:.4f}",
+        f"{row['latency_s']:.1f}",
+        f"{row['avg_latency_s']:.2f}",
+        f"{row['max_latency_s']:.2f}"
+    ] for row in rows]
+
+    widths = [max(len(cell) for cell in column) for column in zip(headers, *lines)]
+
+    def render(cells):
+        return "  ".join(cell.ljust(width) for cell, width in zip(cells, widths)).rstrip()
+
+    out = [render(headers), render(["-" * width for width in widths])]
+    out.extend(render(line) for line in lines)
+
+    totals = report["totals"]
+    out.append("")
+    out.append(
+        f"Total: {totals['requests']} calls ({totals['cache_hits']} cache hits, "
+        f"{totals['retries']} retries), ${totals['cost_usd']:.4f}, {totals['latency_s']:.1f}s of LLM time"
+    )
+    return "\n".join(out)
+
+
+def main():
+    """Print the usage breakdown from curriculum/usage/."""
+    parser = argparse.ArgumentParser(
+        description="Report LLM cost and latency by week, day, phase, prompt task, model or cache hit"
+    )
+    parser.add_argument(
+        "--group-by",
+        default="phase,task",
+        help=f"Comma-separated dimensions (default: phase,task). Choose from: {', '.join(DIMENSIONS)}"
+    )
+    parser.add_argument("--week", type=int, help="Only calls for this week")
+    parser.add_argument("--day", type=int, help="Only calls for this day (0 = week-level)")
+    parser.add_argument("--phase", help="Only calls in this phase (phase0, planning, day_fields, document, assessment)")
+    parser.add_argument("--task", help="Only calls for this prompt task (e.g. task_day_document)")
+    parser.add_argument("--top", type=int, default=0, help="Show only the N most expensive rows")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    filters = {"week": args.week, "day": args.day, "phase": args.phase, "task": args.task}
+    try:
+        report = get_tracker().breakdown(
+            group_by=[dim.strip() for dim in args.group_by.split(",") if dim.strip()],
+            **{dim: value for dim, value in filters.items() if value is not None}
+        )
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode())
+    elif not report["rows"]:
+        print("⚠ No attributed LLM calls recorded yet")
+    else:
+        print(format_table(report, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
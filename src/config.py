@@ -1,6 +1,6 @@
 """Configuration settings for the Latin A curriculum system."""
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,6 +17,16 @@ class Settings(BaseSettings):
     curriculum_base_path: Path = Path(__file__).parent.parent / "curriculum"
     exports_path: Path = Path(__file__).parent.parent / "curriculum" / "exports"
     logs_path: Path = Path(__file__).parent.parent / "logs"
+    STORAGE_BACKEND: str = "filesystem"  # "filesystem" or "sqlite" (single-file week store)
+    STORAGE_DB_PATH: Optional[Path] = None  # Defaults to curriculum/LatinA/curriculum.sqlite
+    CURRICULUM_INDEX_POLL_S: float = 2.0  # /api/v1/weeks watcher interval (0 = write listener only)
+    GEN_JOB_WORKERS: int = 1  # Week generation jobs run at once by the API
+    GEN_JOB_TIMEOUT_S: int = 3600  # Kill a generation job's child process after this long
+    WS_SEND_QUEUE_SIZE: int = 100  # Messages buffered per WebSocket client before progress is dropped
+    USAGE_FLUSH_INTERVAL_S: float = 2.0  # Usage records buffered before being appended to the ledger
+    USAGE_COMPACT_BYTES: int = 4 * 1024 * 1024  # Fold the usage ledger into summary.json past this size
+    EXPORT_JOBS: int = 1  # Worker processes packaging weeks in bulk exports (0 = one per CPU)
+    EXPORT_DETERMINISTIC: bool = False  # Byte-reproducible ZIPs (fixed timestamps, no export_date)
 
     # Curriculum parameters (Latin A v1.0 Pilot)
     total_weeks: int = 35
@@ -30,6 +40,19 @@ class Settings(BaseSettings):
     GEN_TEMP: float = 0.25
     GEN_MAX_TOKENS: int = 4000
     TIMEOUT_S: int = 120
+    OPENAI_BASE_URL: Optional[str] = None  # Override for OpenAI-compatible endpoints
+    LLM_MAX_CONNECTIONS: int = 20  # Shared HTTP pool size for async generation
+    LLM_CACHE_ENABLED: bool = True  # Replay identical prompts from curriculum/cache/
+    LLM_CACHE_MAX_MB: int = 256  # LRU eviction threshold for the response cache
+    LLM_RATE_LIMIT_ENABLED: bool = True  # Block callers to stay under the limits below
+    # Per-model requests/tokens per minute (OpenAI usage tier 1 defaults); JSON in .env.
+    # Enforced per process: API generation jobs split them across GEN_JOB_WORKERS,
+    # but LLM calls made by the API process itself or by separate CLI runs each get the full limit
+    LLM_RATE_LIMITS: Dict[str, Dict[str, int]] = {
+        "gpt-4o": {"rpm": 500, "tpm": 30000},
+        "gpt-4o-mini": {"rpm": 500, "tpm": 200000},
+        "o1-mini": {"rpm": 500, "tpm": 200000},
+    }
 
     # Cost Control & Safety (tracking only, enforcement disabled)
     DRY_RUN: bool = False
@@ -52,18 +75,54 @@ def get_settings() -> Settings:
     return settings
 
 
-def get_llm_client():
-    """Get the configured OpenAI GPT-4o LLM client."""
+def get_llm_client(cache: Optional[bool] = None, refresh_cache: bool = False):
+    """
+    Get the configured OpenAI GPT-4o LLM client.
+
+    Args:
+        cache: Wrap the client with the on-disk response cache
+               (default: settings.LLM_CACHE_ENABLED)
+        refresh_cache: Ignore cached responses but store fresh ones
+    """
     from .services.llm_client import OpenAIClient
 
+    s = get_settings()
+    if not s.OPENAI_API_KEY and not s.DRY_RUN:
+        raise ValueError("OPENAI_API_KEY is required. Set it in .env file.")
+
+    client = OpenAIClient(
+        # Dry runs never reach the network, so no real key is needed
+        api_key=s.OPENAI_API_KEY or "dry-run",
+        model=s.MODEL_NAME,
+        temp=s.GEN_TEMP,
+        max_tokens=s.GEN_MAX_TOKENS,
+        timeout=s.TIMEOUT_S,
+        base_url=s.OPENAI_BASE_URL
+    )
+
+    if cache is None:
+        cache = s.LLM_CACHE_ENABLED
+    if cache:
+        from .services.llm_cache import CachedLLMClient, get_response_cache
+        client = CachedLLMClient(client, get_response_cache(), refresh=refresh_cache)
+
+    return client
+
+
+def get_async_llm_client():
+    """Get the configured OpenAI GPT-4o client with async (pooled) generation."""
+    from .services.llm_client import AsyncOpenAIClient
+
     s = get_settings()
     if not s.OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY is required. Set it in .env file.")
 
-    return OpenAIClient(
+    return AsyncOpenAIClient(
         api_key=s.OPENAI_API_KEY,
         model=s.MODEL_NAME,
         temp=s.GEN_TEMP,
         max_tokens=s.GEN_MAX_TOKENS,
-        timeout=s.TIMEOUT_S
+        timeout=s.TIMEOUT_S,
+        base_url=s.OPENAI_BASE_URL,
+        max_connections=s.LLM_MAX_CONNECTIONS
     )
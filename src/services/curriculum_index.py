@@ -0,0 +1,252 @@
+"""In-process index of week status for GET /api/v1/weeks.
+
+The index is built once from the storage backend and then kept current in two
+ways:
+
+- storage write listener: every write_file()/write_json() or atomic batch
+  marks the affected week dirty (generators running in this process).
+- polling watcher: a daemon thread notices changes made by other processes
+  (CLI runs, manual edits). On the filesystem backend it only stats each week
+  directory and its internal_documents/ directory, which is all the week
+  status depends on.
+
+Dirty weeks are recomputed lazily on the next read, so a batch of writes costs
+one refresh. The serialized payload and its ETag are cached until something
+changes, which makes an unchanged poll O(1) and lets the endpoint answer
+If-None-Match with 304.
+"""
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+from . import storage
+from .storage_backends import FilesystemBackend, artifact_key
+
+logger = logging.getLogger(__name__)
+
+# Weeks listed by the API (Latin A v1.0 Pilot)
+INDEX_WEEKS = range(1, 36)
+
+
+def _week_entry(week: int, info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the /api/v1/weeks entry for one week from a backend week_info()."""
+    if info is None:
+        return {
+            "week_number": week,
+            "status": "not_generated",
+            "has_spec": False,
+            "has_days": 0,
+            "last_modified": None
+        }
+
+    has_spec = info["has_spec"]
+    day_count = info["days"]
+    if day_count == 4 and has_spec:
+        status = "complete"
+    elif day_count > 0 or has_spec:
+        status = "partial"
+    else:
+        status = "not_generated"
+
+    return {
+        "week_number": week,
+        "status": status,
+        "has_spec": has_spec,
+        "has_days": day_count,
+        "last_modified": datetime.fromtimestamp(info["last_modified"]).isoformat()
+    }
+
+
+class CurriculumIndex:
+    """Cached week status with incremental updates and an ETag."""
+
+    def __init__(self, poll_interval: float = 2.0):
+        """
+        Initialize index (call build() or let the first snapshot() build it).
+
+        Args:
+            poll_interval: Seconds between watcher polls (0 disables the watcher)
+        """
+        self.poll_interval = poll_interval
+        self.lock = Lock()
+        self.weeks: Dict[int, Dict[str, Any]] = {}
+        self.validation: Dict[int, Dict[str, Any]] = {}
+        self._dirty: set = set()
+        self._built = False
+        self._payload: Optional[Dict[str, Any]] = None
+        self._etag: Optional[str] = None
+        self._signatures: Dict[int, Tuple] = {}
+
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+        self.builds = 0
+        self.refreshes = 0
+
+    def build(self) -> None:
+        """Load every week from the storage backend (one overview call)."""
+        overview = storage.get_storage_backend().week_overview()
+        with self.lock:
+            self.weeks = {week: _week_entry(week, overview.get(week)) for week in INDEX_WEEKS}
+            self._dirty.clear()
+            self._built = True
+            self._payload = None
+            self.builds += 1
+        self._signatures = self._poll_signatures()
+
+    def mark_dirty(self, week: int) -> None:
+        """Recompute week on the next read."""
+        if week not in INDEX_WEEKS:
+            return
+        with self.lock:
+            self._dirty.add(week)
+            self._payload = None
+
+    def on_write(self, paths: List[Path]) -> None:
+        """Storage write listener: mark the weeks of the written paths dirty."""
+        base = storage.get_curriculum_base()
+        for path in paths:
+            try:
+                week, _, _ = artifact_key(base, path)
+            except ValueError:
+                continue
+            if week:
+                self.mark_dirty(week)
+
+    def record_validation(self, week: int, is_valid: bool, errors: int, warnings: int) -> None:
+        """Remember the latest validate_week() outcome for week."""
+        with self.lock:
+            self.validation[week] = {
+                "state": "valid" if is_valid else "invalid",
+                "errors": errors,
+                "warnings": warnings,
+                "validated_at": datetime.now().isoformat()
+            }
+            self._payload = None
+
+    def _refresh_dirty(self) -> None:
+        with self.lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+        backend = storage.get_storage_backend()
+        entries = {week: _week_entry(week, backend.week_info(week)) for week in dirty}
+        with self.lock:
+            for week, entry in entries.items():
+                if self.weeks.get(week) != entry and week in self.validation:
+                    # Content changed since the last validation
+                    self.validation[week] = {**self.validation[week], "state": "stale"}
+                self.weeks[week] = entry
+            self._payload = None
+            self.refreshes += len(entries)
+
+    def snapshot(self) -> Tuple[Dict[str, Any], str]:
+        """
+        Get the /api/v1/weeks payload and its ETag.
+
+        Returns:
+            (payload, etag) - the payload must not be mutated
+        """
+        if not self._built:
+            self.build()
+        if self._dirty:
+            self._refresh_dirty()
+
+        with self.lock:
+            if self._payload is None:
+                weeks = []
+                for week in INDEX_WEEKS:
+                    entry = dict(self.weeks[week])
+                    entry["validation"] = self.validation.get(week, {"state": "unknown"})
+                    weeks.append(entry)
+                self._payload = {"weeks": weeks}
+                digest = hashlib.sha256(orjson.dumps(self._payload)).hexdigest()[:20]
+                self._etag = f'"{digest}"'
+            return self._payload, self._etag
+
+    def _poll_signatures(self) -> Dict[int, Tuple]:
+        """Cheap per-week change signatures for the watcher."""
+        backend = storage.get_storage_backend()
+        if not isinstance(backend, FilesystemBackend):
+            # SQLite: one grouped query already is the cheap path
+            overview = backend.week_overview()
+            return {week: tuple(sorted(info.items())) for week, info in overview.items()}
+
+        signatures = {}
+        base = storage.get_curriculum_base()
+        for week in INDEX_WEEKS:
+            week_path = base / f"Week{week:02d}"
+            try:
+                week_stat = week_path.stat()
+            except FileNotFoundError:
+                continue
+            try:
+                internal_mtime = (week_path / "internal_documents").stat().st_mtime_ns
+            except FileNotFoundError:
+                internal_mtime = None
+            signatures[week] = (week_stat.st_mtime_ns, internal_mtime)
+        return signatures
+
+    def poll(self) -> List[int]:
+        """Compare signatures with the last poll and mark changed weeks dirty."""
+        signatures = self._poll_signatures()
+        changed = [
+            week for week in set(signatures) | set(self._signatures)
+            if signatures.get(week) != self._signatures.get(week)
+        ]
+        self._signatures = signatures
+        for week in changed:
+            self.mark_dirty(week)
+        return changed
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Curriculum index poll failed: {e}")
+
+    def start_watcher(self) -> None:
+        """Start the polling thread (no-op if disabled or already running)."""
+        if self.poll_interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="curriculum-index", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        """Stop the polling thread."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get build/refresh counters."""
+        with self.lock:
+            return {
+                "builds": self.builds,
+                "refreshes": self.refreshes,
+                "dirty": len(self._dirty),
+                "watching": self._watcher is not None and self._watcher.is_alive()
+            }
+
+
+# Global index instance
+_index: Optional[CurriculumIndex] = None
+
+
+def get_curriculum_index() -> CurriculumIndex:
+    """Get global curriculum index (registered as a storage write listener)."""
+    global _index
+    if _index is None:
+        from ..config import settings
+        _index = CurriculumIndex(poll_interval=settings.CURRICULUM_INDEX_POLL_S)
+        storage.add_write_listener(_index.on_write)
+    return _index
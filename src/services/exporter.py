@@ -1,11 +1,73 @@
-"""Export service for packaging curriculum weeks (v1.0 Pilot)."""
+"""Export service for packaging curriculum weeks (v1.0 Pilot).
+
+Each file in the week is read exactly once: the bytes are fed to SHA-256
+and the ZIP member's compressor from the same buffer, so hashing and
+compression share one pass over the week. manifest.json is built in memory
+from those hashes and written straight into the archive, so packaging
+never writes into the week directory. The archive itself is assembled in a
+temporary file next to the final one and renamed into place, so concurrent
+downloads only ever see a complete ZIP.
+
+Exports are incremental. Next to each archive, exports/.manifests/WeekNN.json
+records every member's (path, size, mtime_ns, sha256) together with the
+archive's own size and mtime. On the next export a file whose size and
+mtime_ns are unchanged keeps its recorded hash, and its compressed member is
+copied byte-for-byte from the previous archive instead of being read and
+deflated again (checked against its CRC-32 and SHA-256 on the way, falling
+back to recompressing the file if anything does not match). A week with no changes at all is not rebuilt. The previous
+archive is only trusted while its size and mtime still match the record.
+
+Deterministic mode (opt-in, Settings.EXPORT_DETERMINISTIC) makes an archive
+a pure function of the week's content: members sorted by path, a fixed
+1980-01-01 timestamp and 0644 mode on every member, a fixed DEFLATE level
+and no export_date in the manifest. Every manifest carries a content_hash
+over its (path, size, sha256) entries; for deterministic archives it is
+also the download ETag, so caches and sync jobs can skip unchanged weeks.
+
+export_weeks() exports many weeks at once: preparation stays in the calling
+process and the CPU-bound packaging (SHA-256 + DEFLATE) is spread over a
+process pool, with per-week reports and errors aggregated into one result.
+"""
+import multiprocessing
+import os
+import struct
+import threading
+import time
 import zipfile
+import zlib
 import hashlib
+import logging
 import orjson
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
-from .storage import week_dir, get_curriculum_base, save_compiled_week_spec, save_compiled_role_context
+from typing import BinaryIO, Callable, Dict, Generator, Iterable, Iterator, List, Any, Optional, Tuple
+from .storage import (
+    week_dir,
+    get_curriculum_base,
+    save_compiled_week_spec,
+    save_compiled_role_context,
+    path_exists,
+    materialize_week
+)
+
+logger = logging.getLogger(__name__)
+
+# Read size for the single pass over each file (hash + compress)
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
+# Archive-relative name of the in-memory manifest (under the WeekNN/ prefix)
+MANIFEST_NAME = "manifest.json"
+
+# Persisted export state, one JSON file per week under the exports directory
+STATE_DIR_NAME = ".manifests"
+STATE_VERSION = 2
+
+# Deterministic mode: every member gets the same timestamp and mode, and
+# DEFLATE always runs at the same level
+DETERMINISTIC_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+DETERMINISTIC_FILE_MODE = 0o644
+COMPRESS_LEVEL = 6
 
 
 def get_exports_dir() -> Path:
@@ -13,24 +75,123 @@ def get_exports_dir() -> Path:
     return get_curriculum_base() / "exports"
 
 
-def _calculate_sha256(file_path: Path) -> str:
-    """Calculate SHA256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+def archive_name(week_number: int) -> str:
+    """File name of a week's archive in the exports directory."""
+    return f"Week{week_number:02d}.zip"
+
+
+def _list_week_files(week_path: Path) -> List[Tuple[Path, str, os.stat_result]]:
+    """
+    List the files to export as (path, week-relative path, stat).
+
+    Sorted by the week-relative path string, the order members are written in.
+
+    A manifest.json left in the week directory by an older exporter is
+    skipped; the archive's manifest is always the freshly built one.
+    """
+    files = []
+    for file_path in week_path.rglob('*'):
+        if file_path.is_file():
+            rel_path = file_path.relative_to(week_path).as_posix()
+            if rel_path != MANIFEST_NAME:
+                files.append((file_path, rel_path, file_path.stat()))
+    files.sort(key=lambda item: item[1])
+    return files
+
+
+def _state_path(zip_path: Path) -> Path:
+    return zip_path.parent / STATE_DIR_NAME / f"{zip_path.stem}.json"
+
+
+def _read_state(zip_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    The previous export's record, or None if there is no usable one.
+
+    The record is only used while the archive it describes is still the one
+    on disk (same size and mtime_ns).
+    """
+    try:
+        state = orjson.loads(_state_path(zip_path).read_bytes())
+        archive_stat = zip_path.stat()
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if (state.get("version") != STATE_VERSION
+            or state.get("archive_size") != archive_stat.st_size
+            or state.get("archive_mtime_ns") != archive_stat.st_mtime_ns):
+        return None
+    return state
+
+
+def _save_state(
+    week_number: int,
+    zip_path: Path,
+    entries: List[Dict[str, Any]],
+    content_hash: str,
+    deterministic: bool
+) -> None:
+    archive_stat = zip_path.stat()
+    state = {
+        "version": STATE_VERSION,
+        "week": week_number,
+        "archive": zip_path.name,
+        "archive_size": archive_stat.st_size,
+        "archive_mtime_ns": archive_stat.st_mtime_ns,
+        "deterministic": deterministic,
+        "content_hash": content_hash,
+        "files": entries
+    }
+    _write_atomic(_state_path(zip_path), orjson.dumps(state, option=orjson.OPT_INDENT_2))
+
+
+def archive_etag(zip_path: Path, stat: Optional[os.stat_result] = None) -> str:
+    """
+    Strong ETag for an exported archive.
+
+    A deterministic archive is a pure function of its content, so its ETag
+    is the manifest's content_hash and stays the same across rebuilds (and
+    machines) as long as no file changed. Other archives get an ETag from
+    their mtime_ns and size.
+    """
+    state = _read_state(zip_path)
+    if state is not None and state.get("deterministic"):
+        return f'"{state["content_hash"]}"'
+    stat = stat or zip_path.stat()
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _temp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _open_temp(path: Path) -> Tuple[Path, BinaryIO]:
+    """Create a sibling temp file for path (os.open honours the umask, unlike mkstemp's 0600)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_path(path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    return tmp_path, os.fdopen(fd, "wb")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path, f = _open_temp(path)
+    try:
+        with f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
-def _generate_manifest(week_number: int, week_path: Path) -> Dict[str, Any]:
+def _unchanged(entry: Optional[Dict[str, Any]], st: os.stat_result) -> bool:
+    return entry is not None and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns
+
+
+def _new_manifest(week_number: int, deterministic: bool = False) -> Dict[str, Any]:
     """
-    Generate a manifest.json for the week export.
+    Manifest header; files are appended as they are written to the archive.
 
-    Includes:
-    - Week metadata
-    - List of all files with SHA256 hashes
-    - Export timestamp
-    - Version info
+    Deterministic manifests leave out export_date so they only depend on the
+    week's content.
     """
     manifest = {
         "week": week_number,
@@ -39,25 +200,320 @@ def _generate_manifest(week_number: int, week_path: Path) -> Dict[str, Any]:
         "pilot": "Latin A v1.0 Pilot (35 weeks)",
         "files": []
     }
+    if deterministic:
+        del manifest["export_date"]
+    return manifest
 
-    # Collect all files with SHA256 hashes
-    for file_path in sorted(week_path.rglob('*')):
-        if file_path.is_file():
-            rel_path = str(file_path.relative_to(week_path))
-            file_info = {
-                "path": rel_path,
-                "size_bytes": file_path.stat().st_size,
-                "sha256": _calculate_sha256(file_path)
-            }
-            manifest["files"].append(file_info)
 
+def _content_hash(files: List[Dict[str, Any]]) -> str:
+    """SHA-256 over the (path, size, sha256) of every file, in archive order."""
+    return hashlib.sha256(
+        orjson.dumps([[f["path"], f["size_bytes"], f["sha256"]] for f in files])
+    ).hexdigest()
+
+
+def _finish_manifest(manifest: Dict[str, Any]) -> Dict[str, Any]:
     manifest["file_count"] = len(manifest["files"])
     manifest["total_size_bytes"] = sum(f["size_bytes"] for f in manifest["files"])
-
+    manifest["content_hash"] = _content_hash(manifest["files"])
     return manifest
 
 
-def export_week_to_zip(week_number: int) -> Path:
+def _write_manifest(zipf: zipfile.ZipFile, prefix: str, manifest: Dict[str, Any], deterministic: bool) -> None:
+    arcname = f"{prefix}/{MANIFEST_NAME}"
+    if deterministic:
+        zinfo = zipfile.ZipInfo(arcname, DETERMINISTIC_DATE_TIME)
+        zinfo.external_attr = DETERMINISTIC_FILE_MODE << 16
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        arcname = zinfo
+    zipf.writestr(
+        arcname,
+        orjson.dumps(_finish_manifest(manifest), option=orjson.OPT_INDENT_2),
+        compresslevel=COMPRESS_LEVEL
+    )
+
+
+def _resolve_deterministic(deterministic: Optional[bool]) -> bool:
+    if deterministic is None:
+        from ..config import settings
+        return settings.EXPORT_DETERMINISTIC
+    return deterministic
+
+
+def _member_steps(
+    zipf: zipfile.ZipFile,
+    file_path: Path,
+    arcname: str,
+    deterministic: bool = False
+) -> Generator[None, None, Dict[str, Any]]:
+    """
+    Stream one file into the archive, hashing the same chunks it compresses.
+
+    A generator that pauses after each chunk (so a streaming caller can hand
+    the compressed bytes on) and returns the manifest entry. Deterministic
+    members get a fixed timestamp and mode instead of the file's own.
+
+    Returns:
+        The file's manifest entry (size_bytes, sha256)
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo._compresslevel = COMPRESS_LEVEL  # open(zinfo, "w") ignores ZipFile(compresslevel=)
+    if deterministic:
+        zinfo.date_time = DETERMINISTIC_DATE_TIME
+        zinfo.external_attr = DETERMINISTIC_FILE_MODE << 16
+        zinfo.create_system = 3
+    sha256_hash = hashlib.sha256()
+    size = 0
+    with open(file_path, "rb", buffering=0) as src, zipf.open(zinfo, "w") as dest:
+        for chunk in iter(lambda: src.read(EXPORT_CHUNK_SIZE), b""):
+            sha256_hash.update(chunk)
+            dest.write(chunk)
+            size += len(chunk)
+            yield
+    return {"size_bytes": size, "sha256": sha256_hash.hexdigest()}
+
+
+def _write_member(
+    zipf: zipfile.ZipFile,
+    file_path: Path,
+    arcname: str,
+    deterministic: bool = False
+) -> Dict[str, Any]:
+    """Write one file into the archive (see _member_steps()) and return its manifest entry."""
+    steps = _member_steps(zipf, file_path, arcname, deterministic)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+def _copy_member_raw(
+    zipf: zipfile.ZipFile,
+    source: BinaryIO,
+    info: zipfile.ZipInfo,
+    sha256: str
+) -> bool:
+    """
+    Append a member of another archive without recompressing it.
+
+    Writes a fresh local header, then copies the compressed bytes from
+    source (the previous archive's file object) and registers the member so
+    the central directory lists it. This leans on zipfile internals
+    (ZipFile.start_dir, the _FH_* header offsets), so the copy is checked on
+    the way through: the bytes are inflated (much cheaper than deflating)
+    and must match the recorded CRC-32 and SHA-256. On a mismatch, a corrupt
+    member or a zipfile that no longer has those internals, the output is
+    rewound and False is returned so the caller recompresses the file.
+
+    Returns:
+        True if the member was copied, False if it must be written afresh
+    """
+    try:
+        start = zipf.start_dir
+        source.seek(info.header_offset)
+        header = struct.unpack(zipfile.structFileHeader, source.read(zipfile.sizeFileHeader))
+        if header[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+        source.seek(header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        elif info.compress_type == zipfile.ZIP_STORED:
+            inflater = None
+        else:
+            return False
+    except (AttributeError, OSError, struct.error, zipfile.BadZipFile) as e:
+        logger.warning(f"Recompressing {info.filename}: cannot copy it from the previous archive ({e})")
+        return False
+
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    zinfo.create_system = info.create_system
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+
+    crc = 0
+    sha256_hash = hashlib.sha256()
+    try:
+        zipf.fp.seek(start)
+        zinfo.header_offset = start
+        zipf.fp.write(zinfo.FileHeader())
+        remaining = info.compress_size
+        while remaining:
+            chunk = source.read(min(EXPORT_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member {info.filename}")
+            zipf.fp.write(chunk)
+            remaining -= len(chunk)
+            data = inflater.decompress(chunk) if inflater is not None else chunk
+            crc = zlib.crc32(data, crc)
+            sha256_hash.update(data)
+        if inflater is not None:
+            data = inflater.flush()
+            crc = zlib.crc32(data, crc)
+            sha256_hash.update(data)
+        if crc != info.CRC or sha256_hash.hexdigest() != sha256:
+            raise zipfile.BadZipFile(f"CRC/SHA-256 mismatch in previous copy of {info.filename}")
+    except (OSError, zlib.error, zipfile.BadZipFile) as e:
+        logger.warning(f"Recompressing {info.filename}: {e}")
+        zipf.fp.seek(start)
+        zipf.fp.truncate()
+        return False
+
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf._didModify = True
+    return True
+
+
+def _open_previous(zip_path: Path) -> Optional[zipfile.ZipFile]:
+    """The archive being replaced, or None if it cannot be read (recompress everything)."""
+    try:
+        return zipfile.ZipFile(zip_path)
+    except (OSError, zipfile.BadZipFile):
+        return None
+
+
+def _build_archive(
+    week_number: int,
+    prefix: str,
+    files: List[Tuple[Path, str, os.stat_result]],
+    zip_path: Path,
+    previous: Dict[str, Dict[str, Any]],
+    deterministic: bool = False
+) -> Tuple[List[Dict[str, Any]], str, Dict[str, int]]:
+    """
+    Write the archive to a temp file and rename it over zip_path.
+
+    Returns:
+        (state entries, content hash, counts of reused/compressed members
+        and bytes read)
+    """
+    manifest = _new_manifest(week_number, deterministic)
+    entries: List[Dict[str, Any]] = []
+    counts = {"reused": 0, "compressed": 0, "bytes_read": 0}
+
+    tmp_path, tmp_file = _open_temp(zip_path)
+    previous_zip = _open_previous(zip_path) if previous else None
+    old_members = previous_zip.NameToInfo if previous_zip else {}
+    try:
+        with tmp_file, zipfile.ZipFile(tmp_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for file_path, rel_path, st in files:
+                arcname = f"{prefix}/{rel_path}"
+                entry = previous.get(rel_path)
+                info = old_members.get(arcname)
+                if (
+                    _unchanged(entry, st)
+                    and info is not None
+                    and _copy_member_raw(zipf, previous_zip.fp, info, entry["sha256"])
+                ):
+                    counts["reused"] += 1
+                    member = {"size_bytes": entry["size"], "sha256": entry["sha256"]}
+                else:
+                    member = _write_member(zipf, file_path, arcname, deterministic)
+                    counts["compressed"] += 1
+                    counts["bytes_read"] += member["size_bytes"]
+                manifest["files"].append({"path": rel_path, **member})
+                entries.append({
+                    "path": rel_path,
+                    "size": member["size_bytes"],
+                    "mtime_ns": st.st_mtime_ns,
+                    "sha256": member["sha256"]
+                })
+
+            _write_manifest(zipf, prefix, manifest, deterministic)
+        os.replace(tmp_path, zip_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        if previous_zip is not None:
+            previous_zip.close()
+
+    return entries, manifest["content_hash"], counts
+
+
+def _prepare_week(week_number: int) -> Path:
+    """
+    Bring the week's files up to date on disk and return its directory.
+
+    Refreshes the compiled Week_Spec/Role_Context files and, on packed
+    (SQLite) storage, writes the week out as files. Runs in the calling
+    process so pool workers never touch the storage backend.
+    """
+    week_path = week_dir(week_number)
+
+    if not path_exists(week_path):
+        raise FileNotFoundError(f"Week {week_number} does not exist at {week_path}")
+
+    # Generate compiled files before exporting
+    try:
+        save_compiled_week_spec(week_number)
+        save_compiled_role_context(week_number)
+    except Exception as e:
+        print(f"Warning: Could not generate compiled files: {e}")
+
+    # Packed (SQLite) storage: write the week out as files to zip them
+    materialize_week(week_number)
+    return week_path
+
+
+def _package_week(
+    week_number: int,
+    week_path: Path,
+    exports_dir: Path,
+    incremental: bool,
+    deterministic: bool = False
+) -> Dict[str, Any]:
+    """
+    Zip a prepared week directory into exports_dir (see export_week()).
+
+    Only takes plain values, so it can run in an export pool worker.
+    """
+    started = time.perf_counter()
+    exports_dir.mkdir(parents=True, exist_ok=True)
+    zip_path = exports_dir / archive_name(week_number)
+    files = _list_week_files(week_path)
+    state = _read_state(zip_path) if incremental else None
+    if state is not None and state.get("deterministic") != deterministic:
+        state = None  # Members were written with other timestamps: rebuild them all
+    previous = {entry["path"]: entry for entry in state["files"]} if state else {}
+
+    report = {
+        "week": week_number,
+        "zip_path": zip_path,
+        "deterministic": deterministic,
+        "files": len(files),
+        "source_bytes": sum(st.st_size for _, _, st in files)
+    }
+
+    if previous and len(previous) == len(files) and all(
+        _unchanged(previous.get(rel_path), st) for _, rel_path, st in files
+    ):
+        report.update(
+            status="unchanged", content_hash=state["content_hash"], reused=len(files), compressed=0, bytes_read=0
+        )
+    else:
+        entries, content_hash, counts = _build_archive(
+            week_number, week_path.name, files, zip_path, previous, deterministic
+        )
+        _save_state(week_number, zip_path, entries, content_hash, deterministic)
+        report.update(status="exported", content_hash=content_hash, **counts)
+
+    report["archive_bytes"] = zip_path.stat().st_size
+    report["duration_s"] = round(time.perf_counter() - started, 4)
+    return report
+
+
+def export_week(
+    week_number: int,
+    incremental: bool = True,
+    deterministic: Optional[bool] = None
+) -> Dict[str, Any]:
     """
     Export a complete week to a zip file with manifest.json in the exports directory.
 
@@ -68,78 +524,240 @@ def export_week_to_zip(week_number: int) -> Path:
     - All assets
     - manifest.json with SHA256 hashes for all files
 
+    Every file is read once; the manifest is built in memory and the week
+    directory is not modified by the packaging step.
+
     Args:
         week_number: The week number (1-35 for v1.0 Pilot)
+        incremental: Reuse hashes and compressed members of files unchanged
+                     since the last export (False rebuilds from scratch)
+        deterministic: Byte-reproducible archive: sorted members, fixed
+                       timestamps and modes, fixed DEFLATE level and no
+                       export_date (default: Settings.EXPORT_DETERMINISTIC)
 
     Returns:
-        Path to the created zip file.
+        Report with week, zip_path, deterministic, status ("exported" or
+        "unchanged"), content_hash, files, reused, compressed, bytes_read,
+        source_bytes, archive_bytes and duration_s
     """
-    week_path = week_dir(week_number)
+    week_path = _prepare_week(week_number)
+    return _package_week(
+        week_number, week_path, get_exports_dir(), incremental, _resolve_deterministic(deterministic)
+    )
 
-    if not week_path.exists():
-        raise FileNotFoundError(f"Week {week_number} does not exist at {week_path}")
 
-    # Create exports directory if it doesn't exist
+def export_week_to_zip(
+    week_number: int,
+    incremental: bool = True,
+    deterministic: Optional[bool] = None
+) -> Path:
+    """
+    Export a week and return the path of its zip file.
+
+    See export_week() for the archive layout and the incremental and
+    deterministic modes.
+    """
+    return export_week(week_number, incremental=incremental, deterministic=deterministic)["zip_path"]
+
+
+class _ChunkSink:
+    """Write-only, unseekable file object that collects ZIP output until drained."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write(self, data) -> int:
+        self.buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def stream_weeks_zip(weeks: Iterable[int], deterministic: Optional[bool] = None) -> Iterator[bytes]:
+    """
+    Yield a ZIP of the given weeks chunk by chunk, without a file on disk.
+
+    The archive has the same layout as the exported ones (WeekNN/... plus a
+    WeekNN/manifest.json per week). ZipFile writes into an unseekable sink,
+    so members use data descriptors and nothing is ever seeked back to; the
+    sink is drained after every compressed chunk, which keeps memory at
+    about one EXPORT_CHUNK_SIZE whatever the size of the selection. Weeks
+    are prepared lazily as the stream reaches them. In deterministic mode
+    the same content always streams the same bytes.
+
+    Args:
+        weeks: Week numbers to include (must exist)
+        deterministic: See export_week()
+
+    Yields:
+        Consecutive pieces of the ZIP file
+    """
+    deterministic = _resolve_deterministic(deterministic)
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for week_num in weeks:
+            week_path = _prepare_week(week_num)
+            prefix = week_path.name
+            manifest = _new_manifest(week_num, deterministic)
+            for file_path, rel_path, _ in _list_week_files(week_path):
+                steps = _member_steps(zipf, file_path, f"{prefix}/{rel_path}", deterministic)
+                try:
+                    while True:
+                        try:
+                            next(steps)
+                        except StopIteration as done:
+                            manifest["files"].append({"path": rel_path, **done.value})
+                            break
+                        if sink.buffer:
+                            yield sink.drain()
+                finally:
+                    steps.close()  # Client went away mid-member: close its writer first
+            _write_manifest(zipf, prefix, manifest, deterministic)
+            yield sink.drain()
+    tail = sink.drain()  # central directory
+    if tail:
+        yield tail
+
+
+def export_weeks(
+    weeks: Iterable[int],
+    jobs: int = 1,
+    incremental: bool = True,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    deterministic: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Export several weeks, packaging them on a process pool.
+
+    Weeks are prepared (compiled files, SQLite materialization) one by one in
+    this process; hashing and DEFLATE, the CPU-bound part, run in up to jobs
+    worker processes. Workers are spawned rather than forked so a threaded
+    caller (the API server) and open SQLite connections are never copied.
+    A failing week is reported and does not stop the others.
+
+    Args:
+        weeks: Week numbers to export
+        jobs: Worker processes (1 packages in this process, 0 = one per CPU)
+        incremental: See export_week()
+        on_result: Called with each week's report or {"week", "error"} as
+                   it finishes
+        deterministic: See export_week()
+
+    Returns:
+        Aggregated report: results (per-week reports by week), errors,
+        skipped (weeks that do not exist), exported/unchanged counts, byte
+        totals, duration_s and throughput_mb_s (source MB per wall second)
+    """
+    started = time.perf_counter()
+    jobs = jobs or os.cpu_count() or 1
+    deterministic = _resolve_deterministic(deterministic)
     exports_dir = get_exports_dir()
-    exports_dir.mkdir(parents=True, exist_ok=True)
+    results: List[Dict[str, Any]] = []
+    errors: List[Dict[str, Any]] = []
+    skipped: List[int] = []
 
-    # Generate compiled files before exporting
-    try:
-        save_compiled_week_spec(week_number)
-        save_compiled_role_context(week_number)
-    except Exception as e:
-        print(f"Warning: Could not generate compiled files: {e}")
+    def record(outcome: Dict[str, Any]) -> None:
+        (errors if "error" in outcome else results).append(outcome)
+        if on_result is not None:
+            on_result(outcome)
 
-    # Generate manifest with SHA256 hashes
-    manifest = _generate_manifest(week_number, week_path)
+    prepared: List[Tuple[int, Path]] = []
+    for week_num in weeks:
+        if not path_exists(week_dir(week_num)):
+            skipped.append(week_num)
+            continue
+        try:
+            prepared.append((week_num, _prepare_week(week_num)))
+        except Exception as e:
+            record({"week": week_num, "error": str(e)})
 
-    # Save manifest.json temporarily in week directory
-    manifest_path = week_path / "manifest.json"
-    with open(manifest_path, 'wb') as f:
-        f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    workers = min(jobs, len(prepared))
+    if workers <= 1:
+        for week_num, week_path in prepared:
+            try:
+                record(_package_week(week_num, week_path, exports_dir, incremental, deterministic))
+            except Exception as e:
+                record({"week": week_num, "error": str(e)})
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = {
+                pool.submit(_package_week, week_num, week_path, exports_dir, incremental, deterministic): week_num
+                for week_num, week_path in prepared
+            }
+            for future in as_completed(futures):
+                try:
+                    record(future.result())
+                except Exception as e:
+                    record({"week": futures[future], "error": str(e)})
 
-    # Create zip file
-    zip_filename = f"Week{week_number:02d}.zip"
-    zip_path = exports_dir / zip_filename
+    duration_s = time.perf_counter() - started
+    source_bytes = sum(r["source_bytes"] for r in results)
+    return {
+        "jobs": max(workers, 1),
+        "results": sorted(results, key=lambda r: r["week"]),
+        "errors": sorted(errors, key=lambda e: e["week"]),
+        "skipped": skipped,
+        "exported": sum(1 for r in results if r["status"] == "exported"),
+        "unchanged": sum(1 for r in results if r["status"] == "unchanged"),
+        "source_bytes": source_bytes,
+        "bytes_read": sum(r["bytes_read"] for r in results),
+        "archive_bytes": sum(r["archive_bytes"] for r in results),
+        "duration_s": round(duration_s, 4),
+        "throughput_mb_s": round(source_bytes / (1024 * 1024) / duration_s, 2) if duration_s > 0 else 0.0
+    }
 
-    try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add all files from the week directory
-            for file_path in week_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate relative path for archive
-                    arcname = file_path.relative_to(week_path.parent)
-                    zipf.write(file_path, arcname)
-    finally:
-        # Clean up temporary manifest
-        if manifest_path.exists():
-            manifest_path.unlink()
 
-    return zip_path
+def format_export_result(outcome: Dict[str, Any]) -> str:
+    """One progress line for an export_weeks() per-week result or error."""
+    week_num = outcome["week"]
+    if "error" in outcome:
+        return f"✗ Failed to export Week {week_num}: {outcome['error']}"
+    if outcome["status"] == "unchanged":
+        return f"✓ Week {week_num} unchanged ({outcome['zip_path'].name})"
+    return (
+        f"✓ Exported Week {week_num} to {outcome['zip_path'].name} "
+        f"({outcome['compressed']} compressed, {outcome['reused']} reused, {outcome['duration_s']:.2f}s)"
+    )
 
 
-def export_all_weeks(num_weeks: int = 35) -> list[Path]:
+def export_all_weeks(
+    num_weeks: int = 35,
+    jobs: int = 1,
+    incremental: bool = True,
+    deterministic: Optional[bool] = None
+) -> list[Path]:
     """
     Export all weeks to individual zip files (v1.0 Pilot: 35 weeks).
 
     Args:
         num_weeks: Number of weeks to export (default: 35 for v1.0 Pilot)
+        jobs: Worker processes for packaging (see export_weeks())
+        incremental: See export_week()
+        deterministic: See export_week()
 
     Returns:
         List of paths to created zip files.
     """
-    zip_paths = []
-
-    for week_num in range(1, num_weeks + 1):
-        week_path = week_dir(week_num)
-        if week_path.exists():
-            try:
-                zip_path = export_week_to_zip(week_num)
-                zip_paths.append(zip_path)
-                print(f"✓ Exported Week {week_num} to {zip_path.name}")
-            except Exception as e:
-                print(f"✗ Failed to export Week {week_num}: {e}")
-        else:
-            print(f"⊘ Skipped Week {week_num} (does not exist)")
+    report = export_weeks(
+        range(1, num_weeks + 1),
+        jobs=jobs,
+        incremental=incremental,
+        on_result=lambda outcome: print(format_export_result(outcome)),
+        deterministic=deterministic
+    )
+    for week_num in report["skipped"]:
+        print(f"⊘ Skipped Week {week_num} (does not exist)")
+    print(
+        f"Exported {report['exported']} week(s), {report['unchanged']} unchanged, "
+        f"{len(report['errors'])} failed in {report['duration_s']:.2f}s "
+        f"({report['throughput_mb_s']:.2f} MB/s, {report['jobs']} job(s))"
+    )
 
-    return zip_paths
+    return [result["zip_path"] for result in report["results"]]
@@ -4,6 +4,9 @@ from typing import Dict, Any, List, Optional
 import orjson
 import time
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .storage import (
     day_dir,
@@ -17,9 +20,15 @@ from .storage import (
     DAY_FIELDS,
     write_file,
     write_json,
-    read_json
+    read_json,
+    read_file,
+    path_exists,
+    atomic_batch
 )
 from .llm_client import LLMClient
+from .instrumented_client import InstrumentedClient
+from .metrics import INVALID_RESPONSES
+from .progress_bus import publish_progress
 from .prompts.kit_tasks import (
     task_day_fields,
     task_day_document,
@@ -38,6 +47,9 @@ logger = logging.getLogger(__name__)
 # Retry configuration
 MAX_RETRIES = settings.max_retries  # Default: 10 retries
 
+# hydrate_week_days runs days on threads; only one may hold the terminal at a time
+_PROMPT_LOCK = threading.Lock()
+
 
 def _strip_markdown_fences(text: str) -> str:
     """
@@ -178,6 +190,7 @@ def _save_invalid_response(week: int, day: int, field: str, attempt: int, conten
     invalid_path = invalid_dir / filename
 
     write_file(invalid_path, content)
+    INVALID_RESPONSES.inc(field=field)
     logger.error(f"Saved invalid response to {invalid_path}")
     return invalid_path
 
@@ -186,17 +199,28 @@ def _prompt_user_to_continue(week: int, day: int, field: str) -> bool:
     """
     Prompt user for confirmation after MAX_RETRIES failures.
 
+    Days generated concurrently take turns: each prompt is printed and
+    answered as a whole before the next one starts. Without a terminal to
+    answer on (e.g. an API generation job) the answer is "no".
+
     Returns True to continue, False to abort.
     """
-    print(f"\n{'='*80}")
-    print(f"⚠️  GENERATION FAILED: Week {week} Day {day} - {field}")
-    print(f"{'='*80}")
-    print(f"After {MAX_RETRIES} attempts, the LLM failed to generate valid content.")
-    print(f"Logs saved to: {settings.logs_path / f'Week{week:02d}_Day{day}_retries.log'}")
-    print()
-
-    response = input("Continue with next generation? (y/n): ").strip().lower()
-    return response == 'y'
+    with _PROMPT_LOCK:
+        print(f"\n{'='*80}")
+        print(f"⚠️  GENERATION FAILED: Week {week} Day {day} - {field}")
+        print(f"{'='*80}")
+        print(f"After {MAX_RETRIES} attempts, the LLM failed to generate valid content.")
+        print(f"Logs saved to: {settings.logs_path / f'Week{week:02d}_Day{day}_retries.log'}")
+        print()
+
+        if not sys.stdin.isatty():
+            print("No terminal to answer on - aborting.")
+            return False
+        try:
+            response = input("Continue with next generation? (y/n): ").strip().lower()
+        except EOFError:
+            return False
+        return response == 'y'
 
 
 def _validate_class_name_subject(class_name: str) -> bool:
@@ -288,47 +312,8 @@ def _validate_summary_subject(summary_content: str, week_spec: Dict[str, Any]) -
 # LLM-BASED GENERATION FUNCTIONS WITH RETRY LOGIC
 # ============================================================================
 
-def generate_day_fields(week: int, day: int, client: LLMClient) -> List[Path]:
-    """
-    Generate the seven Flint field files for a day using LLM.
-
-    Phase 2 of generation: Reads week_spec.json from internal_documents/
-    to generate day-specific field content.
-
-    Args:
-        week: Week number (1-36)
-        day: Day number (1-4)
-        client: LLM client instance
-
-    Returns:
-        List of paths to generated field files
-
-    Raises:
-        FileNotFoundError: If internal_documents/week_spec.json is missing
-    """
-    # Ensure day directory exists
-    scaffold_day(week, day)
-
-    # Load week spec from internal_documents/ (Phase 1 output)
-    week_spec_path = internal_doc_path(week, "week_spec.json")
-
-    if not week_spec_path.exists():
-        # Fallback to legacy Week_Spec for backward compatibility
-        legacy_spec_path = week_spec_part_path(week, "99_compiled_week_spec.json")
-        if legacy_spec_path.exists():
-            logger.warning(
-                f"Using legacy Week_Spec for Week {week}. "
-                f"Consider running generate_week_planning() to create internal_documents/."
-            )
-            week_spec = orjson.loads(legacy_spec_path.read_bytes())
-        else:
-            raise FileNotFoundError(
-                f"Week spec not found at {week_spec_path}. "
-                f"Run generate_week_planning() first (Phase 1)."
-            )
-    else:
-        week_spec = read_json(week_spec_path)
-
+def _generate_fields_data(week: int, day: int, week_spec: Dict[str, Any], client: LLMClient) -> Dict[str, Any]:
+    """Generate day fields (class_name, grade_level) with class_name validation retries."""
     # Get prompts
     sys, usr, _ = task_day_fields(week_spec, day)
 
@@ -379,34 +364,51 @@ def generate_day_fields(week: int, day: int, client: LLMClient) -> List[Path]:
                 fields_data["class_name"] = f"Week {week} Day {day}: Latin Foundations"
                 break
 
-    # Generate role_context separately (field 04)
+    return fields_data
+
+
+def _generate_role_context_data(week_spec: Dict[str, Any], day: int, client: LLMClient) -> Dict[str, Any]:
+    """Generate role_context (field 04)."""
     sys_rc, usr_rc, schema_rc = task_day_role_context(week_spec, day)
     response_rc = client.generate(prompt=usr_rc, system=sys_rc, json_schema=schema_rc)
 
     if response_rc.json:
-        role_context_data = response_rc.json
-    else:
-        try:
-            cleaned_text = _strip_markdown_fences(response_rc.text)
-            role_context_data = orjson.loads(cleaned_text)
-        except Exception:
-            # Fallback minimal role_context
-            role_context_data = {
-                "sparky_role": "encouraging guide",
-                "focus_mode": f"day_{day}_focus",
-                "hints_enabled": True,
-                "spiral_emphasis": [],
-                "encouragement_triggers": ["first_attempt"]
-            }
-
-    # Generate guidelines (field 05) - needs role_context
+        return response_rc.json
+
+    try:
+        cleaned_text = _strip_markdown_fences(response_rc.text)
+        return orjson.loads(cleaned_text)
+    except Exception:
+        # Fallback minimal role_context
+        return {
+            "sparky_role": "encouraging guide",
+            "focus_mode": f"day_{day}_focus",
+            "hints_enabled": True,
+            "spiral_emphasis": [],
+            "encouragement_triggers": ["first_attempt"]
+        }
+
+
+def _generate_guidelines(
+    week_spec: Dict[str, Any],
+    day: int,
+    role_context_data: Dict[str, Any],
+    client: LLMClient
+) -> str:
+    """Generate guidelines (field 05) - needs role_context."""
     sys_guide, usr_guide, _ = task_day_guidelines(week_spec, day, role_context_data)
     response_guide = client.generate(prompt=usr_guide, system=sys_guide)
-    guidelines_content = response_guide.text
+    return response_guide.text
 
-    # Generate summary (field 02) - using dedicated task_day_summary function with retry
-    class_name = fields_data.get("class_name", f"Week {week} Day {day}")
 
+def _generate_summary(
+    week: int,
+    day: int,
+    class_name: str,
+    week_spec: Dict[str, Any],
+    client: LLMClient
+) -> str:
+    """Generate summary (field 02) with subject validation retries."""
     # Load the day_summary prompt spec to get the schema
     from .prompts.kit_tasks import _load_prompt_json
     summary_prompt_spec = _load_prompt_json("day/day_summary.json")
@@ -455,17 +457,102 @@ def generate_day_fields(week: int, day: int, client: LLMClient) -> List[Path]:
                 # Use the last generated content even if invalid
                 break
 
-    # Generate greeting (field 07) - needs role_context and will need document later
-    # For now generate without document (will be regenerated if needed)
+    return summary_content
+
+
+def _generate_greeting(
+    week_spec: Dict[str, Any],
+    day: int,
+    role_context_data: Dict[str, Any],
+    client: LLMClient
+) -> str:
+    """Generate greeting (field 07) - needs role_context."""
+    # Generated without the document (will be regenerated if needed)
     sys_greet, usr_greet, schema_greet = task_day_greeting(week_spec, day, role_context_data, None)
     response_greet = client.generate(prompt=usr_greet, system=sys_greet, json_schema=schema_greet)
 
     # Extract greeting_text from JSON response
     if response_greet.json:
-        greeting_content = response_greet.json.get("greeting_text", "")
+        return response_greet.json.get("greeting_text", "")
+    # Fallback to plain text if JSON parsing fails
+    return response_greet.text
+
+
+def generate_day_fields(week: int, day: int, client: LLMClient) -> List[Path]:
+    """
+    Generate the seven Flint field files for a day using LLM.
+
+    Phase 2 of generation: Reads week_spec.json from internal_documents/
+    to generate day-specific field content.
+
+    Args:
+        week: Week number (1-36)
+        day: Day number (1-4)
+        client: LLM client instance
+
+    Returns:
+        List of paths to generated field files
+
+    Raises:
+        FileNotFoundError: If internal_documents/week_spec.json is missing
+    """
+    # Ensure day directory exists
+    scaffold_day(week, day)
+
+    # Load week spec from internal_documents/ (Phase 1 output)
+    week_spec_path = internal_doc_path(week, "week_spec.json")
+
+    if not path_exists(week_spec_path):
+        # Fallback to legacy Week_Spec for backward compatibility
+        legacy_spec_path = week_spec_part_path(week, "99_compiled_week_spec.json")
+        if path_exists(legacy_spec_path):
+            logger.warning(
+                f"Using legacy Week_Spec for Week {week}. "
+                f"Consider running generate_week_planning() to create internal_documents/."
+            )
+            week_spec = read_json(legacy_spec_path)
+        else:
+            raise FileNotFoundError(
+                f"Week spec not found at {week_spec_path}. "
+                f"Run generate_week_planning() first (Phase 1)."
+            )
     else:
-        # Fallback to plain text if JSON parsing fails
-        greeting_content = response_greet.text
+        week_spec = read_json(week_spec_path)
+
+    # Two independent chains run concurrently, each with its own retry loop:
+    #   day fields (class_name) -> summary (needs class_name)
+    #   role_context -> guidelines + greeting (both need role_context)
+    # Nothing is written until every call has finished.
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix=f"w{week:02d}d{day}-field") as pool:
+        def tracked(field: str, task: str) -> LLMClient:
+            return InstrumentedClient(client, week, day, "day_fields", field, task)
+
+        fields_future = pool.submit(
+            _generate_fields_data, week, day, week_spec, tracked("class_name", "task_day_fields")
+        )
+        role_context_future = pool.submit(
+            _generate_role_context_data, week_spec, day, tracked("role_context", "task_day_role_context")
+        )
+
+        role_context_data = role_context_future.result()
+        guidelines_future = pool.submit(
+            _generate_guidelines, week_spec, day, role_context_data,
+            tracked("guidelines_for_sparky", "task_day_guidelines")
+        )
+        greeting_future = pool.submit(
+            _generate_greeting, week_spec, day, role_context_data,
+            tracked("sparkys_greeting", "task_day_greeting")
+        )
+
+        fields_data = fields_future.result()
+        class_name = fields_data.get("class_name", f"Week {week} Day {day}")
+        summary_future = pool.submit(
+            _generate_summary, week, day, class_name, week_spec, tracked("summary", "task_day_summary")
+        )
+
+        guidelines_content = guidelines_future.result()
+        greeting_content = greeting_future.result()
+        summary_content = summary_future.result()
 
     # Write field files (fields 01-03, 05, 07)
     field_mapping = {
@@ -477,15 +564,16 @@ def generate_day_fields(week: int, day: int, client: LLMClient) -> List[Path]:
     }
 
     created_paths = []
-    for field_name, content in field_mapping.items():
-        field_path = day_field_path(week, day, field_name)
-        write_file(field_path, str(content))
-        created_paths.append(field_path)
+    with atomic_batch():
+        for field_name, content in field_mapping.items():
+            field_path = day_field_path(week, day, field_name)
+            write_file(field_path, str(content))
+            created_paths.append(field_path)
 
-    # Write role_context JSON (field 04)
-    rc_path = day_field_path(week, day, "04_role_context.json")
-    write_json(rc_path, role_context_data)
-    created_paths.append(rc_path)
+        # Write role_context JSON (field 04)
+        rc_path = day_field_path(week, day, "04_role_context.json")
+        write_json(rc_path, role_context_data)
+        created_paths.append(rc_path)
 
     return created_paths
 
@@ -519,13 +607,13 @@ def generate_day_document(week: int, day: int, client: LLMClient) -> Path:
     role_context_path = internal_doc_path(week, "role_context.json")
     research_path = internal_doc_path(week, "phase0_research.json")
 
-    if not week_spec_path.exists():
+    if not path_exists(week_spec_path):
         raise FileNotFoundError(
             f"Week spec not found at {week_spec_path}. "
             f"Run generate_week_planning() first (Phase 1)."
         )
 
-    if not role_context_path.exists():
+    if not path_exists(role_context_path):
         logger.warning(f"Role context not found at {role_context_path}. Using fallback.")
         week_role_context = {}
     else:
@@ -533,7 +621,7 @@ def generate_day_document(week: int, day: int, client: LLMClient) -> Path:
 
     # Load PHASE 0 research if available
     research_plan = None
-    if research_path.exists():
+    if path_exists(research_path):
         research_plan = read_json(research_path)
         logger.info(f"Loaded PHASE 0 research for Week {week}")
     else:
@@ -544,6 +632,8 @@ def generate_day_document(week: int, day: int, client: LLMClient) -> Path:
     # Get prompts - task_day_document now receives internal_documents data + research
     sys, usr, schema = task_day_document(week_spec, day, research_plan)
 
+    client = InstrumentedClient(client, week, day, "document", "document_for_sparky", "task_day_document")
+
     # Retry loop
     for attempt in range(1, MAX_RETRIES + 1):
         try:
@@ -582,9 +672,8 @@ def generate_day_document(week: int, day: int, client: LLMClient) -> Path:
                         raise ValueError(f"Generation aborted by user after {MAX_RETRIES} attempts")
                     break
 
-            # Create 06_document_for_sparky/ directory and write 6 separate .txt files
+            # Write 6 separate .txt files under 06_document_for_sparky/ (the backend creates parents)
             doc_dir = document_for_sparky_dir(week, day)
-            doc_dir.mkdir(parents=True, exist_ok=True)
 
             # Map expected keys from LLM response to file names
             key_to_file_map = {
@@ -597,13 +686,14 @@ def generate_day_document(week: int, day: int, client: LLMClient) -> Path:
             }
 
             # Write each document to its own .txt file
-            for key, filename in key_to_file_map.items():
-                content = doc_data.get(key, "")
-                if content:
-                    file_path = document_for_sparky_file_path(week, day, filename)
-                    write_file(file_path, str(content))
-                else:
-                    logger.warning(f"Missing or empty content for {key}")
+            with atomic_batch():
+                for key, filename in key_to_file_map.items():
+                    content = doc_data.get(key, "")
+                    if content:
+                        file_path = document_for_sparky_file_path(week, day, filename)
+                        write_file(file_path, str(content))
+                    else:
+                        logger.warning(f"Missing or empty content for {key}")
 
             if attempt > 1:
                 logger.info(f"Week {week} Day {day} document generated successfully on attempt {attempt}")
@@ -622,10 +712,8 @@ def generate_day_document(week: int, day: int, client: LLMClient) -> Path:
             else:
                 if not _prompt_user_to_continue(week, day, "document_for_sparky"):
                     raise ValueError(f"Generation aborted by user after {MAX_RETRIES} attempts")
-                # User chose to continue - create empty directory
-                doc_dir = document_for_sparky_dir(week, day)
-                doc_dir.mkdir(parents=True, exist_ok=True)
-                return doc_dir
+                # User chose to continue - nothing is written for this day
+                return document_for_sparky_dir(week, day)
 
         except Exception as e:
             error_msg = f"Unexpected error: {e}"
@@ -637,15 +725,11 @@ def generate_day_document(week: int, day: int, client: LLMClient) -> Path:
             else:
                 if not _prompt_user_to_continue(week, day, "document_for_sparky"):
                     raise ValueError(f"Generation aborted by user after {MAX_RETRIES} attempts")
-                # User chose to continue - create empty directory
-                doc_dir = document_for_sparky_dir(week, day)
-                doc_dir.mkdir(parents=True, exist_ok=True)
-                return doc_dir
+                # User chose to continue - nothing is written for this day
+                return document_for_sparky_dir(week, day)
 
     # Fallback if loop completes without return
-    doc_dir = document_for_sparky_dir(week, day)
-    doc_dir.mkdir(parents=True, exist_ok=True)
-    return doc_dir
+    return document_for_sparky_dir(week, day)
 
 
 def generate_day4_assessment(week: int, client: LLMClient) -> Dict[str, Path]:
@@ -674,15 +758,15 @@ def generate_day4_assessment(week: int, client: LLMClient) -> Dict[str, Path]:
     # Load week spec from internal_documents/ (Phase 1 output)
     week_spec_path = internal_doc_path(week, "week_spec.json")
 
-    if not week_spec_path.exists():
+    if not path_exists(week_spec_path):
         # Fallback to legacy Week_Spec for backward compatibility
         legacy_spec_path = week_spec_part_path(week, "99_compiled_week_spec.json")
-        if legacy_spec_path.exists():
+        if path_exists(legacy_spec_path):
             logger.warning(
                 f"Using legacy Week_Spec for Week {week} assessment. "
                 f"Consider running generate_week_planning() to create internal_documents/."
             )
-            week_spec = orjson.loads(legacy_spec_path.read_bytes())
+            week_spec = read_json(legacy_spec_path)
         else:
             raise ValueError(f"Week spec not found for Week {week}. Generate week planning first (Phase 1).")
     else:
@@ -690,22 +774,22 @@ def generate_day4_assessment(week: int, client: LLMClient) -> Dict[str, Path]:
 
     # Load Day 4 document directory (now 6 separate .txt files)
     day4_doc_dir = document_for_sparky_dir(week, 4)
-    if not day4_doc_dir.exists():
+    if not path_exists(day4_doc_dir):
         raise ValueError(f"Day 4 document directory not found for Week {week}. Generate Day 4 first.")
 
     # Read all 6 document files into a dictionary
     day4_document = {}
     for doc_file in DOCUMENT_FOR_SPARKY_FILES:
         doc_path = document_for_sparky_file_path(week, 4, doc_file)
-        if doc_path.exists():
+        if path_exists(doc_path):
             key = doc_file.replace(".txt", "")
-            day4_document[key] = doc_path.read_text(encoding="utf-8")
+            day4_document[key] = read_file(doc_path)
         else:
             logger.warning(f"Missing Day 4 document file: {doc_file}")
 
     # Load Day 4 guidelines (optional)
     guidelines_path = day_field_path(week, 4, "05_guidelines_for_sparky.md")
-    guidelines = guidelines_path.read_text(encoding="utf-8") if guidelines_path.exists() else None
+    guidelines = read_file(guidelines_path) if path_exists(guidelines_path) else None
 
     # Generate quiz packet
     logger.info("Generating quiz packet...")
@@ -716,7 +800,9 @@ def generate_day4_assessment(week: int, client: LLMClient) -> Dict[str, Path]:
         guidelines=guidelines
     )
 
-    response_quiz = client.generate(prompt=usr_quiz, system=sys_quiz)
+    response_quiz = InstrumentedClient(client, week, 4, "assessment", "quiz_packet", "task_quiz_packet").generate(
+        prompt=usr_quiz, system=sys_quiz
+    )
 
     # Parse quiz response (expects Markdown quiz + JSON answer key at end)
     if response_quiz.json:
@@ -784,7 +870,9 @@ def generate_day4_assessment(week: int, client: LLMClient) -> Dict[str, Path]:
         week_spec=week_spec
     )
 
-    response_key = client.generate(prompt=usr_key, system=sys_key)
+    response_key = InstrumentedClient(client, week, 4, "assessment", "teacher_key", "task_teacher_key").generate(
+        prompt=usr_key, system=sys_key
+    )
     teacher_key_markdown = response_key.text
 
     if not teacher_key_markdown or len(teacher_key_markdown) < 100:
@@ -802,7 +890,12 @@ def generate_day4_assessment(week: int, client: LLMClient) -> Dict[str, Path]:
     }
 
 
-def hydrate_day_from_llm(week: int, day: int, client: LLMClient) -> Dict[str, Any]:
+def hydrate_day_from_llm(
+    week: int,
+    day: int,
+    client: LLMClient,
+    include_assessment: bool = True
+) -> Dict[str, Any]:
     """
     Generate all day content (fields + document) using LLM.
 
@@ -812,12 +905,20 @@ def hydrate_day_from_llm(week: int, day: int, client: LLMClient) -> Dict[str, An
         week: Week number (1-36)
         day: Day number (1-4)
         client: LLM client instance
+        include_assessment: Generate the Day 4 assessment after the day itself
 
     Returns:
         Dictionary with paths and status
     """
-    field_paths = generate_day_fields(week, day, client)
-    doc_path = generate_day_document(week, day, client)
+    # Fields and documents are committed together: a failure leaves the day untouched
+    try:
+        with atomic_batch():
+            field_paths = generate_day_fields(week, day, client)
+            doc_path = generate_day_document(week, day, client)
+    except Exception as e:
+        publish_progress(week, day=day, phase="day", status="error", message=str(e))
+        raise
+    publish_progress(week, day=day, phase="day", status="completed", message=f"Day {day} generated")
 
     result = {
         "week": week,
@@ -828,17 +929,59 @@ def hydrate_day_from_llm(week: int, day: int, client: LLMClient) -> Dict[str, An
     }
 
     # Day 4: Generate assessment materials
-    if day == 4:
+    if day == 4 and include_assessment:
+        _attach_day4_assessment(week, client, result)
+
+    return result
+
+
+def _attach_day4_assessment(week: int, client: LLMClient, result: Dict[str, Any]) -> None:
+    """Generate the Day 4 assessment and record its paths (or error) on result."""
+    try:
+        assessment_paths = generate_day4_assessment(week, client)
+        result["assessment_paths"] = {
+            "quiz_packet": str(assessment_paths["quiz_packet"]),
+            "teacher_key": str(assessment_paths["teacher_key"])
+        }
+        logger.info(f"Day 4 assessment generation completed for Week {week}")
+    except Exception as e:
+        logger.error(f"Day 4 assessment generation failed: {e}")
+        # Don't fail entire day generation, but log the error
+        result["assessment_error"] = str(e)
+
+
+def hydrate_week_days(
+    week: int,
+    client: LLMClient,
+    max_workers: int = 4
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Generate Days 1-4 of a week concurrently, then the Day 4 assessment.
+
+    Each day only reads the Phase 1 internal_documents/, so the four days run
+    on a worker pool; the assessment waits for Day 4's documents. A failing
+    day does not affect the others: its result has status "error" and the
+    exception message under "error".
+
+    Args:
+        week: Week number (1-35)
+        client: LLM client instance (shared by all workers)
+        max_workers: Maximum days generated at once
+
+    Returns:
+        Dict of day number -> hydrate_day_from_llm() result
+    """
+    def run_day(day: int) -> Dict[str, Any]:
         try:
-            assessment_paths = generate_day4_assessment(week, client)
-            result["assessment_paths"] = {
-                "quiz_packet": str(assessment_paths["quiz_packet"]),
-                "teacher_key": str(assessment_paths["teacher_key"])
-            }
-            logger.info(f"Day 4 assessment generation completed for Week {week}")
+            return hydrate_day_from_llm(week, day, client, include_assessment=False)
         except Exception as e:
-            logger.error(f"Day 4 assessment generation failed: {e}")
-            # Don't fail entire day generation, but log the error
-            result["assessment_error"] = str(e)
+            logger.error(f"Week {week} Day {day} generation failed: {e}")
+            return {"week": week, "day": day, "status": "error", "error": str(e)}
 
-    return result
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=f"week{week:02d}-day") as pool:
+        results = dict(zip(range(1, 5), pool.map(run_day, range(1, 5))))
+
+    if results[4]["status"] == "success":
+        _attach_day4_assessment(week, client, results[4])
+
+    return results
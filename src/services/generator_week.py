@@ -26,13 +26,16 @@ from .storage import (
     INTERNAL_DOCUMENTS,
     write_file,
     write_json,
-    read_json
+    read_json,
+    path_exists
 )
 from .generator_day import scaffold_day
 from .llm_client import LLMClient
+from .instrumented_client import InstrumentedClient
+from .progress_bus import publish_progress
 from .prompts.kit_tasks import task_week_spec, task_role_context
-from .usage_tracker import get_tracker
 from .prompts.phase0_research import execute_phase0_research
+from .knowledge_ledger import get_knowledge_ledger
 
 logger = logging.getLogger(__name__)
 
@@ -157,20 +160,11 @@ def generate_week_spec_from_outline(week: int, client: LLMClient, research_plan:
     # Retry loop (up to 5 attempts)
     MAX_RETRIES = 5
     spec_data = None
+    client = InstrumentedClient(client, week, 0, "planning", "week_spec", "task_week_spec")
 
     for attempt in range(1, MAX_RETRIES + 1):
         response = client.generate(prompt=usr, system=sys, json_schema=None)
 
-        # Track usage
-        if response.provider and response.tokens_prompt:
-            get_tracker().track(
-                provider=response.provider,
-                model=response.model or "unknown",
-                tokens_prompt=response.tokens_prompt or 0,
-                tokens_completion=response.tokens_completion or 0,
-                operation=f"week_{week}_spec_attempt{attempt}"
-            )
-
         # Parse response
         try:
             if response.json:
@@ -207,6 +201,9 @@ def generate_week_spec_from_outline(week: int, client: LLMClient, research_plan:
     write_json(spec_path, spec_data)
     logger.info(f"Week {week} spec saved to {spec_path}")
 
+    # Record this week's vocabulary/grammar delta for later backward analyses
+    get_knowledge_ledger().record_week_spec(week, spec_data)
+
     return spec_path
 
 
@@ -231,7 +228,7 @@ def generate_week_summary(week: int, client: LLMClient, research_plan: Dict[str,
 
     # Load week_spec
     week_spec_path = internal_doc_path(week, "week_spec.json")
-    if not week_spec_path.exists():
+    if not path_exists(week_spec_path):
         raise FileNotFoundError(f"Week spec not found. Run generate_week_spec_from_outline({week}) first.")
 
     week_spec = read_json(week_spec_path)
@@ -263,6 +260,7 @@ Explain the pedagogical reasoning behind vocabulary selection, grammar sequencin
         usr += research_context
 
     # Generate summary
+    client = InstrumentedClient(client, week, 0, "planning", "week_summary", "task_week_summary")
     response = client.generate(prompt=usr, system=sys)
 
     # Extract markdown content from response
@@ -297,7 +295,7 @@ def generate_week_role_context(week: int, client: LLMClient, research_plan: Dict
     """
     # Load week_spec
     week_spec_path = internal_doc_path(week, "week_spec.json")
-    if not week_spec_path.exists():
+    if not path_exists(week_spec_path):
         raise FileNotFoundError(f"Week spec not found. Run generate_week_spec_from_outline({week}) first.")
 
     week_spec = read_json(week_spec_path)
@@ -306,6 +304,7 @@ def generate_week_role_context(week: int, client: LLMClient, research_plan: Dict
     sys, usr, _ = task_role_context(week_spec, research_plan)
 
     # Generate
+    client = InstrumentedClient(client, week, 0, "planning", "role_context", "task_role_context")
     response = client.generate(prompt=usr, system=sys)
 
     # Parse
@@ -415,9 +414,7 @@ def generate_week_planning(week: int, client: LLMClient) -> Dict[str, Path]:
     logger.info(f"=== PHASE 0: Research & Planning for Week {week} ===")
 
     # PHASE 0: Execute 12-step research cascade
-    # Pass the raw OpenAI client (client.client for OpenAIClient wrapper)
-    openai_client = getattr(client, 'client', client)
-    research_plan = execute_phase0_research(week, openai_client)
+    research_plan = execute_phase0_research(week, client)
 
     # Save PHASE 0 research to internal_documents/
     research_path = internal_doc_path(week, "phase0_research.json")
@@ -443,6 +440,7 @@ def generate_week_planning(week: int, client: LLMClient) -> Dict[str, Path]:
     log_path = save_generation_log(week, model_info=None, research_plan=research_plan)
 
     logger.info(f"=== Phase 1 complete: Week {week} planning done ===")
+    publish_progress(week, phase="planning", status="completed", message="Week planning done")
 
     return {
         "phase0_research": research_path,
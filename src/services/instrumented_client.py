@@ -0,0 +1,128 @@
+"""LLMClient wrapper that attributes every call to the step that made it.
+
+The generators wrap the client they hand to each step (a day field, the day
+document, a Phase 0 research task, ...) in an InstrumentedClient. Each
+generate() call then:
+
+- publishes progress events (generating/generated/error) with the attempt
+  number and token count on the progress bus;
+- records usage with its week, day, phase, prompt task, attempt number,
+  cache hit and wall-clock latency, which /api/v1/usage/breakdown and the
+  usage_report CLI aggregate;
+- updates the LLM latency, request, retry and token metrics.
+
+The attempt counter is per wrapper, so the generators' retry loops are
+attributed without any changes to them.
+"""
+import time
+from typing import Optional
+
+from .metrics import LLM_REQUEST_SECONDS, LLM_REQUESTS, LLM_RETRIES, LLM_TOKENS
+from .progress_bus import get_progress_bus
+from .usage_tracker import get_tracker
+
+
+class InstrumentedClient:
+    """Delegating LLMClient that reports progress and attributed usage per call."""
+
+    def __init__(
+        self,
+        client,
+        week: int,
+        day: int,
+        phase: str,
+        field: Optional[str] = None,
+        task: Optional[str] = None
+    ):
+        """
+        Initialize wrapper.
+
+        Args:
+            client: LLMClient to delegate to
+            week: Week number
+            day: Day number (0 for week-level work)
+            phase: Pipeline phase (phase0, planning, day_fields, document, assessment)
+            field: Field or task name shown in progress events
+            task: Prompt task for usage attribution (e.g. "task_day_document");
+                  defaults to field
+        """
+        self.client = client
+        self.week = week
+        self.day = day
+        self.phase = phase
+        self.field = field
+        self.task = task or field
+        self.attempt = 0
+
+    def _publish(self, status: str, tokens: int = 0, message: str = "") -> None:
+        get_progress_bus().publish(
+            week=self.week, day=self.day, phase=self.phase, field=self.field,
+            status=status, attempt=self.attempt, tokens=tokens, message=message
+        )
+
+    def _record(self, response, latency_s: float) -> None:
+        if response.provider is None or response.provider == "dry-run":
+            return
+        get_tracker().track(
+            provider=response.provider,
+            model=response.model or "unknown",
+            tokens_prompt=response.tokens_prompt or 0,
+            tokens_completion=response.tokens_completion or 0,
+            operation=self.task or self.phase,
+            week=self.week,
+            day=self.day,
+            phase=self.phase,
+            task=self.task,
+            attempt=self.attempt,
+            cache_hit=response.cached,
+            latency_s=latency_s
+        )
+
+    def _observe(self, response, latency_s: float) -> None:
+        model = response.model or "unknown"
+        LLM_REQUEST_SECONDS.observe(latency_s, model=model, task=self.task, cache_hit=response.cached)
+        LLM_REQUESTS.inc(model=model, task=self.task, status="ok")
+        if not response.cached:
+            LLM_TOKENS.inc(response.tokens_prompt or 0, model=model, kind="prompt")
+            LLM_TOKENS.inc(response.tokens_completion or 0, model=model, kind="completion")
+
+    def _start(self) -> float:
+        self.attempt += 1
+        if self.attempt > 1:
+            LLM_RETRIES.inc(task=self.task)
+        self._publish("generating")
+        return time.perf_counter()
+
+    def _finish(self, response, started: float):
+        latency_s = time.perf_counter() - started
+        self._observe(response, latency_s)
+        self._record(response, latency_s)
+        tokens = (response.tokens_prompt or 0) + (response.tokens_completion or 0)
+        self._publish("generated", tokens=tokens)
+        return response
+
+    def _fail(self, error: Exception, model: Optional[str]) -> None:
+        model = model or getattr(self.client, "model", None) or "unknown"
+        LLM_REQUESTS.inc(model=model, task=self.task, status="error")
+        self._publish("error", message=str(error))
+
+    def generate(self, *args, **kwargs):
+        started = self._start()
+        try:
+            response = self.client.generate(*args, **kwargs)
+        except Exception as e:
+            self._fail(e, kwargs.get("model"))
+            raise
+        return self._finish(response, started)
+
+    async def agenerate(self, *args, **kwargs):
+        started = self._start()
+        try:
+            response = await self.client.agenerate(*args, **kwargs)
+        except Exception as e:
+            self._fail(e, kwargs.get("model"))
+            raise
+        return self._finish(response, started)
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
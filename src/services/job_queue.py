@@ -0,0 +1,448 @@
+"""Background job queue for full-week generation requests from the API.
+
+POST /api/v1/gen/weeks/{week}/generate used to run the generation CLI with a
+blocking subprocess.run() inside an async endpoint, stalling the event loop
+(and /ws) for up to ten minutes. Jobs now:
+
+- are persisted in a SQLite table (logs/jobs.sqlite) and get an id at once;
+- run the same CLI in child processes on a bounded pool of worker threads,
+  so they can be cancelled by terminating the child;
+- stream the child's output to logs/jobs/<job_id>.log;
+- report progress through an on_progress callback, fed by parsing the CLI's
+  phase banners;
+- forward the child's progress bus events, which it writes to a pipe of
+  their own (TEQUILA_PROGRESS_FD, POSIX only), to this process's progress bus;
+- split the per-process LLM rate limits (Settings.LLM_RATE_LIMITS) evenly
+  between the max_workers children that can run at once;
+- are deduplicated per week: submitting a week that already has a queued or
+  running job returns that job.
+- end "aborted" instead of "failed" when the CLI exits with
+  ABORTED_EXIT_CODE: the child's stdin is not a terminal, so a prompt asking
+  whether to go on after repeated failures is answered "no".
+
+Jobs left queued/running by a previous server process are marked failed on
+startup.
+"""
+import logging
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+
+from .metrics import get_registry
+from .progress_bus import get_progress_bus, parse_progress_line
+from .rate_limiter import RATE_LIMIT_SHARE_ENV
+
+logger = logging.getLogger(__name__)
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+ABORTED = "aborted"
+CANCELLED = "cancelled"
+
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+# generate_all_weeks exits with this when a week was aborted, which for a job
+# (no terminal on stdin) means a retry prompt had nobody to answer it
+ABORTED_EXIT_CODE = 4
+
+# Progress steps recognised in the generate_all_weeks output: (pattern, step, message)
+PROGRESS_STEPS = [
+    (re.compile(r"Scaffolding Week"), 1, "Scaffolding week"),
+    (re.compile(r"=== PHASE 1"), 2, "Phase 1: week planning"),
+    (re.compile(r"=== PHASE 2"), 3, "Phase 2: day generation"),
+    (re.compile(r"^\s*Day ([1-4]):"), 3, "Generating Day {day}"),  # Header printed before the day runs
+    (re.compile(r"Validating Week"), 8, "Validating week"),
+    (re.compile(r"Exporting Week"), 9, "Exporting week"),
+]
+TOTAL_STEPS = 10
+
+# Repository root (the CLI runs as `python -m src.cli.generate_all_weeks` from here)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def parse_progress(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Map one line of CLI output to a progress step.
+
+    Returns:
+        {"step", "day", "message"} or None if the line is not a milestone
+    """
+    for pattern, step, message in PROGRESS_STEPS:
+        match = pattern.search(line)
+        if match:
+            day = int(match.group(1)) if match.groups() else 0
+            return {
+                "step": step + day,
+                "day": day,
+                "message": message.format(day=day)
+            }
+    return None
+
+
+def generate_week_command(week: int, params: Dict[str, Any]) -> List[str]:
+    """Build the generate_all_weeks CLI command for a job."""
+    cmd = [sys.executable, "-m", "src.cli.generate_all_weeks", "--week", str(week)]
+    if params.get("concurrent_days"):
+        cmd.append("--concurrent-days")
+    return cmd
+
+
+class JobQueue:
+    """SQLite-backed queue that runs week generation jobs in child processes."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        log_dir: Path,
+        max_workers: int = 1,
+        timeout_s: float = 3600,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        command: Callable[[int, Dict[str, Any]], List[str]] = generate_week_command
+    ):
+        """
+        Initialize job queue.
+
+        Args:
+            db_path: SQLite job table location
+            log_dir: Directory for per-job output logs
+            max_workers: Jobs run at once
+            timeout_s: Terminate a job's child process after this long
+            on_progress: Called (from worker threads) with progress events:
+                         {"job_id", "week", "day", "step", "total_steps", "status", "message"}
+            command: Builds the child process argv for (week, params)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.timeout_s = timeout_s
+        self.max_workers = max(1, max_workers)
+        self.on_progress = on_progress
+        self.command = command
+
+        self.lock = Lock()
+        self._procs: Dict[str, subprocess.Popen] = {}
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gen-job")
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                week INTEGER NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                step INTEGER NOT NULL DEFAULT 0,
+                message TEXT,
+                return_code INTEGER,
+                error TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_week_status ON jobs(week, status)")
+        # Child processes of a previous server are gone; their jobs cannot finish
+        self._conn.execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status IN (?, ?)",
+            (FAILED, "Interrupted by server restart", time.time(), *ACTIVE_STATUSES)
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Persistence helpers
+    # ------------------------------------------------------------------
+
+    def _update(self, job_id: str, **fields) -> None:
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self.lock:
+            self._conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+            self._conn.commit()
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["params"] = orjson.loads(job["params"])
+        job["total_steps"] = TOTAL_STEPS
+        return job
+
+    def log_path(self, job_id: str) -> Path:
+        """Output log file of a job."""
+        return self.log_dir / f"{job_id}.log"
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, week: int, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Queue a generation job for week, or return the week's active job.
+
+        Returns:
+            Job dict with an extra "deduplicated" flag
+        """
+        params = params or {}
+        with self.lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE week = ? AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                (week, *ACTIVE_STATUSES)
+            ).fetchone()
+            if row is not None:
+                return {**self._row_to_job(row), "deduplicated": True}
+
+            job_id = uuid.uuid4().hex[:12]
+            self._conn.execute(
+                "INSERT INTO jobs (id, week, params, status, message, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, week, orjson.dumps(params).decode(), QUEUED, "Queued", time.time())
+            )
+            self._conn.commit()
+
+        job = {**self.get(job_id), "deduplicated": False}
+        self._executor.submit(self._run, job_id, week, params)
+        logger.info(f"Queued generation job {job_id} for Week {week}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by id (None if unknown)."""
+        with self.lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row is not None else None
+
+    def list(self, week: Optional[int] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent jobs first, optionally for one week."""
+        query = "SELECT * FROM jobs"
+        params: tuple = ()
+        if week is not None:
+            query += " WHERE week = ?"
+            params = (week,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self.lock:
+            rows = self._conn.execute(query, (*params, limit)).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def logs(self, job_id: str, offset: int = 0) -> Dict[str, Any]:
+        """
+        Read a job's output from byte offset.
+
+        Returns:
+            {"job_id", "offset" (next offset to request), "text"}
+        """
+        path = self.log_path(job_id)
+        if not path.exists():
+            return {"job_id": job_id, "offset": offset, "text": ""}
+        with path.open("rb") as f:
+            f.seek(offset)
+            data = f.read()
+        return {"job_id": job_id, "offset": offset + len(data), "text": data.decode("utf-8", errors="replace")}
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a queued or running job (running jobs have their child terminated).
+
+        Returns:
+            The updated job, or None if unknown
+        """
+        job = self.get(job_id)
+        if job is None or job["status"] not in ACTIVE_STATUSES:
+            return job
+
+        self._update(job_id, status=CANCELLED, message="Cancelled", finished_at=time.time())
+        with self.lock:
+            proc = self._procs.get(job_id)
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+        self._emit(job_id, job["week"], 0, job["step"], CANCELLED, "Cancelled")
+        logger.info(f"Cancelled generation job {job_id}")
+        return self.get(job_id)
+
+    def active_count(self) -> int:
+        """Number of queued or running jobs (queue depth)."""
+        with self.lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", ACTIVE_STATUSES
+            ).fetchone()[0]
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Number of jobs in each status."""
+        with self.lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED, ABORTED, CANCELLED)}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def shutdown(self) -> None:
+        """Terminate running children and stop the workers."""
+        with self.lock:
+            procs = list(self._procs.values())
+        for proc in procs:
+            if proc.poll() is None:
+                proc.terminate()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _emit(self, job_id: str, week: int, day: int, step: int, status: str, message: str) -> None:
+        if self.on_progress is None:
+            return
+        try:
+            self.on_progress({
+                "job_id": job_id,
+                "week": week,
+                "day": day,
+                "step": step,
+                "total_steps": TOTAL_STEPS,
+                "status": status,
+                "message": message
+            })
+        except Exception as e:
+            logger.warning(f"Job progress callback failed: {e}")
+
+    def _forward_progress(self, read_fd: int, job_id: str) -> None:
+        """Re-publish a child's progress bus events until it closes the pipe."""
+        with os.fdopen(read_fd, "r", encoding="utf-8") as events:
+            for line in events:
+                event = parse_progress_line(line)
+                if event is not None:
+                    event["job_id"] = job_id
+                    get_progress_bus().publish_event(event)
+
+    def _run(self, job_id: str, week: int, params: Dict[str, Any]) -> None:
+        # Claim the job unless it was cancelled while queued
+        with self.lock:
+            claimed = self._conn.execute(
+                "UPDATE jobs SET status = ?, message = ?, started_at = ? WHERE id = ? AND status = ?",
+                (RUNNING, "Starting", time.time(), job_id, QUEUED)
+            ).rowcount
+            self._conn.commit()
+        if not claimed:
+            return
+
+        self._emit(job_id, week, 0, 0, RUNNING, "Starting")
+
+        # Jobs running side by side split the LLM rate limits between them
+        env = {**os.environ, "PYTHONUNBUFFERED": "1", RATE_LIMIT_SHARE_ENV: str(self.max_workers)}
+        pass_fds = ()
+        forwarder = None
+        if os.name == "posix":
+            # Bus events come back on their own pipe, never mixed into stdout
+            progress_read, progress_write = os.pipe()
+            env["TEQUILA_PROGRESS_FD"] = str(progress_write)
+            pass_fds = (progress_write,)
+            forwarder = threading.Thread(
+                target=self._forward_progress, args=(progress_read, job_id), daemon=True
+            )
+            forwarder.start()
+        step = 0
+        try:
+            with self.log_path(job_id).open("w", encoding="utf-8") as log:
+                try:
+                    proc = subprocess.Popen(
+                        self.command(week, params),
+                        cwd=str(PROJECT_ROOT),
+                        env=env,
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        pass_fds=pass_fds,
+                        text=True,
+                        bufsize=1
+                    )
+                finally:
+                    for fd in pass_fds:
+                        os.close(fd)  # The child has its copy; EOF once it exits
+                with self.lock:
+                    self._procs[job_id] = proc
+                timed_out = threading.Event()
+
+                def kill_on_timeout():
+                    timed_out.set()
+                    proc.kill()
+
+                timer = threading.Timer(self.timeout_s, kill_on_timeout)
+                timer.start()
+                try:
+                    for line in proc.stdout:
+                        log.write(line)
+                        log.flush()
+                        progress = parse_progress(line)
+                        if progress is not None and progress["step"] >= step:
+                            step = progress["step"]
+                            self._update(job_id, step=step, message=progress["message"])
+                            self._emit(job_id, week, progress["day"], step, RUNNING, progress["message"])
+                    return_code = proc.wait()
+                    if forwarder is not None:
+                        forwarder.join(timeout=5)
+                finally:
+                    timer.cancel()
+        except Exception as e:
+            logger.error(f"Generation job {job_id} could not run: {e}")
+            self._update(job_id, status=FAILED, error=str(e), finished_at=time.time())
+            self._emit(job_id, week, 0, step, FAILED, str(e))
+            return
+        finally:
+            with self.lock:
+                self._procs.pop(job_id, None)
+
+        if self.get(job_id)["status"] == CANCELLED:
+            return
+
+        if return_code == 0:
+            self._update(job_id, status=SUCCEEDED, step=TOTAL_STEPS, message="Completed",
+                         return_code=0, finished_at=time.time())
+            self._emit(job_id, week, 0, TOTAL_STEPS, SUCCEEDED, "Completed")
+        elif return_code == ABORTED_EXIT_CODE:
+            error = "Aborted: generation needed confirmation to continue after repeated failures (see the job log)"
+            self._update(job_id, status=ABORTED, message=error, error=error,
+                         return_code=return_code, finished_at=time.time())
+            self._emit(job_id, week, 0, step, ABORTED, error)
+        else:
+            error = f"Timed out after {self.timeout_s:.0f}s" if timed_out.is_set() else f"Exited with code {return_code}"
+            self._update(job_id, status=FAILED, message=error, error=error,
+                         return_code=return_code, finished_at=time.time())
+            self._emit(job_id, week, 0, step, FAILED, error)
+
+
+# Global queue instance
+_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get global job queue instance (configured from settings)."""
+    global _queue
+    if _queue is None:
+        from ..config import settings
+        _queue = JobQueue(
+            db_path=settings.logs_path / "jobs.sqlite",
+            log_dir=settings.logs_path / "jobs",
+            max_workers=settings.GEN_JOB_WORKERS,
+            timeout_s=settings.GEN_JOB_TIMEOUT_S
+        )
+        get_registry().add_collector("job_queue", _collect_metrics)
+    return _queue
+
+
+def _collect_metrics():
+    counts = _queue.count_by_status()
+    return [
+        ("tequila_jobs", "gauge", "Generation jobs by status (queued + running = queue depth)",
+         [({"status": status}, count) for status, count in counts.items()]),
+    ]
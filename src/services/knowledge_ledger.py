@@ -0,0 +1,264 @@
+"""Student knowledge ledger: per-week vocabulary and grammar deltas.
+
+Backward analysis for Week N needs to know everything taught in Weeks 1..N-1.
+Instead of sending every prior week to the model, each week's new vocabulary
+and grammar concepts are recorded once (from its generated week_spec.json, or
+from curriculum_outline.json for weeks not generated yet) in
+curriculum/LatinA/knowledge_ledger.json. Cumulative knowledge is then merged
+locally and only a compact, fixed-size digest is sent to the model.
+
+Everything is read through storage.py, so the ledger works the same on the
+SQLite backend; a recorded week is re-read only when the SHA-256 of its stored
+week_spec.json changes.
+"""
+import hashlib
+import re
+import logging
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from .storage import get_curriculum_base, internal_doc_path, path_exists, read_file, read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+# Weeks described in full in the prompt digest; older weeks are summarized
+DIGEST_RECENT_WEEKS = 3
+# Maximum number of older week titles listed in the digest
+DIGEST_MAX_EARLIER_TITLES = 12
+
+
+def _outline_path() -> Path:
+    return Path(__file__).parent.parent.parent / "curriculum" / "curriculum_outline.json"
+
+
+def _content_hash(content: str) -> str:
+    """Freshness signature of a stored week_spec.json (backend-independent)."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _split_vocab_item(item: Any) -> Optional[Dict[str, Any]]:
+    """Normalize one vocabulary entry from any week_spec/outline shape."""
+    if isinstance(item, dict):
+        word = item.get("latin") or item.get("word") or item.get("lemma")
+        if not word:
+            return None
+        return {
+            "word": str(word).strip(),
+            "english": item.get("english") or item.get("meaning"),
+            "part_of_speech": item.get("part_of_speech"),
+        }
+    if isinstance(item, str) and item.strip():
+        # "amō (love)" / "amō – love" / "puella"
+        match = re.match(r"\s*([^(–—-]+?)\s*(?:[(–—-]\s*(.+?)\)?\s*)?$", item)
+        if match:
+            return {"word": match.group(1).strip(), "english": match.group(2), "part_of_speech": None}
+    return None
+
+
+def extract_week_delta(week: int, week_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the vocabulary and grammar a week introduces from its week_spec.
+
+    Tolerates the LLM week_spec layout (vocabulary list), the reverse-engineered
+    layout (vocabulary.core_items) and legacy 03_vocabulary.json parts.
+    """
+    vocab_source = week_spec.get("vocabulary") or week_spec.get("03_vocabulary.json") or []
+    if isinstance(vocab_source, dict):
+        vocab_source = vocab_source.get("core_items") or vocab_source.get("items") or []
+
+    vocabulary = []
+    for item in vocab_source if isinstance(vocab_source, list) else []:
+        entry = _split_vocab_item(item)
+        if entry:
+            vocabulary.append(entry)
+
+    grammar = week_spec.get("grammar_focus") or week_spec.get("04_grammar_focus.md")
+    if not grammar and isinstance(week_spec.get("objectives"), dict):
+        grammar = week_spec["objectives"].get("grammar_focus")
+    if isinstance(grammar, dict):
+        grammar = grammar.get("summary") or grammar.get("topic") or ", ".join(
+            str(v) for v in grammar.values() if isinstance(v, str)
+        )
+    grammar_concepts = [g.strip() for g in re.split(r"[;\n]", grammar or "") if g.strip()]
+
+    metadata = week_spec.get("metadata") or week_spec.get("01_metadata.json") or {}
+    return {
+        "week": week,
+        "source": "week_spec",
+        "title": metadata.get("title", f"Week {week}") if isinstance(metadata, dict) else f"Week {week}",
+        "vocabulary": vocabulary,
+        "grammar_concepts": grammar_concepts,
+    }
+
+
+def outline_week_delta(week: int, outline_entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a provisional delta for a week that has not been generated yet."""
+    return {
+        "week": week,
+        "source": "outline",
+        "title": outline_entry.get("title", f"Week {week}"),
+        "vocabulary": [
+            entry for entry in (_split_vocab_item(v) for v in outline_entry.get("new_vocab", []))
+            if entry
+        ],
+        "grammar_concepts": [
+            g for g in outline_entry.get("grammar_topics", []) if not str(g).startswith("Chant")
+        ],
+    }
+
+
+class KnowledgeLedger:
+    """Persisted, incrementally updated per-week knowledge deltas."""
+
+    def __init__(self, ledger_path: Optional[Path] = None):
+        """
+        Initialize knowledge ledger.
+
+        Args:
+            ledger_path: Path to the ledger JSON file.
+                         Defaults to curriculum/LatinA/knowledge_ledger.json
+        """
+        if ledger_path is None:
+            ledger_path = get_curriculum_base() / "knowledge_ledger.json"
+
+        self.ledger_path = ledger_path
+        self.lock = Lock()
+        self._outline: Optional[Dict[str, Any]] = None
+        self._load()
+
+    def _load(self):
+        """Load the existing ledger from storage."""
+        self.data = {"weeks": {}}
+        if path_exists(self.ledger_path):
+            try:
+                self.data = read_json(self.ledger_path)
+                self.data.setdefault("weeks", {})
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable knowledge ledger {self.ledger_path}: {e}")
+
+    def _save(self):
+        write_json(self.ledger_path, self.data)
+
+    def _outline_entry(self, week: int) -> Dict[str, Any]:
+        if self._outline is None:
+            path = _outline_path()
+            self._outline = read_json(path) if path_exists(path) else {}
+        return self._outline.get(f"week_{week:02d}", {})
+
+    def record_week_spec(self, week: int, week_spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Record (or replace) a week's delta from its freshly generated week_spec."""
+        delta = extract_week_delta(week, week_spec)
+        spec_path = internal_doc_path(week, "week_spec.json")
+        if path_exists(spec_path):
+            delta["spec_sha256"] = _content_hash(read_file(spec_path))
+        with self.lock:
+            self.data["weeks"][str(week)] = delta
+            self._save()
+        return delta
+
+    def _refresh_week(self, week: int) -> bool:
+        """Bring one week's entry up to date. Returns True if it changed."""
+        entry = self.data["weeks"].get(str(week))
+        spec_path = internal_doc_path(week, "week_spec.json")
+
+        if path_exists(spec_path):
+            content = read_file(spec_path)
+            spec_sha256 = _content_hash(content)
+            if entry and entry.get("source") == "week_spec" and entry.get("spec_sha256") == spec_sha256:
+                return False
+            try:
+                delta = extract_week_delta(week, orjson.loads(content))
+            except Exception as e:
+                logger.warning(f"Could not read Week {week} spec for ledger: {e}")
+                delta = None
+            # Scaffolded weeks hold an empty {} spec until Phase 1 runs
+            if delta and (delta["vocabulary"] or delta["grammar_concepts"]):
+                delta["spec_sha256"] = spec_sha256
+                self.data["weeks"][str(week)] = delta
+                return True
+
+        if entry is None:
+            self.data["weeks"][str(week)] = outline_week_delta(week, self._outline_entry(week))
+            return True
+        return False
+
+    def deltas_before(self, week: int) -> List[Dict[str, Any]]:
+        """Return up-to-date deltas for Weeks 1..week-1, refreshing stale entries."""
+        with self.lock:
+            changed = False
+            for prior in range(1, week):
+                changed |= self._refresh_week(prior)
+            if changed:
+                self._save()
+            return [self.data["weeks"][str(prior)] for prior in range(1, week)]
+
+    def cumulative_before(self, week: int) -> Dict[str, Any]:
+        """Merge prior deltas into cumulative vocabulary and grammar lists."""
+        vocabulary: Dict[str, Dict[str, Any]] = {}
+        grammar: Dict[str, Dict[str, Any]] = {}
+
+        for delta in self.deltas_before(week):
+            for item in delta["vocabulary"]:
+                key = item["word"].lower()
+                if key not in vocabulary:
+                    vocabulary[key] = {
+                        "word": item["word"],
+                        "english": item.get("english"),
+                        "week_introduced": delta["week"],
+                        "part_of_speech": item.get("part_of_speech"),
+                        # Words from the immediately preceding week are still being consolidated
+                        "mastery_expected": delta["week"] < week - 1,
+                    }
+            for concept in delta["grammar_concepts"]:
+                key = concept.lower()
+                if key not in grammar:
+                    grammar[key] = {
+                        "concept": concept,
+                        "week_introduced": delta["week"],
+                        "mastery_level": "mastery" if delta["week"] < week - 1 else "recognition",
+                    }
+
+        return {
+            "prior_weeks_reviewed": list(range(1, week)),
+            "cumulative_latin_vocabulary": list(vocabulary.values()),
+            "cumulative_grammar_concepts": list(grammar.values()),
+        }
+
+    def digest(self, week: int) -> Dict[str, Any]:
+        """Compact, bounded-size summary of prior knowledge for the prompt."""
+        deltas = self.deltas_before(week)
+        recent = deltas[-DIGEST_RECENT_WEEKS:]
+        earlier = deltas[:-DIGEST_RECENT_WEEKS] if len(deltas) > DIGEST_RECENT_WEEKS else []
+
+        return {
+            "weeks_completed": len(deltas),
+            "total_vocabulary_words": sum(len(d["vocabulary"]) for d in deltas),
+            "total_grammar_concepts": sum(len(d["grammar_concepts"]) for d in deltas),
+            "earlier_week_titles": [
+                f"Week {d['week']}: {d['title']}" for d in earlier[-DIGEST_MAX_EARLIER_TITLES:]
+            ],
+            "recent_weeks": [
+                {
+                    "week": d["week"],
+                    "title": d["title"],
+                    "new_vocabulary": [v["word"] for v in d["vocabulary"]],
+                    "grammar_concepts": d["grammar_concepts"],
+                }
+                for d in recent
+            ],
+        }
+
+
+# Global ledger instance
+_ledger: Optional[KnowledgeLedger] = None
+
+
+def get_knowledge_ledger() -> KnowledgeLedger:
+    """Get global knowledge ledger instance."""
+    global _ledger
+    if _ledger is None:
+        _ledger = KnowledgeLedger()
+    return _ledger
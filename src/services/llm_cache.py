@@ -0,0 +1,335 @@
+"""Content-addressed on-disk cache for LLM responses.
+
+Responses are stored in a SQLite database (curriculum/cache/llm_responses.sqlite)
+keyed by a SHA256 of (model, temperature, system prompt, user prompt, json_schema),
+so re-running a week after a crash or validator tweak replays identical calls
+from disk instead of paying for them again.
+
+Retry loops in the generators re-send the same prompt after a validation
+failure. To keep those retries meaningful, a key is served from the cache at
+most once per process; any later request for the same key goes to the model and
+overwrites the stored entry.
+"""
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional, Set
+
+import orjson
+
+from .llm_client import LLMClient, LLMResponse, generation_overrides, is_reasoning_model
+from .metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_dir() -> Path:
+    """Get the LLM cache directory path."""
+    return Path(__file__).parent.parent.parent / "curriculum" / "cache"
+
+
+def cache_key(
+    model: Optional[str],
+    temperature: Optional[float],
+    system: Optional[str],
+    prompt: str,
+    json_schema: Optional[Dict] = None,
+    response_format: Optional[Dict] = None
+) -> str:
+    """Hash the inputs that determine an LLM response."""
+    inputs = {
+        "model": model,
+        "temperature": temperature,
+        "system": system,
+        "prompt": prompt,
+        "json_schema": json_schema,
+    }
+    # Only present when set, so keys written before the override existed stay valid
+    if response_format is not None:
+        inputs["response_format"] = response_format
+    payload = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe SQLite response store with size-based LRU eviction."""
+
+    def __init__(self, db_path: Optional[Path] = None, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize response cache.
+
+        Args:
+            db_path: Path to the SQLite database.
+                     Defaults to curriculum/cache/llm_responses.sqlite
+            max_bytes: Evict least-recently-used entries above this total size
+        """
+        if db_path is None:
+            db_path = get_cache_dir() / "llm_responses.sqlite"
+
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.tokens_saved = 0
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Return the cached response for key, or None on a miss."""
+        with self.lock:
+            row = self._conn.execute(
+                "SELECT payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            data = orjson.loads(row[0])
+            self.tokens_saved += (data.get("tokens_prompt") or 0) + (data.get("tokens_completion") or 0)
+
+        # Cached calls cost nothing, so report zero usage to the tracker.
+        return LLMResponse(
+            text=data["text"],
+            json=data.get("json"),
+            raw=None,
+            tokens_prompt=0,
+            tokens_completion=0,
+            model=data.get("model"),
+            provider=data.get("provider"),
+            cached=True
+        )
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response and evict old entries if over the size cap."""
+        payload = orjson.dumps({
+            "text": response.text,
+            "json": response.json,
+            "tokens_prompt": response.tokens_prompt,
+            "tokens_completion": response.tokens_completion,
+            "model": response.model,
+            "provider": response.provider,
+        })
+        now = time.time()
+
+        with self.lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (key, model, payload, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, response.model, payload, len(payload), now, now)
+            )
+            self._total_bytes += len(payload) - (old[0] if old else 0)
+            self.writes += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used rows until the cache fits in max_bytes."""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access ASC LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+                if self._total_bytes <= self.max_bytes:
+                    return
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self.lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and storage usage."""
+        with self.lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "tokens_saved": self.tokens_saved,
+                "entries": entries,
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class CachedLLMClient(LLMClient):
+    """LLMClient wrapper that serves repeated prompts from a ResponseCache."""
+
+    def __init__(self, inner: LLMClient, cache: ResponseCache, refresh: bool = False):
+        """
+        Wrap an LLM client with a response cache.
+
+        Args:
+            inner: Client that performs real generation
+            cache: Response store
+            refresh: Skip cache reads (but still write fresh responses)
+        """
+        self.inner = inner
+        self.cache = cache
+        self.refresh = refresh
+        self._served: Set[str] = set()
+        self._served_lock = Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped client's attributes (model, temp, client, ...)
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def _key(
+        self,
+        prompt: str,
+        system: Optional[str],
+        json_schema: Optional[Dict],
+        overrides: Dict[str, Any]
+    ) -> str:
+        model = overrides.get("model") or getattr(self.inner, "model", None)
+        temperature = overrides.get("temperature", getattr(self.inner, "temp", None))
+        if model and is_reasoning_model(model):
+            temperature = None  # Not sent for reasoning models
+        return cache_key(
+            model,
+            temperature,
+            system,
+            prompt,
+            json_schema,
+            overrides.get("response_format")
+        )
+
+    def _lookup(self, key: str) -> Optional[LLMResponse]:
+        """Return a cached response unless this key was already served this run."""
+        if self.refresh:
+            return None
+        with self._served_lock:
+            if key in self._served:
+                return None  # Same prompt again means a retry: go to the model
+            self._served.add(key)
+        return self.cache.get(key)
+
+    def _store(self, key: str, response: LLMResponse) -> None:
+        if response.provider == "dry-run":
+            return
+        with self._served_lock:
+            self._served.add(key)
+        try:
+            self.cache.put(key, response)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to cache LLM response: {e}")
+
+    def generate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_schema: Optional[Dict] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict] = None
+    ) -> LLMResponse:
+        """Return a cached response or delegate to the wrapped client."""
+        overrides = generation_overrides(model, temperature, response_format)
+        key = self._key(prompt, system, json_schema, overrides)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = self.inner.generate(prompt=prompt, system=system, json_schema=json_schema, **overrides)
+        self._store(key, response)
+        return response
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_schema: Optional[Dict] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict] = None
+    ) -> LLMResponse:
+        """Async variant of generate()."""
+        overrides = generation_overrides(model, temperature, response_format)
+        key = self._key(prompt, system, json_schema, overrides)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = await self.inner.agenerate(
+            prompt=prompt, system=system, json_schema=json_schema, **overrides
+        )
+        self._store(key, response)
+        return response
+
+
+# Global cache instance
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get global response cache instance."""
+    global _cache
+    if _cache is None:
+        from ..config import settings
+        _cache = ResponseCache(max_bytes=settings.LLM_CACHE_MAX_MB * 1024 * 1024)
+        get_registry().add_collector("llm_response_cache", _collect_metrics)
+    return _cache
+
+
+def _collect_metrics():
+    stats = _cache.get_stats()
+    return [
+        ("tequila_llm_cache_lookups_total", "counter", "LLM response cache lookups by result",
+         [({"result": "hit"}, stats["hits"]), ({"result": "miss"}, stats["misses"])]),
+        ("tequila_llm_cache_tokens_saved_total", "counter", "Tokens not spent thanks to cache hits",
+         [({}, stats["tokens_saved"])]),
+        ("tequila_llm_cache_bytes", "gauge", "Size of the LLM response cache",
+         [({}, stats["size_bytes"])]),
+    ]
@@ -1,9 +1,32 @@
 """LLM client abstraction for OpenAI GPT-4o."""
+import asyncio
+import functools
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from .rate_limiter import get_rate_limiter, request_token_estimate, usage_tokens
+
+
+def generation_overrides(
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    response_format: Optional[Dict] = None
+) -> Dict[str, Any]:
+    """Collect the per-call overrides that were actually set.
+
+    Wrappers forward only these, so LLMClient subclasses that predate the
+    override arguments keep working for calls that don't use them.
+    """
+    overrides = {"model": model, "temperature": temperature, "response_format": response_format}
+    return {key: value for key, value in overrides.items() if value is not None}
+
+
+def is_reasoning_model(model: str) -> bool:
+    """o1/o3-style models reject temperature, max_tokens and system messages."""
+    return model.startswith(("o1", "o3"))
+
 
 @dataclass
 class LLMResponse:
@@ -15,6 +38,7 @@ class LLMResponse:
     tokens_completion: Optional[int] = None
     model: Optional[str] = None
     provider: Optional[str] = None
+    cached: bool = False
 
 
 class LLMClient:
@@ -24,7 +48,10 @@ class LLMClient:
         self,
         prompt: str,
         system: Optional[str] = None,
-        json_schema: Optional[Dict] = None
+        json_schema: Optional[Dict] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict] = None
     ) -> LLMResponse:
         """
         Generate a response from the LLM.
@@ -33,12 +60,47 @@ class LLMClient:
             prompt: User prompt text
             system: Optional system prompt
             json_schema: Optional JSON schema for structured output
+            model: Per-call model override (default: the client's model)
+            temperature: Per-call temperature override
+            response_format: Raw response_format (e.g. {"type": "json_object"});
+                             takes precedence over json_schema
 
         Returns:
             LLMResponse with text and optionally parsed JSON
         """
         raise NotImplementedError
 
+    async def agenerate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_schema: Optional[Dict] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict] = None
+    ) -> LLMResponse:
+        """
+        Awaitable variant of generate() so callers can overlap many requests.
+
+        The default implementation runs the synchronous generate() in a worker
+        thread; clients with a native async transport override this.
+
+        Args:
+            prompt: User prompt text
+            system: Optional system prompt
+            json_schema: Optional JSON schema for structured output
+            model: Per-call model override (default: the client's model)
+            temperature: Per-call temperature override
+            response_format: Raw response_format; takes precedence over json_schema
+
+        Returns:
+            LLMResponse with text and optionally parsed JSON
+        """
+        overrides = generation_overrides(model, temperature, response_format)
+        return await asyncio.to_thread(
+            functools.partial(self.generate, prompt, system, json_schema, **overrides)
+        )
+
     def _check_budget(self):
         """Check if generation would exceed budget cap."""
         from ..config import settings
@@ -83,7 +145,20 @@ class LLMClient:
             "spiral_links": {"prior_weeks_dependencies": [], "recycled_vocab": [], "recycled_grammar": []},
             "interleaving_plan": "Dry-run placeholder for testing without API calls",
             "misconception_watchlist": [],
-            "preview_next_week": "Next week placeholder"
+            "preview_next_week": "Next week placeholder",
+            # Day-level keys so a whole week (fields, documents, assessment) dry-runs
+            "class_name": "Dry Run: Latin Placeholder",
+            "grade_level": "3-5",
+            "day_summary": "Dry-run placeholder Latin vocabulary lesson",
+            "greeting_text": "Salvete! (dry-run placeholder)",
+            "spiral_review_document": "Dry-run placeholder",
+            "weekly_topics_document": "Dry-run placeholder",
+            "virtue_and_faith_document": "Dry-run placeholder",
+            "vocabulary_key_document": "Dry-run placeholder",
+            "chant_chart_document": "Dry-run placeholder",
+            "teacher_voice_tips_document": "Dry-run placeholder",
+            "quiz_markdown": "# Dry-run placeholder quiz",
+            "answer_key_min": []
         }
 
         return LLMResponse(
@@ -116,7 +191,8 @@ class OpenAIClient(LLMClient):
         model: str = "gpt-4o",
         temp: float = 0.2,
         max_tokens: int = 2000,
-        timeout: int = 60
+        timeout: int = 60,
+        base_url: Optional[str] = None
     ):
         """Initialize OpenAI client.
 
@@ -126,6 +202,7 @@ class OpenAIClient(LLMClient):
             temp: Temperature (default: 0.2)
             max_tokens: Maximum tokens (default: 2000)
             timeout: Request timeout in seconds (default: 60)
+            base_url: Optional OpenAI-compatible endpoint (default: api.openai.com)
         """
         if not api_key:
             raise ValueError("OPENAI_API_KEY missing")
@@ -135,11 +212,12 @@ class OpenAIClient(LLMClient):
         except ImportError:
             raise ImportError("openai package required. Install with: pip install openai")
 
-        self.client = openai.OpenAI(api_key=api_key, timeout=timeout)
+        self.client = openai.OpenAI(api_key=api_key, timeout=timeout, base_url=base_url)
         self.model = model
         self.temp = temp
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self.base_url = base_url
 
     @retry(
         stop=stop_after_attempt(3),
@@ -150,7 +228,10 @@ class OpenAIClient(LLMClient):
         self,
         prompt: str,
         system: Optional[str] = None,
-        json_schema: Optional[Dict] = None
+        json_schema: Optional[Dict] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict] = None
     ) -> LLMResponse:
         """Generate response using OpenAI GPT-4o API.
 
@@ -158,6 +239,9 @@ class OpenAIClient(LLMClient):
             prompt: User prompt text
             system: Optional system prompt
             json_schema: Optional JSON schema for structured output
+            model: Per-call model override (e.g. "o1-mini")
+            temperature: Per-call temperature override
+            response_format: Raw response_format; takes precedence over json_schema
 
         Returns:
             LLMResponse with text, JSON, and usage metadata
@@ -170,19 +254,61 @@ class OpenAIClient(LLMClient):
         # Check budget
         self._check_budget()
 
+        request = self._build_request(prompt, system, json_schema, model, temperature, response_format)
+
+        # Wait for RPM/TPM capacity instead of provoking 429s
+        limiter = get_rate_limiter()
+        reservation = limiter.acquire(request["model"], request_token_estimate(request, self.max_tokens))
+
+        try:
+            resp = self.client.chat.completions.create(**request)
+        except Exception as e:
+            limiter.reconcile(reservation, None)
+            # Log the actual error before wrapping
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"OpenAI API error: {type(e).__name__}: {e}")
+            # Wrap in transient error for retry
+            raise _TransientError(str(e))
+
+        limiter.reconcile(reservation, usage_tokens(resp))
+        return self._to_response(resp, request["model"])
+
+    def _build_request(
+        self,
+        prompt: str,
+        system: Optional[str],
+        json_schema: Optional[Dict],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Build chat.completions.create() kwargs for a prompt."""
+        model = model or self.model
         msgs = []
-        if system:
-            msgs.append({"role": "system", "content": system})
-        msgs.append({"role": "user", "content": prompt})
-
-        kwargs = {
-            "model": self.model,
-            "temperature": self.temp,
-            "max_tokens": self.max_tokens
-        }
+
+        if is_reasoning_model(model):
+            # Reasoning models take neither system messages nor sampling params
+            content = f"{system}\n\n{prompt}" if system else prompt
+            msgs.append({"role": "user", "content": content})
+            kwargs = {"messages": msgs, "model": model}
+        else:
+            if system:
+                msgs.append({"role": "system", "content": system})
+            msgs.append({"role": "user", "content": prompt})
+
+            kwargs = {
+                "messages": msgs,
+                "model": model,
+                "temperature": self.temp if temperature is None else temperature,
+                "max_tokens": self.max_tokens
+            }
+
+        if response_format:
+            kwargs["response_format"] = response_format
 
         # Add JSON schema if provided (strict structured output)
-        if json_schema:
+        elif json_schema:
             # Validate schema has required structure for OpenAI API
             if not isinstance(json_schema, dict):
                 raise ValueError(f"json_schema must be a dict, got {type(json_schema)}")
@@ -214,16 +340,10 @@ class OpenAIClient(LLMClient):
                 )
                 # Don't use structured output for incomplete schemas
 
-        try:
-            resp = self.client.chat.completions.create(messages=msgs, **kwargs)
-        except Exception as e:
-            # Log the actual error before wrapping
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"OpenAI API error: {type(e).__name__}: {e}")
-            # Wrap in transient error for retry
-            raise _TransientError(str(e))
+        return kwargs
 
+    def _to_response(self, resp: Any, model: Optional[str] = None) -> LLMResponse:
+        """Convert a chat completion into an LLMResponse."""
         out = resp.choices[0].message.content or ""
 
         # Extract token usage
@@ -245,11 +365,149 @@ class OpenAIClient(LLMClient):
             raw=resp,
             tokens_prompt=tokens_prompt,
             tokens_completion=tokens_completion,
-            model=self.model,
+            model=model or self.model,
             provider="openai"
         )
 
 
+class AsyncOpenAIClient(OpenAIClient):
+    """OpenAI client with a native async path over a bounded connection pool.
+
+    generate() behaves exactly like OpenAIClient. agenerate() sends requests
+    through openai.AsyncOpenAI, sharing one pooled HTTP client between all
+    concurrent calls; at most max_connections requests are in flight and the
+    rest wait for a free slot instead of failing with a pool timeout.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        temp: float = 0.2,
+        max_tokens: int = 2000,
+        timeout: int = 60,
+        base_url: Optional[str] = None,
+        max_connections: int = 20
+    ):
+        """Initialize async OpenAI client.
+
+        Args:
+            api_key: OpenAI API key
+            model: Model name (default: gpt-4o)
+            temp: Temperature (default: 0.2)
+            max_tokens: Maximum tokens (default: 2000)
+            timeout: Request timeout in seconds (default: 60)
+            base_url: Optional OpenAI-compatible endpoint (default: api.openai.com)
+            max_connections: Size of the shared HTTP connection pool (default: 20)
+        """
+        super().__init__(
+            api_key=api_key,
+            model=model,
+            temp=temp,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            base_url=base_url
+        )
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+
+        self.api_key = api_key
+        self.max_connections = max_connections
+        # asyncio primitives and httpx pools are bound to the loop that created
+        # them, so they are built lazily and rebuilt if the loop changes.
+        self._aclient = None
+        self._aclient_loop = None
+        self._slots = None
+
+    def _get_async_client(self):
+        """Return the pooled AsyncOpenAI client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            import httpx
+            import openai
+
+            http_client = openai.DefaultAsyncHttpxClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+            self._aclient = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                timeout=self.timeout,
+                base_url=self.base_url,
+                http_client=http_client
+            )
+            self._aclient_loop = loop
+            self._slots = asyncio.Semaphore(self.max_connections)
+        return self._aclient
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(min=1, max=6),
+        retry=retry_if_exception_type(_TransientError)
+    )
+    async def agenerate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_schema: Optional[Dict] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict] = None
+    ) -> LLMResponse:
+        """Generate response using the async OpenAI API.
+
+        Args:
+            prompt: User prompt text
+            system: Optional system prompt
+            json_schema: Optional JSON schema for structured output
+            model: Per-call model override (e.g. "o1-mini")
+            temperature: Per-call temperature override
+            response_format: Raw response_format; takes precedence over json_schema
+
+        Returns:
+            LLMResponse with text, JSON, and usage metadata
+        """
+        # Check dry-run mode
+        from ..config import settings
+        if settings.DRY_RUN:
+            return self._dry_run_response(prompt, system)
+
+        # Check budget
+        self._check_budget()
+
+        request = self._build_request(prompt, system, json_schema, model, temperature, response_format)
+        aclient = self._get_async_client()
+
+        # Block a worker thread, not the event loop, while waiting for capacity
+        limiter = get_rate_limiter()
+        reservation = await asyncio.to_thread(
+            limiter.acquire, request["model"], request_token_estimate(request, self.max_tokens)
+        )
+
+        try:
+            async with self._slots:
+                resp = await aclient.chat.completions.create(**request)
+        except Exception as e:
+            limiter.reconcile(reservation, None)
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"OpenAI API error: {type(e).__name__}: {e}")
+            raise _TransientError(str(e))
+
+        limiter.reconcile(reservation, usage_tokens(resp))
+        return self._to_response(resp, request["model"])
+
+    async def aclose(self):
+        """Close the pooled HTTP connections."""
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+            self._aclient_loop = None
+
+
 def get_client(
     provider: str = "openai",
     model: Optional[str] = None,
@@ -262,6 +520,7 @@ def get_client(
         provider: Provider name (only "openai" supported)
         model: Model name (default: gpt-4o)
         **kwargs: Additional arguments passed to client constructor
+            (async_client=True returns an AsyncOpenAIClient)
 
     Returns:
         Configured LLMClient instance
@@ -274,10 +533,22 @@ def get_client(
     if provider != "openai":
         raise ValueError(f"Only 'openai' provider is supported. Got: {provider}")
 
+    if kwargs.get("async_client"):
+        return AsyncOpenAIClient(
+            api_key=settings.OPENAI_API_KEY,
+            model=model or "gpt-4o",
+            temp=kwargs.get("temp", 0.2),
+            max_tokens=kwargs.get("max_tokens", 2000),
+            timeout=kwargs.get("timeout", 60),
+            base_url=kwargs.get("base_url", settings.OPENAI_BASE_URL),
+            max_connections=kwargs.get("max_connections", settings.LLM_MAX_CONNECTIONS)
+        )
+
     return OpenAIClient(
         api_key=settings.OPENAI_API_KEY,
         model=model or "gpt-4o",
         temp=kwargs.get("temp", 0.2),
         max_tokens=kwargs.get("max_tokens", 2000),
-        timeout=kwargs.get("timeout", 60)
+        timeout=kwargs.get("timeout", 60),
+        base_url=kwargs.get("base_url", settings.OPENAI_BASE_URL)
     )
@@ -0,0 +1,274 @@
+"""Pure-Python Prometheus metrics for the API and the generator CLIs.
+
+Counters, gauges and histograms live in a process-wide registry and are
+rendered in the Prometheus text exposition format (version 0.0.4) by GET
+/metrics or written to a file by the generator CLI at exit. No client
+library or external service is needed.
+
+Values that other components already count (response cache hits, storage
+read cache, job queue, WebSocket clients) are not duplicated: their owners
+register collectors that are read at render time.
+
+Metric names are prefixed with tequila_. The metrics updated from the
+generation hot paths are defined at the bottom of this module.
+"""
+import bisect
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Seconds; LLM calls run from ~1s to several minutes, storage from microseconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# (labels, value) pairs reported by a collector or a metric
+Samples = List[Tuple[Dict[str, Any], float]]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        text = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{text}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self._values: Dict[tuple, Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> List[Tuple[str, Dict[str, Any], float]]:
+        with self.lock:
+            return [(self.name, self._labels(key), value) for key, value in self._values.items()]
+
+    def clear(self) -> None:
+        with self.lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self.lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self.lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self.lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self.lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the wall-clock duration of the with block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> List[Tuple[str, Dict[str, Any], float]]:
+        out = []
+        with self.lock:
+            items = [(key, list(counts), total, count) for key, (counts, total, count) in self._values.items()]
+        for key, counts, total, count in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(list(self.buckets) + [math.inf], counts):
+                cumulative += bucket_count
+                out.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            out.append((f"{self.name}_sum", labels, total))
+            out.append((f"{self.name}_count", labels, count))
+        return out
+
+
+class Registry:
+    """Named metrics plus collectors, rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics: Dict[str, _Metric] = {}
+        self.collectors: Dict[str, Callable[[], Iterable[Tuple[str, str, str, Samples]]]] = {}
+
+    def _get_or_create(self, cls, name: str, help: str, labelnames: Sequence[str], **kwargs) -> Any:
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, help, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def add_collector(self, key: str, collect: Callable[[], Iterable[Tuple[str, str, str, Samples]]]) -> None:
+        """
+        Register a callable read at render time (replaces one with the same key).
+
+        Args:
+            key: Collector identity, so re-registering does not duplicate it
+            collect: Returns (name, type, help, [(labels, value), ...]) families
+        """
+        with self.lock:
+            self.collectors[key] = collect
+
+    def remove_collector(self, key: str) -> None:
+        """Unregister a collector."""
+        with self.lock:
+            self.collectors.pop(key, None)
+
+    def render(self) -> str:
+        """Render every metric and collector in the text exposition format."""
+        with self.lock:
+            metrics = sorted(self.metrics.values(), key=lambda metric: metric.name)
+            collectors = list(self.collectors.items())
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for key, collect in collectors:
+            try:
+                families = list(collect())
+            except Exception as e:
+                lines.append(f"# collector {key} failed: {type(e).__name__}")
+                continue
+            for name, kind, help, samples in families:
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> Path:
+        """Write render() to path (atomically replaced)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+
+# Global registry instance
+_registry = Registry()
+
+
+def get_registry() -> Registry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+# ----------------------------------------------------------------------
+# Metrics updated by the generators, validator and storage
+# ----------------------------------------------------------------------
+
+LLM_REQUEST_SECONDS = _registry.histogram(
+    "tequila_llm_request_seconds", "Wall-clock latency of LLM calls", ("model", "task", "cache_hit")
+)
+LLM_REQUESTS = _registry.counter(
+    "tequila_llm_requests_total", "LLM calls by outcome", ("model", "task", "status")
+)
+LLM_RETRIES = _registry.counter(
+    "tequila_llm_retries_total", "LLM calls that were a retry within a generator's MAX_RETRIES loop", ("task",)
+)
+LLM_TOKENS = _registry.counter(
+    "tequila_llm_tokens_total", "Tokens used by LLM calls (cache hits excluded)", ("model", "kind")
+)
+INVALID_RESPONSES = _registry.counter(
+    "tequila_invalid_responses_total", "LLM responses rejected by a generator's validation", ("field",)
+)
+WEEK_VALIDATIONS = _registry.counter(
+    "tequila_week_validations_total", "validate_week() runs by result", ("result",)
+)
+VALIDATION_ISSUES = _registry.counter(
+    "tequila_validation_issues_total", "Issues reported by validate_week()", ("severity",)
+)
+STORAGE_SECONDS = _registry.histogram(
+    "tequila_storage_seconds", "Curriculum storage operation latency", ("op", "backend")
+)
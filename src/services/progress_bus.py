@@ -0,0 +1,268 @@
+"""Thread-safe progress event bus between the generators and the WebSocket layer.
+
+Generators publish small events (week, day, phase, field, attempt, tokens,
+status). The bus coalesces bursts per (week, day, phase, field) - later
+events replace earlier ones and token counts add up - and a dispatcher thread
+delivers at most one batch per interval to subscribers. Terminal statuses
+(completed/error) are delivered without waiting out the interval.
+
+Subscribers are plain callables run on the dispatcher thread; the API bridges
+them onto its asyncio loop with run_coroutine_threadsafe(). Generation jobs
+run in child processes: with TEQUILA_PROGRESS_FD=<fd> the bus writes each
+event as a PROGRESS_LINE_PREFIX line to that inherited pipe, which the job
+queue reads and re-publishes on the server's bus. The pipe carries nothing
+else, so events never land in the middle of the CLI's print() output.
+
+Publishing is a no-op while nobody is subscribed, so CLI runs pay nothing.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Marks bus events on a child process's progress pipe
+PROGRESS_LINE_PREFIX = "@@progress "
+
+# Statuses delivered immediately instead of at the next interval
+TERMINAL_STATUSES = {"completed", "succeeded", "error", "failed", "aborted", "cancelled"}
+
+
+class ProgressBus:
+    """Coalescing, throttled publish/subscribe bus for generation progress."""
+
+    def __init__(self, interval: float = 0.25):
+        """
+        Initialize progress bus.
+
+        Args:
+            interval: Minimum seconds between deliveries of coalesced batches
+        """
+        self.interval = interval
+        self.cond = threading.Condition()
+        self._pending: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._urgent = False
+        self._subscribers: Dict[int, tuple] = {}
+        self._next_token = 1
+        self._thread: Optional[threading.Thread] = None
+        self._stop = False
+
+        self._week_started: Dict[int, float] = {}
+        self._week_tokens: Dict[int, int] = {}
+
+        self.published = 0
+        self.delivered = 0
+
+    # ------------------------------------------------------------------
+    # Subscribing
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None], weeks: Optional[Iterable[int]] = None) -> int:
+        """
+        Receive events (on the dispatcher thread).
+
+        Args:
+            callback: Called with each delivered event dict
+            weeks: Only these weeks (default: all)
+
+        Returns:
+            Token for unsubscribe()
+        """
+        with self.cond:
+            token = self._next_token
+            self._next_token += 1
+            self._subscribers[token] = (callback, set(weeks) if weeks is not None else None)
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """Stop delivering to a subscriber."""
+        with self.cond:
+            self._subscribers.pop(token, None)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def publish(
+        self,
+        week: int,
+        day: int = 0,
+        phase: str = "",
+        field: Optional[str] = None,
+        status: str = "generating",
+        attempt: int = 1,
+        tokens: int = 0,
+        message: str = "",
+        **extra: Any
+    ) -> None:
+        """
+        Publish a progress event.
+
+        Args:
+            week: Week number
+            day: Day number (0 for week-level work)
+            phase: Pipeline phase (phase0, week_spec, day_fields, document, ...)
+            field: Field or task within the phase
+            status: generating, generated, completed, error, ...
+            attempt: LLM call number within this field (retries count up)
+            tokens: Tokens used since the previous event for this field
+            message: Human readable status
+            **extra: Additional keys copied into the event
+        """
+        self.publish_event({
+            "type": "progress",
+            "week": week,
+            "day": day,
+            "phase": phase,
+            "field": field,
+            "status": status,
+            "attempt": attempt,
+            "tokens": tokens,
+            "message": message,
+            **extra
+        })
+
+    def publish_event(self, event: Dict[str, Any]) -> None:
+        """Publish a ready-made event dict (e.g. one forwarded from a child process)."""
+        with self.cond:
+            if not self._subscribers:
+                return
+            week = event.get("week", 0)
+            key = (week, event.get("day", 0), event.get("phase", ""), event.get("field"))
+            now = time.time()
+            event = dict(event)
+            event.setdefault("tokens", 0)
+
+            self._week_started.setdefault(week, now)
+            self._week_tokens[week] = self._week_tokens.get(week, 0) + event["tokens"]
+
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                event["tokens"] += previous["tokens"]
+                event["coalesced"] = previous.get("coalesced", 0) + 1
+            event["ts"] = now
+            event["elapsed_s"] = round(now - self._week_started[week], 3)
+            event["week_tokens"] = self._week_tokens[week]
+
+            self._pending[key] = event
+            self.published += 1
+            if event.get("status") in TERMINAL_STATUSES:
+                self._urgent = True
+            self.cond.notify()
+            self._ensure_thread()
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name="progress-bus", daemon=True)
+            self._thread.start()
+
+    def _take_batch(self) -> list:
+        batch = list(self._pending.values())
+        self._pending.clear()
+        self._urgent = False
+        return batch
+
+    def _run(self) -> None:
+        last_flush = 0.0
+        while True:
+            with self.cond:
+                while not self._pending and not self._stop:
+                    self.cond.wait()
+                if self._stop and not self._pending:
+                    return
+                # Throttle: let more events coalesce until the interval has passed
+                deadline = last_flush + self.interval
+                while not self._urgent and not self._stop and time.monotonic() < deadline:
+                    self.cond.wait(deadline - time.monotonic())
+                batch = self._take_batch()
+            last_flush = time.monotonic()
+            self._deliver(batch)
+
+    def _deliver(self, batch: list) -> None:
+        with self.cond:
+            subscribers = list(self._subscribers.values())
+        for event in batch:
+            for callback, weeks in subscribers:
+                if weeks is not None and event.get("week") not in weeks:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.warning(f"Progress subscriber failed: {e}")
+            self.delivered += 1
+
+    def flush(self) -> None:
+        """Deliver all pending events now, on the calling thread."""
+        with self.cond:
+            batch = self._take_batch()
+        self._deliver(batch)
+
+    def close(self) -> None:
+        """Stop the dispatcher thread after delivering what is pending."""
+        self.flush()
+        with self.cond:
+            self._stop = True
+            self.cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get published/delivered counters (published - delivered = coalesced away)."""
+        with self.cond:
+            return {
+                "published": self.published,
+                "delivered": self.delivered,
+                "pending": len(self._pending),
+                "subscribers": len(self._subscribers)
+            }
+
+
+def _pipe_writer(fd: int) -> Callable[[Dict[str, Any]], None]:
+    """Subscriber writing each event as one line to a pipe (one write() per line)."""
+    def write(event: Dict[str, Any]) -> None:
+        os.write(fd, PROGRESS_LINE_PREFIX.encode() + orjson.dumps(event) + b"\n")
+    return write
+
+
+def parse_progress_line(line: str) -> Optional[Dict[str, Any]]:
+    """Decode a PROGRESS_LINE_PREFIX line from a child process (None otherwise)."""
+    if not line.startswith(PROGRESS_LINE_PREFIX):
+        return None
+    try:
+        return orjson.loads(line[len(PROGRESS_LINE_PREFIX):])
+    except orjson.JSONDecodeError:
+        return None
+
+
+# Global bus instance
+_bus: Optional[ProgressBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_progress_bus() -> ProgressBus:
+    """Get global progress bus (forwarding to the pipe named by TEQUILA_PROGRESS_FD)."""
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            _bus = ProgressBus()
+            progress_fd = os.getenv("TEQUILA_PROGRESS_FD")
+            if progress_fd:
+                _bus.subscribe(_pipe_writer(int(progress_fd)))
+                atexit.register(_bus.flush)
+        return _bus
+
+
+def publish_progress(week: int, **kwargs: Any) -> None:
+    """Publish an event on the global bus (see ProgressBus.publish)."""
+    get_progress_bus().publish(week, **kwargs)
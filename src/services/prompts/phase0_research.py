@@ -7,14 +7,66 @@ Flow:
   CALL #0.1-0.10: Research & Planning
   CALL #0.11-0.12: Curriculum Alignment with Gold Standard
 
+Independent calls run concurrently on a small thread pool (see
+execute_phase0_research), so wall time tracks the longest dependency chain.
+
 Cost: ~$0.45-0.57 per week
-Time: ~3-5 minutes per week
+Time: ~1-2 minutes per week
 """
 
+import copy
+import hashlib
 import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Callable
 from datetime import datetime
+from threading import Lock
+
+from ..knowledge_ledger import get_knowledge_ledger
+from ..instrumented_client import InstrumentedClient
+from ..progress_bus import publish_progress
+from ..storage import get_curriculum_base, path_exists, read_json, write_json
+
+
+def _generate_json(
+    llm_client,
+    usr: str,
+    sys: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: Optional[float] = None,
+    json_mode: bool = True
+) -> dict:
+    """
+    Run one PHASE 0 call through the LLMClient and parse its JSON output.
+
+    Going through LLMClient.generate() (instead of the raw OpenAI SDK) gives
+    these calls the same retry, dry-run, budget, rate-limit and cache
+    handling as the rest of the pipeline.
+
+    Args:
+        llm_client: LLMClient instance
+        usr: User prompt
+        sys: Optional system prompt
+        model: Model override for this call (e.g. o1-mini)
+        temperature: Temperature override (ignored by reasoning models)
+        json_mode: Request response_format json_object
+
+    Returns:
+        Parsed JSON response
+    """
+    response = llm_client.generate(
+        prompt=usr,
+        system=sys,
+        model=model,
+        temperature=temperature,
+        response_format={"type": "json_object"} if json_mode else None
+    )
+
+    if response.json is not None:
+        return dict(response.json)
+    return json.loads(response.text)
 
 
 # ============================================================================
@@ -61,70 +113,54 @@ def task_backward_analysis(week_number: int, llm_client) -> dict:
     """
     CALL #0.2: Analyze all prior weeks to understand cumulative knowledge.
 
+    Cumulative vocabulary and grammar are merged locally from the knowledge
+    ledger (one delta per prior week); the model only sees a fixed-size digest
+    and supplies the qualitative fields, so prompt size stays flat across weeks.
+
     Model: GPT-4o
     Temperature: 0.2
-    Cost: ~$0.03
+    Cost: ~$0.01
 
     Args:
         week_number: Current week
-        llm_client: OpenAI client
+        llm_client: LLMClient instance
 
     Returns:
         Backward analysis with cumulative vocabulary, grammar, student state
     """
-    outline_path = Path("curriculum/curriculum_outline.json")
-
-    with open(outline_path, 'r', encoding='utf-8') as f:
-        outline = json.load(f)
-
-    # Read all prior weeks
-    prior_weeks = []
-    for i in range(1, week_number):
-        week_key = f"week_{i:02d}"
-        if week_key in outline:
-            prior_weeks.append(outline[week_key])
+    ledger = get_knowledge_ledger()
+    cumulative = ledger.cumulative_before(week_number)
+    digest = ledger.digest(week_number)
 
     # Build prompt
     sys = """You are Steel, curriculum analyst for Classical Latin.
 
-Analyze all prior weeks to determine what students know entering this new week.
+You are given a digest of what students were taught before this new week.
+Determine what students know entering the week.
 
 Return JSON with:
 {
-  "prior_weeks_reviewed": [list of week numbers],
-  "cumulative_latin_vocabulary": [
-    {"word": "salve", "week_introduced": 1, "part_of_speech": "interjection", "mastery_expected": true}
-  ],
-  "cumulative_grammar_concepts": [
-    {"concept": "Latin alphabet", "week_introduced": 1, "mastery_level": "recognition"}
-  ],
   "student_knowledge_state": "summary of what students know",
   "common_mistakes_by_now": ["mistake 1", "mistake 2"],
   "spiral_review_target_percentage": 0.25
 }"""
 
-    usr = f"""Analyze prior weeks for Week {week_number}.
+    usr = f"""Analyze prior knowledge for Week {week_number}.
 
-PRIOR WEEKS DATA:
-{json.dumps(prior_weeks, indent=2)}
+PRIOR KNOWLEDGE DIGEST:
+{json.dumps(digest, indent=2, ensure_ascii=False)}
 
 Provide complete backward analysis."""
 
-    response = llm_client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": sys},
-            {"role": "user", "content": usr}
-        ],
-        temperature=0.2,
-        response_format={"type": "json_object"}
-    )
-
-    result = json.loads(response.choices[0].message.content)
+    result = _generate_json(llm_client, usr, sys, model="gpt-4o", temperature=0.2)
+    # Locally merged facts take precedence over anything the model restated
+    result.update(cumulative)
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
         'model': 'gpt-4o',
-        'temperature': 0.2
+        'temperature': 0.2,
+        'method': 'knowledge_ledger_digest',
+        'digest_chars': len(usr)
     }
 
     return result
@@ -140,7 +176,7 @@ def task_forward_analysis(week_number: int, llm_client) -> dict:
 
     Args:
         week_number: Current week
-        llm_client: OpenAI client
+        llm_client: LLMClient instance
 
     Returns:
         Forward analysis with future dependencies
@@ -183,17 +219,7 @@ FUTURE WEEKS DATA:
 
 Provide complete forward analysis."""
 
-    response = llm_client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": sys},
-            {"role": "user", "content": usr}
-        ],
-        temperature=0.2,
-        response_format={"type": "json_object"}
-    )
-
-    result = json.loads(response.choices[0].message.content)
+    result = _generate_json(llm_client, usr, sys, model="gpt-4o", temperature=0.2)
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
         'model': 'gpt-4o',
@@ -213,7 +239,7 @@ def task_pedagogical_benchmarking(week_entry: dict, llm_client) -> dict:
 
     Args:
         week_entry: Week data from #0.1
-        llm_client: OpenAI client (must support o1-mini)
+        llm_client: LLMClient instance (o1-mini with GPT-4o fallback)
 
     Returns:
         Pedagogical research findings
@@ -252,27 +278,17 @@ Return JSON with:
 CRITICAL: This is CLASSICAL LATIN curriculum. Research should focus on Latin declensions, conjugations, cases - NOT modern languages."""
 
     try:
-        response = llm_client.chat.completions.create(
-            model="o1-mini",
-            messages=[
-                {"role": "user", "content": usr}
-            ]
-        )
-
-        result = json.loads(response.choices[0].message.content)
+        result = _generate_json(llm_client, usr, model="o1-mini", json_mode=False)
     except Exception as e:
         # Fallback to GPT-4o if o1-mini not available
         print(f"  ⚠ o1-mini not available, falling back to GPT-4o: {e}")
-        response = llm_client.chat.completions.create(
+        result = _generate_json(
+            llm_client,
+            usr,
+            "You are a classical Latin pedagogy researcher.",
             model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a classical Latin pedagogy researcher."},
-                {"role": "user", "content": usr}
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"}
+            temperature=0.3
         )
-        result = json.loads(response.choices[0].message.content)
 
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
@@ -301,7 +317,7 @@ def task_vocabulary_determination(
         backward: Backward analysis
         forward: Forward analysis
         pedagogy: Pedagogical research
-        llm_client: OpenAI client
+        llm_client: LLMClient instance
 
     Returns:
         Vocabulary plan with rationale for each word
@@ -365,25 +381,16 @@ CRITICAL CHECKS:
 - Are there ANY Spanish words? If YES, REJECT them immediately."""
 
     try:
-        response = llm_client.chat.completions.create(
-            model="o1-mini",
-            messages=[
-                {"role": "user", "content": usr}
-            ]
-        )
-        result = json.loads(response.choices[0].message.content)
+        result = _generate_json(llm_client, usr, model="o1-mini", json_mode=False)
     except Exception as e:
         print(f"  ⚠ o1-mini not available, falling back to GPT-4o: {e}")
-        response = llm_client.chat.completions.create(
+        result = _generate_json(
+            llm_client,
+            usr,
+            "You are a Classical Latin curriculum vocabulary expert.",
             model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a Classical Latin curriculum vocabulary expert."},
-                {"role": "user", "content": usr}
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"}
+            temperature=0.3
         )
-        result = json.loads(response.choices[0].message.content)
 
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
@@ -444,7 +451,7 @@ def task_virtue_faith_integration(week_entry: dict, llm_client) -> dict:
 
     Args:
         week_entry: Week data
-        llm_client: OpenAI client
+        llm_client: LLMClient instance
 
     Returns:
         Virtue/faith integration plan
@@ -476,17 +483,7 @@ Week Topic: {week_entry.get('title', '')}
 
 Provide complete integration strategy."""
 
-    response = llm_client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": sys},
-            {"role": "user", "content": usr}
-        ],
-        temperature=0.3,
-        response_format={"type": "json_object"}
-    )
-
-    result = json.loads(response.choices[0].message.content)
+    result = _generate_json(llm_client, usr, sys, model="gpt-4o", temperature=0.3)
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
         'model': 'gpt-4o',
@@ -507,7 +504,7 @@ def task_assessment_design(week_entry: dict, vocab_plan: dict, llm_client) -> di
     Args:
         week_entry: Week data
         vocab_plan: Vocabulary plan from #0.5
-        llm_client: OpenAI client
+        llm_client: LLMClient instance
 
     Returns:
         Assessment plan
@@ -535,17 +532,7 @@ Grammar Topics: {week_entry.get('grammar_topics', [])}
 
 Provide complete assessment plan."""
 
-    response = llm_client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": sys},
-            {"role": "user", "content": usr}
-        ],
-        temperature=0.25,
-        response_format={"type": "json_object"}
-    )
-
-    result = json.loads(response.choices[0].message.content)
+    result = _generate_json(llm_client, usr, sys, model="gpt-4o", temperature=0.25)
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
         'model': 'gpt-4o',
@@ -566,7 +553,7 @@ def task_differentiation_planning(week_entry: dict, vocab_plan: dict, llm_client
     Args:
         week_entry: Week data
         vocab_plan: Vocabulary plan
-        llm_client: OpenAI client
+        llm_client: LLMClient instance
 
     Returns:
         Differentiation plan
@@ -596,17 +583,7 @@ Grammar: {week_entry.get('grammar_topics', [])}
 
 Provide complete differentiation plan."""
 
-    response = llm_client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": sys},
-            {"role": "user", "content": usr}
-        ],
-        temperature=0.3,
-        response_format={"type": "json_object"}
-    )
-
-    result = json.loads(response.choices[0].message.content)
+    result = _generate_json(llm_client, usr, sys, model="gpt-4o", temperature=0.3)
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
         'model': 'gpt-4o',
@@ -674,46 +651,61 @@ def task_materials_planning(vocab_plan: dict, assessment: dict) -> dict:
 # PHASE 0.5: CURRICULUM ALIGNMENT (Calls #0.11 - #0.12)
 # ============================================================================
 
-def task_analyze_master_weeks(llm_client) -> dict:
-    """
-    CALL #0.11: Analyze gold standard Week 1 and Week 11.
+MASTER_WEEK_1_PATH = Path("/Users/elle_jansick/Desktop/Latin A/A Tier/Week 1")
+MASTER_WEEK_11_PATH = Path("/Users/elle_jansick/Desktop/Latin A/A Tier/Week 11")
 
-    Model: GPT-4o
-    Temperature: 0.2
-    Cost: ~$0.04
+# Bump when task_analyze_master_weeks' prompt changes to invalidate the stored analysis
+MASTER_ANALYSIS_VERSION = 1
 
-    Args:
-        llm_client: OpenAI client
+_master_analysis_lock = Lock()
 
-    Returns:
-        Master analysis with style patterns
-    """
-    # Read master week files
-    master_path_1 = Path("/Users/elle_jansick/Desktop/Latin A/A Tier/Week 1")
-    master_path_11 = Path("/Users/elle_jansick/Desktop/Latin A/A Tier/Week 11")
 
-    # Read sample files from each week
+def _read_master_week_samples() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Read the gold standard Week 1 and Week 11 sample files."""
     week1_samples = {}
     week11_samples = {}
 
-    if master_path_1.exists():
+    if MASTER_WEEK_1_PATH.exists():
         # Read Day 1 files from Week 1
-        day1_path = master_path_1 / "1.1"
+        day1_path = MASTER_WEEK_1_PATH / "1.1"
         if day1_path.exists():
             for file in ["01_class_name.txt", "02_summary.md", "06_document_for_sparky_vocabulary_key_document.txt"]:
                 file_path = day1_path / file
                 if file_path.exists():
                     week1_samples[file] = file_path.read_text(encoding='utf-8')
 
-    if master_path_11.exists():
+    if MASTER_WEEK_11_PATH.exists():
         # Read Day 1 files from Week 11
-        day1_path = master_path_11 / "11.1"
+        day1_path = MASTER_WEEK_11_PATH / "11.1"
         if day1_path.exists():
             for file in ["01_class_name.txt", "02_summary.md", "05_guidelines_for_sparky.json", "06_document_for_sparky_vocabulary_key_document.txt"]:
                 file_path = day1_path / file
                 if file_path.exists():
                     week11_samples[file] = file_path.read_text(encoding='utf-8')
 
+    return week1_samples, week11_samples
+
+
+def task_analyze_master_weeks(llm_client, samples: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None) -> dict:
+    """
+    CALL #0.11: Analyze gold standard Week 1 and Week 11.
+
+    Its inputs only change when the sample files do, so callers should go
+    through get_master_analysis(), which reuses a persisted result.
+
+    Model: GPT-4o
+    Temperature: 0.2
+    Cost: ~$0.04
+
+    Args:
+        llm_client: LLMClient instance
+        samples: Pre-read (week1, week11) samples; read from disk if omitted
+
+    Returns:
+        Master analysis with style patterns
+    """
+    week1_samples, week11_samples = samples if samples is not None else _read_master_week_samples()
+
     sys = """You are Steel, analyzing GOLD STANDARD curriculum examples.
 
 Extract patterns from these perfect examples for STYLE, FORMAT, TONE, STRUCTURE.
@@ -744,17 +736,7 @@ MASTER WEEK 11 SAMPLES:
 
 Analyze and extract the patterns."""
 
-    response = llm_client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": sys},
-            {"role": "user", "content": usr}
-        ],
-        temperature=0.2,
-        response_format={"type": "json_object"}
-    )
-
-    result = json.loads(response.choices[0].message.content)
+    result = _generate_json(llm_client, usr, sys, model="gpt-4o", temperature=0.2)
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
         'model': 'gpt-4o',
@@ -764,6 +746,61 @@ Analyze and extract the patterns."""
     return result
 
 
+def get_master_analysis_path() -> Path:
+    """Get the persisted master-week analysis artifact path."""
+    return get_curriculum_base() / "master_analysis.json"
+
+
+def _master_samples_hash(samples: Tuple[Dict[str, str], Dict[str, str]]) -> str:
+    """Hash the sample files (and prompt version) the analysis depends on."""
+    payload = json.dumps(
+        {"week1": samples[0], "week11": samples[1], "prompt_version": MASTER_ANALYSIS_VERSION},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_master_analysis(llm_client, force: bool = False) -> dict:
+    """
+    Return the gold standard analysis, computing it only when the samples change.
+
+    The result is persisted to curriculum/LatinA/master_analysis.json keyed by
+    the hash of the sample files, so one GPT-4o call serves every week of a
+    run (and later runs) until the corpus changes.
+
+    Args:
+        llm_client: LLMClient instance (only used on a cache miss)
+        force: Recompute even if the stored analysis is current
+
+    Returns:
+        Master analysis with style patterns
+    """
+    samples = _read_master_week_samples()
+    samples_hash = _master_samples_hash(samples)
+    artifact_path = get_master_analysis_path()
+
+    # Serialize so concurrent weeks don't all pay for the same miss
+    with _master_analysis_lock:
+        if not force and path_exists(artifact_path):
+            try:
+                artifact = read_json(artifact_path)
+            except Exception:
+                artifact = {}
+            if artifact.get("samples_hash") == samples_hash and artifact.get("analysis"):
+                analysis = artifact["analysis"]
+                analysis.setdefault("_metadata", {})["reused_from"] = str(artifact_path)
+                return analysis
+
+        analysis = task_analyze_master_weeks(llm_client, samples)
+        write_json(artifact_path, {
+            "samples_hash": samples_hash,
+            "created_at": datetime.now().isoformat(),
+            "analysis": analysis
+        })
+        return copy.deepcopy(analysis)
+
+
 def task_align_research_to_masters(
     research_plan: dict,
     master_analysis: dict,
@@ -781,7 +818,7 @@ def task_align_research_to_masters(
         research_plan: All research from #0.1-#0.10
         master_analysis: Style guide from #0.11
         week_number: Current week
-        llm_client: OpenAI client
+        llm_client: LLMClient instance
 
     Returns:
         Alignment guide for generation
@@ -823,25 +860,16 @@ Return JSON with:
 }}"""
 
     try:
-        response = llm_client.chat.completions.create(
-            model="o1-mini",
-            messages=[
-                {"role": "user", "content": usr}
-            ]
-        )
-        result = json.loads(response.choices[0].message.content)
+        result = _generate_json(llm_client, usr, model="o1-mini", json_mode=False)
     except Exception as e:
         print(f"  ⚠ o1-mini not available, falling back to GPT-4o: {e}")
-        response = llm_client.chat.completions.create(
+        result = _generate_json(
+            llm_client,
+            usr,
+            "You are Steel, aligning research with style guides.",
             model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are Steel, aligning research with style guides."},
-                {"role": "user", "content": usr}
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"}
+            temperature=0.3
         )
-        result = json.loads(response.choices[0].message.content)
 
     result['_metadata'] = {
         'generated_at': datetime.now().isoformat(),
@@ -855,85 +883,230 @@ Return JSON with:
 # PHASE 0 ORCHESTRATOR
 # ============================================================================
 
-def execute_phase0_research(week_number: int, llm_client) -> dict:
+# Concurrent LLM calls per week; the dependency graph is at most 5 wide
+PHASE0_MAX_WORKERS = 5
+
+
+def _run_task_graph(
+    tasks: Dict[str, Tuple[List[str], Callable[[Dict[str, Any]], Any], str]],
+    max_workers: int = PHASE0_MAX_WORKERS,
+    on_progress: Optional[Callable[[str, str], None]] = None
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
     """
-    Execute complete PHASE 0 research cascade.
+    Run a dependency graph of tasks on a bounded thread pool.
+
+    Each task starts as soon as all of its dependencies have finished. The
+    first task to raise cancels everything not yet started and the error is
+    re-raised, matching the behavior of the old serial cascade.
 
     Args:
-        week_number: Week to research
-        llm_client: OpenAI client
+        tasks: name -> (dependency names, fn(results) -> output, progress label)
+        max_workers: Maximum tasks running at once
+        on_progress: Called with (task name, status) as tasks start and finish
 
     Returns:
-        Complete research plan with all 12 outputs
+        (results by task name, wall-clock seconds by task name)
     """
-    print(f"\n  === PHASE 0: Research & Planning ===")
+    for name, (deps, _, _) in tasks.items():
+        unknown = [d for d in deps if d not in tasks]
+        if unknown:
+            raise ValueError(f"Task '{name}' depends on unknown tasks: {unknown}")
+
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    pending = dict(tasks)
+    running: Dict[Future, str] = {}
+
+    def timed(name: str, fn: Callable[[Dict[str, Any]], Any], label: str) -> Any:
+        print(f"    ⏺ {label}")
+        report = on_progress or (lambda task, status: None)
+        report(name, "generating")
+        started = time.perf_counter()
+        try:
+            output = fn(results)
+        except Exception:
+            report(name, "error")
+            raise
+        finally:
+            timings[name] = round(time.perf_counter() - started, 3)
+        report(name, "completed")
+        return output
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="phase0") as pool:
+        while pending or running:
+            ready = [
+                name for name, (deps, _, _) in pending.items()
+                if all(d in results for d in deps)
+            ]
+            for name in ready:
+                _, fn, label = pending.pop(name)
+                running[pool.submit(timed, name, fn, label)] = name
 
-    # CALL #0.1
-    print(f"    ⏺ Reading curriculum outline (Week {week_number})...")
-    week_entry = task_locate_week_entry(week_number)
+            if not running:
+                raise ValueError(f"Dependency cycle among tasks: {sorted(pending)}")
 
-    # CALL #0.2
-    print(f"    ⏺ Analyzing prior knowledge (Weeks 1-{week_number-1})...")
-    backward = task_backward_analysis(week_number, llm_client)
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception:
+                    for other in running:
+                        other.cancel()
+                    raise
 
-    # CALL #0.3
-    print(f"    ⏺ Previewing future dependencies (Weeks {week_number+1}-{week_number+5})...")
-    forward = task_forward_analysis(week_number, llm_client)
+    return results, timings
 
-    # CALL #0.4
-    print(f"    ⏺ Researching classical pedagogy (o1-mini)...")
-    pedagogy = task_pedagogical_benchmarking(week_entry, llm_client)
 
-    # CALL #0.5
-    print(f"    ⏺ Determining vocabulary (o1-mini)...")
-    vocab = task_vocabulary_determination(week_entry, backward, forward, pedagogy, llm_client)
+def execute_phase0_research(week_number: int, llm_client, max_workers: int = PHASE0_MAX_WORKERS) -> dict:
+    """
+    Execute complete PHASE 0 research cascade.
 
-    # CALL #0.6
-    print(f"    ⏺ Calculating session duration...")
-    duration = task_session_duration_calculation(week_number)
+    Independent calls run concurrently; only vocabulary, assessment,
+    differentiation, materials and alignment wait on earlier outputs, so
+    wall-clock time follows the critical path
+    (pedagogy -> vocabulary -> assessment -> alignment) rather than the sum
+    of all calls. Each output's _metadata records its wall_time_s.
 
-    # CALL #0.7
-    print(f"    ⏺ Planning virtue/faith integration...")
-    virtue = task_virtue_faith_integration(week_entry, llm_client)
+    Args:
+        week_number: Week to research
+        llm_client: LLMClient instance
+        max_workers: Maximum concurrent research calls
 
-    # CALL #0.8
-    print(f"    ⏺ Designing assessment strategy...")
-    assessment = task_assessment_design(week_entry, vocab, llm_client)
+    Returns:
+        Complete research plan with all 12 outputs
+    """
+    print(f"\n  === PHASE 0: Research & Planning (up to {max_workers} concurrent calls) ===")
+    phase_started = time.perf_counter()
+
+    def client_for(name: str, task: str):
+        """Attribute a research task's LLM calls to it."""
+        return InstrumentedClient(llm_client, week_number, 0, "phase0", name, task)
+
+    def report(task: str, status: str) -> None:
+        publish_progress(week_number, phase="phase0", field=task, status=status)
+
+    # name -> (dependencies, fn(results), progress label)
+    tasks = {
+        # CALL #0.1
+        "00_week_entry": (
+            [],
+            lambda r: task_locate_week_entry(week_number),
+            f"Reading curriculum outline (Week {week_number})..."
+        ),
+        # CALL #0.2
+        "01_backward_analysis": (
+            [],
+            lambda r: task_backward_analysis(
+                week_number,
+                client_for("01_backward_analysis", "task_backward_analysis")
+            ),
+            f"Analyzing prior knowledge (Weeks 1-{week_number-1})..."
+        ),
+        # CALL #0.3
+        "02_forward_analysis": (
+            [],
+            lambda r: task_forward_analysis(
+                week_number,
+                client_for("02_forward_analysis", "task_forward_analysis")
+            ),
+            f"Previewing future dependencies (Weeks {week_number+1}-{week_number+5})..."
+        ),
+        # CALL #0.4
+        "03_pedagogical_research": (
+            ["00_week_entry"],
+            lambda r: task_pedagogical_benchmarking(
+                r["00_week_entry"],
+                client_for("03_pedagogical_research", "task_pedagogical_benchmarking")
+            ),
+            "Researching classical pedagogy (o1-mini)..."
+        ),
+        # CALL #0.5
+        "04_vocabulary_plan": (
+            ["00_week_entry", "01_backward_analysis", "02_forward_analysis", "03_pedagogical_research"],
+            lambda r: task_vocabulary_determination(
+                r["00_week_entry"],
+                r["01_backward_analysis"],
+                r["02_forward_analysis"],
+                r["03_pedagogical_research"],
+                client_for("04_vocabulary_plan", "task_vocabulary_determination")
+            ),
+            "Determining vocabulary (o1-mini)..."
+        ),
+        # CALL #0.6
+        "05_session_duration": (
+            [],
+            lambda r: task_session_duration_calculation(week_number),
+            "Calculating session duration..."
+        ),
+        # CALL #0.7
+        "06_virtue_faith_strategy": (
+            ["00_week_entry"],
+            lambda r: task_virtue_faith_integration(
+                r["00_week_entry"],
+                client_for("06_virtue_faith_strategy", "task_virtue_faith_integration")
+            ),
+            "Planning virtue/faith integration..."
+        ),
+        # CALL #0.8
+        "07_assessment_plan": (
+            ["00_week_entry", "04_vocabulary_plan"],
+            lambda r: task_assessment_design(
+                r["00_week_entry"],
+                r["04_vocabulary_plan"],
+                client_for("07_assessment_plan", "task_assessment_design")
+            ),
+            "Designing assessment strategy..."
+        ),
+        # CALL #0.9
+        "08_differentiation_plan": (
+            ["00_week_entry", "04_vocabulary_plan"],
+            lambda r: task_differentiation_planning(
+                r["00_week_entry"],
+                r["04_vocabulary_plan"],
+                client_for("08_differentiation_plan", "task_differentiation_planning")
+            ),
+            "Planning differentiation..."
+        ),
+        # CALL #0.10
+        "09_materials_list": (
+            ["04_vocabulary_plan", "07_assessment_plan"],
+            lambda r: task_materials_planning(r["04_vocabulary_plan"], r["07_assessment_plan"]),
+            "Planning materials..."
+        ),
+        # CALL #0.11 (PHASE 0.5: Curriculum Alignment)
+        "10_master_analysis": (
+            [],
+            lambda r: get_master_analysis(
+                client_for("10_master_analysis", "task_analyze_master_weeks")
+            ),
+            "Analyzing gold standard weeks..."
+        ),
+    }
 
-    # CALL #0.9
-    print(f"    ⏺ Planning differentiation...")
-    differentiation = task_differentiation_planning(week_entry, vocab, llm_client)
+    results, timings = _run_task_graph(tasks, max_workers=max_workers, on_progress=report)
 
-    # CALL #0.10
-    print(f"    ⏺ Planning materials...")
-    materials = task_materials_planning(vocab, assessment)
+    # Compile research plan (same key order as the serial cascade)
+    research_plan = {name: results[name] for name in tasks}
 
+    # CALL #0.12 needs every prior output
     print(f"\n  === PHASE 0.5: Curriculum Alignment ===")
-
-    # CALL #0.11
-    print(f"    ⏺ Analyzing gold standard weeks...")
-    master_analysis = task_analyze_master_weeks(llm_client)
-
-    # Compile research plan
-    research_plan = {
-        "00_week_entry": week_entry,
-        "01_backward_analysis": backward,
-        "02_forward_analysis": forward,
-        "03_pedagogical_research": pedagogy,
-        "04_vocabulary_plan": vocab,
-        "05_session_duration": duration,
-        "06_virtue_faith_strategy": virtue,
-        "07_assessment_plan": assessment,
-        "08_differentiation_plan": differentiation,
-        "09_materials_list": materials,
-        "10_master_analysis": master_analysis
-    }
-
-    # CALL #0.12
     print(f"    ⏺ Aligning research to style (o1-mini)...")
-    alignment = task_align_research_to_masters(research_plan, master_analysis, week_number, llm_client)
+    started = time.perf_counter()
+    alignment = task_align_research_to_masters(
+        research_plan, research_plan["10_master_analysis"], week_number,
+        client_for("11_alignment_guide", "task_align_research_to_masters")
+    )
+    timings["11_alignment_guide"] = round(time.perf_counter() - started, 3)
     research_plan["11_alignment_guide"] = alignment
 
-    print(f"    ✓ PHASE 0 complete ({12} API calls)")
+    for name, seconds in timings.items():
+        output = research_plan.get(name)
+        if isinstance(output, dict):
+            output.setdefault("_metadata", {})["wall_time_s"] = seconds
+
+    elapsed = time.perf_counter() - phase_started
+    print(f"    ✓ PHASE 0 complete ({12} API calls, {elapsed:.1f}s wall, "
+          f"{sum(timings.values()):.1f}s summed)")
 
     return research_plan
@@ -0,0 +1,255 @@
+"""Process-wide token-bucket rate limiter for OpenAI requests.
+
+Every LLM request (OpenAIClient and AsyncOpenAIClient, which PHASE 0 also
+goes through) reserves one request from the model's RPM bucket and an estimate of its tokens
+from the model's TPM bucket before it is sent. Callers block until capacity is
+available instead of failing with 429s. Once the response arrives the token
+reservation is reconciled with the real ``usage`` numbers, so the estimate
+error does not accumulate.
+
+Limits are configured per model in Settings.LLM_RATE_LIMITS, e.g.
+``{"gpt-4o": {"rpm": 500, "tpm": 30000}}``. Models without an entry are not
+limited. Versioned model names ("gpt-4o-2024-08-06") use the longest
+configured prefix.
+
+The buckets live in one process. Generation jobs started by the API each run
+in their own child process, so the job queue sets RATE_LIMIT_SHARE_ENV to the
+number of jobs it runs at once and every child takes that fraction of each
+limit; together they stay under the configured RPM/TPM.
+"""
+import logging
+import os
+import time
+from threading import Condition, Lock
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Set in a child process to the number of processes splitting the limits
+RATE_LIMIT_SHARE_ENV = "TEQUILA_RATE_LIMIT_SHARE"
+
+# Rough tokens-per-character ratio for English/Latin prompts (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(messages: Iterable[Dict[str, Any]]) -> int:
+    """Estimate prompt tokens for a list of chat messages."""
+    total = 0
+    for message in messages:
+        content = message.get("content") or ""
+        # ~4 tokens of per-message overhead in the chat format
+        total += len(str(content)) // CHARS_PER_TOKEN + 4
+    return total + 2
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at limit_per_minute / 60 per second."""
+
+    def __init__(self, limit_per_minute: float):
+        """
+        Initialize token bucket.
+
+        Args:
+            limit_per_minute: Bucket capacity and per-minute refill amount
+        """
+        if limit_per_minute <= 0:
+            raise ValueError("limit_per_minute must be > 0")
+
+        self.capacity = float(limit_per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self.cond = Condition(Lock())
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount: float) -> float:
+        """
+        Take amount from the bucket, blocking until it is available.
+
+        Requests larger than the capacity are clamped to it so they can
+        eventually proceed.
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        with self.cond:
+            while True:
+                self._refill()
+                if self.level >= amount:
+                    self.level -= amount
+                    return waited
+                delay = (amount - self.level) / self.rate
+                started = time.monotonic()
+                self.cond.wait(timeout=delay)
+                waited += time.monotonic() - started
+
+    def adjust(self, amount: float):
+        """
+        Charge (positive) or refund (negative) amount after the fact.
+
+        The level may go negative, which delays later callers until the
+        overdraft has been paid back.
+        """
+        with self.cond:
+            self._refill()
+            self.level = min(self.capacity, self.level - amount)
+            if amount < 0:
+                self.cond.notify_all()
+
+
+class Reservation:
+    """Capacity reserved for one request; reconcile() it with the real usage."""
+
+    def __init__(self, tpm_bucket: Optional[TokenBucket], reserved_tokens: int, waited_s: float):
+        self.tpm_bucket = tpm_bucket
+        self.reserved_tokens = reserved_tokens
+        self.waited_s = waited_s
+        self._reconciled = False
+
+    def reconcile(self, actual_tokens: Optional[int]):
+        """
+        Replace the token estimate with the actual usage.
+
+        Args:
+            actual_tokens: prompt_tokens + completion_tokens from the response,
+                           or None if unknown (keeps the estimate)
+        """
+        if self._reconciled or self.tpm_bucket is None or actual_tokens is None:
+            self._reconciled = True
+            return
+        self._reconciled = True
+        self.tpm_bucket.adjust(actual_tokens - self.reserved_tokens)
+
+
+class RateLimiter:
+    """Per-model RPM/TPM limiter shared by every LLM caller in the process."""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, int]]] = None, share: int = 1):
+        """
+        Initialize rate limiter.
+
+        Args:
+            limits: Model name -> {"rpm": int, "tpm": int}. Missing or zero
+                    values disable that limit.
+            share: Processes splitting the limits; this one gets 1/share of each
+        """
+        share = max(1, share)
+        self.limits = {
+            model: {name: value / share for name, value in config.items()}
+            for model, config in (limits or {}).items()
+        }
+        self.lock = Lock()
+        self._buckets: Dict[str, Dict[str, Optional[TokenBucket]]] = {}
+
+        self.requests = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self.estimate_error_tokens = 0
+
+    def _limit_key(self, model: str) -> Optional[str]:
+        if model in self.limits:
+            return model
+        prefixes = [name for name in self.limits if model.startswith(name)]
+        return max(prefixes, key=len) if prefixes else None
+
+    def _buckets_for(self, model: str) -> Dict[str, Optional[TokenBucket]]:
+        key = self._limit_key(model)
+        if key is None:
+            return {"rpm": None, "tpm": None}
+        with self.lock:
+            if key not in self._buckets:
+                config = self.limits[key]
+                self._buckets[key] = {
+                    "rpm": TokenBucket(config["rpm"]) if config.get("rpm") else None,
+                    "tpm": TokenBucket(config["tpm"]) if config.get("tpm") else None,
+                }
+            return self._buckets[key]
+
+    def acquire(self, model: str, estimated_tokens: int) -> Reservation:
+        """
+        Block until model has room for one request of estimated_tokens.
+
+        Args:
+            model: Model the request is sent to
+            estimated_tokens: Prompt estimate plus expected completion tokens
+
+        Returns:
+            Reservation to reconcile once the response's usage is known
+        """
+        buckets = self._buckets_for(model)
+        waited = 0.0
+        if buckets["rpm"] is not None:
+            waited += buckets["rpm"].acquire(1)
+        if buckets["tpm"] is not None:
+            # Oversized requests are clamped to the bucket capacity
+            estimated_tokens = min(estimated_tokens, int(buckets["tpm"].capacity))
+            waited += buckets["tpm"].acquire(estimated_tokens)
+
+        with self.lock:
+            self.requests += 1
+            if waited > 0.001:
+                self.throttled += 1
+                self.wait_seconds += waited
+        if waited > 1:
+            logger.info(f"Rate limiter held {model} request for {waited:.1f}s")
+
+        return Reservation(buckets["tpm"], estimated_tokens, waited)
+
+    def reconcile(self, reservation: Reservation, actual_tokens: Optional[int]):
+        """Reconcile a reservation and record the estimate error."""
+        if actual_tokens is not None and not reservation._reconciled:
+            with self.lock:
+                self.estimate_error_tokens += actual_tokens - reservation.reserved_tokens
+        reservation.reconcile(actual_tokens)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, throttling and wait-time counters."""
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "estimate_error_tokens": self.estimate_error_tokens,
+            }
+
+
+def usage_tokens(response: Any) -> Optional[int]:
+    """Total tokens reported by a chat completion, or None if absent."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    prompt = getattr(usage, "prompt_tokens", None)
+    completion = getattr(usage, "completion_tokens", None) or 0
+    return None if prompt is None else prompt + completion
+
+
+def request_token_estimate(request: Dict[str, Any], default_max_tokens: int = 0) -> int:
+    """Estimate the TPM cost of a chat.completions.create() request."""
+    completion = (
+        request.get("max_tokens")
+        or request.get("max_completion_tokens")
+        or default_max_tokens
+    )
+    return estimate_tokens(request.get("messages", [])) + int(completion)
+
+
+# Global limiter instance
+_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get global rate limiter instance (configured from settings)."""
+    global _limiter
+    if _limiter is None:
+        from ..config import settings
+        _limiter = RateLimiter(
+            settings.LLM_RATE_LIMITS if settings.LLM_RATE_LIMIT_ENABLED else {},
+            share=int(os.getenv(RATE_LIMIT_SHARE_ENV, "1"))
+        )
+    return _limiter
@@ -1,7 +1,19 @@
 """Storage service for curriculum file operations."""
 import json
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from threading import Lock
+from typing import Callable, Dict, Any, Iterator, Optional, List
+
+import orjson
+
+from .metrics import STORAGE_SECONDS, get_registry
+from .storage_backends import FilesystemBackend, SQLiteBackend, StorageBackend
+
+logger = logging.getLogger(__name__)
 
 
 # Field names for Day activities (Flint fields) - 7-field architecture
@@ -138,31 +150,249 @@ def role_context_part_path(week_number: int, part_name: str) -> Path:
     return role_context_dir(week_number) / part_name
 
 
+# Active storage backend (see storage_backends.py)
+_backend: Optional[StorageBackend] = None
+_backend_lock = Lock()
+
+# Used for paths outside the curriculum base (logs, exports) whatever the backend
+_local_files = FilesystemBackend(lambda: get_curriculum_base())
+
+
+def get_storage_backend() -> StorageBackend:
+    """Get the configured storage backend (Settings.STORAGE_BACKEND)."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            from ..config import settings
+            if settings.STORAGE_BACKEND == "sqlite":
+                db_path = settings.STORAGE_DB_PATH or get_curriculum_base() / "curriculum.sqlite"
+                _backend = SQLiteBackend(db_path, lambda: get_curriculum_base())
+            elif settings.STORAGE_BACKEND == "filesystem":
+                _backend = _local_files
+            else:
+                raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
+        return _backend
+
+
+def set_storage_backend(backend: Optional[StorageBackend]) -> None:
+    """Replace the storage backend (None reverts to the configured one)."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+def _backend_for(path: Path) -> StorageBackend:
+    backend = get_storage_backend()
+    if backend is _local_files or Path(path).is_relative_to(get_curriculum_base()):
+        return backend
+    return _local_files
+
+
+# Callbacks told about every committed write (e.g. the curriculum index)
+_write_listeners: List[Callable[[List[Path]], None]] = []
+
+
+def add_write_listener(callback: Callable[[List[Path]], None]) -> None:
+    """Call callback(paths) after every write_file()/write_json() or batch commit."""
+    if callback not in _write_listeners:
+        _write_listeners.append(callback)
+
+
+def remove_write_listener(callback: Callable[[List[Path]], None]) -> None:
+    """Stop notifying callback about writes."""
+    if callback in _write_listeners:
+        _write_listeners.remove(callback)
+
+
+def _notify_writes(paths: List[Path]) -> None:
+    for callback in list(_write_listeners):
+        try:
+            callback(paths)
+        except Exception as e:
+            logger.warning(f"Write listener failed: {e}")
+
+
+def get_read_cache_stats() -> Dict[str, Any]:
+    """Get hit/miss counters and size of the storage read cache."""
+    return _local_files.read_cache.get_stats()
+
+
+def clear_read_cache() -> None:
+    """Drop all cached file contents and reset the counters."""
+    _local_files.read_cache.clear()
+
+
+def _collect_read_cache_metrics():
+    stats = get_read_cache_stats()
+    return [
+        ("tequila_storage_read_cache_lookups_total", "counter", "Storage read cache lookups by result",
+         [({"result": "hit"}, stats["hits"]), ({"result": "miss"}, stats["misses"])]),
+        ("tequila_storage_read_cache_bytes", "gauge", "Bytes held by the storage read cache",
+         [({}, stats["size_bytes"])]),
+    ]
+
+
+get_registry().add_collector("storage_read_cache", _collect_read_cache_metrics)
+
+
+class WriteBatch:
+    """Curriculum writes held back until the enclosing atomic_batch() exits."""
+
+    def __init__(self):
+        self.pending: "OrderedDict[Path, bytes]" = OrderedDict()
+
+    def stage(self, path: Path, data: bytes) -> None:
+        """Record data as the new content of path."""
+        self.pending[path] = data
+
+    def staged_bytes(self, path: Path) -> Optional[bytes]:
+        """Content this batch will write to path, if any."""
+        return self.pending.get(path)
+
+    def commit(self) -> List[Path]:
+        """Hand every staged write to the backend as one commit."""
+        committed = list(self.pending)
+        backend = get_storage_backend()
+        with STORAGE_SECONDS.time(op="commit", backend=backend.name):
+            backend.write_many(dict(self.pending))
+        self.pending.clear()
+        _notify_writes(committed)
+        return committed
+
+    def rollback(self) -> None:
+        """Discard all staged writes."""
+        self.pending.clear()
+
+
+_batch_state = threading.local()
+
+
+def _current_batch() -> Optional[WriteBatch]:
+    return getattr(_batch_state, "batch", None)
+
+
+@contextmanager
+def atomic_batch() -> Iterator[WriteBatch]:
+    """
+    Group write_file()/write_json() calls in this thread into one atomic commit.
+
+    On the filesystem backend the files are staged under
+    <curriculum>/.staging/, fsynced in one pass and renamed into place; on
+    SQLite they are written in one transaction. Nested batches join the
+    outermost one. Only paths under the curriculum base are staged. Inside
+    the batch, read_file() and read_json() see staged content, but
+    path_exists() does not.
+
+    Example:
+        with atomic_batch():
+            write_file(day_field_path(1, 1, "01_class_name.txt"), "...")
+            write_json(day_field_path(1, 1, "04_role_context.json"), {...})
+    """
+    batch = _current_batch()
+    if batch is not None:
+        yield batch
+        return
+
+    batch = WriteBatch()
+    _batch_state.batch = batch
+    try:
+        yield batch
+    except BaseException:
+        batch.rollback()
+        raise
+    else:
+        batch.commit()
+    finally:
+        _batch_state.batch = None
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    batch = _current_batch()
+    # Only curriculum files are batched; logs etc. outside the tree are written immediately
+    if batch is not None and path.is_relative_to(get_curriculum_base()):
+        batch.stage(path, data)
+        return
+    backend = _backend_for(path)
+    with STORAGE_SECONDS.time(op="write", backend=backend.name):
+        backend.write_bytes(path, data)
+    _notify_writes([path])
+
+
+def _read_bytes(path: Path) -> bytes:
+    batch = _current_batch()
+    staged = batch.staged_bytes(path) if batch is not None else None
+    if staged is not None:
+        return staged
+    backend = _backend_for(path)
+    with STORAGE_SECONDS.time(op="read", backend=backend.name):
+        return backend.read_bytes(path)
+
+
+def path_exists(path: Path) -> bool:
+    """True if path is a stored file or a directory containing stored files."""
+    return _backend_for(path).exists(path)
+
+
+def file_size(path: Path) -> int:
+    """Size of a stored file in bytes."""
+    return _backend_for(path).size(path)
+
+
 def read_file(path: Path) -> str:
-    """Read text content from a file."""
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
-    return path.read_text(encoding="utf-8")
+    """Read text content from a file (served from the read cache when unchanged)."""
+    return _read_bytes(path).decode("utf-8")
 
 
 def write_file(path: Path, content: str) -> None:
-    """Write text content to a file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    """Write text content to a file atomically (staged if inside atomic_batch())."""
+    _write_bytes(path, content.encode("utf-8"))
 
 
 def read_json(path: Path) -> Dict[str, Any]:
-    """Read and parse JSON from a file."""
-    content = read_file(path)
-    return json.loads(content)
+    """Read and parse JSON from a file (served from the read cache when unchanged)."""
+    return orjson.loads(_read_bytes(path))
 
 
 def write_json(path: Path, data: Dict[str, Any]) -> None:
-    """Write JSON data to a file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    """Write JSON data to a file atomically (staged if inside atomic_batch())."""
+    content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    _write_bytes(path, content.encode("utf-8"))
+
+
+def _write_json_if_changed(path: Path, data: Dict[str, Any]) -> bool:
+    """
+    write_json() unless path already holds exactly that content.
+
+    Keeps derived files (compiled specs) at their old mtime when nothing
+    changed, so incremental exports and the curriculum index skip them.
+
+    Returns:
+        True if the file was written
+    """
+    content = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    try:
+        if _read_bytes(path) == content:
+            return False
+    except FileNotFoundError:
+        pass
+    _write_bytes(path, content)
+    return True
+
+
+def materialize_week(week_number: int) -> Path:
+    """
+    Make sure a week exists as regular files under week_dir().
+
+    A no-op on the filesystem backend; the SQLite backend writes the week's
+    rows out in the usual directory layout (for exports and file tooling).
+
+    Returns:
+        week_dir(week_number)
+    """
+    backend = get_storage_backend()
+    if isinstance(backend, SQLiteBackend):
+        backend.materialize(get_curriculum_base(), week=week_number)
+    return week_dir(week_number)
 
 
 def detect_day_layout(week_number: int, day_number: int) -> str:
@@ -173,18 +403,25 @@ def detect_day_layout(week_number: int, day_number: int) -> str:
         "7field" if 04_role_context.json exists, else "6field"
     """
     role_context_path = day_field_path(week_number, day_number, "04_role_context.json")
-    if role_context_path.exists():
+    if path_exists(role_context_path):
         return "7field"
 
     # Check for legacy 04_guidelines_for_sparky.md
     legacy_guidelines = day_field_path(week_number, day_number, "04_guidelines_for_sparky.md")
-    if legacy_guidelines.exists():
+    if path_exists(legacy_guidelines):
         return "6field"
 
     # Default to 7-field for new scaffolding
     return "7field"
 
 
+def day_layout_from_files(files: Dict[str, Any]) -> str:
+    """detect_day_layout() for a day already loaded with read_day()."""
+    if "04_role_context.json" in files or "04_guidelines_for_sparky.md" not in files:
+        return "7field"
+    return "6field"
+
+
 def get_day_fields(week_number: int, day_number: int) -> List[str]:
     """
     Get the appropriate field list (6 or 7 fields) based on detected layout.
@@ -204,12 +441,12 @@ def read_role_context(week_number: int, day_number: int) -> Optional[Dict[str, A
         role_context dict or None if not found.
     """
     role_context_path = day_field_path(week_number, day_number, "04_role_context.json")
-    if role_context_path.exists():
+    if path_exists(role_context_path):
         return read_json(role_context_path)
 
     # Fallback: derive from week-level Role_Context
     week_rc_path = role_context_part_path(week_number, "identity.json")
-    if week_rc_path.exists():
+    if path_exists(week_rc_path):
         identity = read_json(week_rc_path)
         return {
             "sparky_role": identity.get("character_name", "Sparky"),
@@ -228,37 +465,38 @@ def compile_day_flint_bundle(week_number: int, day_number: int) -> Dict[str, Any
     Returns a dictionary with field names as keys and their content as values.
 
     Backward compatible: automatically detects and reads 6-field or 7-field layouts.
+    The day is loaded with one backend read_day() call (a single query on SQLite).
     """
-    bundle = {}
-    fields = get_day_fields(week_number, day_number)
+    files = get_storage_backend().read_day(week_number, day_number)
+    fields = DAY_FIELDS if day_layout_from_files(files) == "7field" else LEGACY_DAY_FIELDS
 
+    bundle = {}
     for field in fields:
         # Special handling for 06_document_for_sparky/ directory
         if field == "06_document_for_sparky/":
-            doc_dir = document_for_sparky_dir(week_number, day_number)
-            if doc_dir.exists():
+            doc_prefix = "06_document_for_sparky/"
+            if any(name.startswith(doc_prefix) for name in files):
                 doc_bundle = {}
                 for doc_file in DOCUMENT_FOR_SPARKY_FILES:
-                    doc_file_path = document_for_sparky_file_path(week_number, day_number, doc_file)
-                    if doc_file_path.exists():
-                        doc_bundle[doc_file.replace(".txt", "")] = read_file(doc_file_path)
-                    else:
-                        doc_bundle[doc_file.replace(".txt", "")] = None
+                    content = files.get(doc_prefix + doc_file)
+                    doc_bundle[doc_file.replace(".txt", "")] = (
+                        content.decode("utf-8") if content is not None else None
+                    )
                 bundle["06_document_for_sparky"] = doc_bundle
             else:
                 bundle["06_document_for_sparky"] = None
             continue
 
-        field_path = day_field_path(week_number, day_number, field)
-        if not field_path.exists():
+        content = files.get(field)
+        if content is None:
             bundle[field] = None
             continue
 
         # Read based on file extension
         if field.endswith(".json"):
-            bundle[field] = read_json(field_path)
+            bundle[field] = orjson.loads(content)
         else:
-            bundle[field] = read_file(field_path)
+            bundle[field] = content.decode("utf-8")
 
     return bundle
 
@@ -273,7 +511,7 @@ def compile_week_spec(week_number: int) -> Dict[str, Any]:
 
     for part in WEEK_SPEC_PARTS:
         part_path = week_spec_part_path(week_number, part)
-        if not part_path.exists():
+        if not path_exists(part_path):
             spec[part] = None
             continue
 
@@ -296,7 +534,7 @@ def compile_role_context(week_number: int) -> Dict[str, Any]:
 
     for part in ROLE_CONTEXT_PARTS:
         part_path = role_context_part_path(week_number, part)
-        if not part_path.exists():
+        if not path_exists(part_path):
             context[part] = None
             continue
 
@@ -314,7 +552,7 @@ def save_compiled_week_spec(week_number: int) -> Path:
     """
     spec = compile_week_spec(week_number)
     compiled_path = week_spec_part_path(week_number, "99_compiled_week_spec.json")
-    write_json(compiled_path, spec)
+    _write_json_if_changed(compiled_path, spec)
     return compiled_path
 
 
@@ -326,5 +564,5 @@ def save_compiled_role_context(week_number: int) -> Path:
     """
     context = compile_role_context(week_number)
     compiled_path = role_context_part_path(week_number, "99_compiled_role_context.json")
-    write_json(compiled_path, context)
+    _write_json_if_changed(compiled_path, context)
     return compiled_path
@@ -0,0 +1,512 @@
+"""Storage backends behind the curriculum path helpers in storage.py.
+
+Every artifact is addressed by the Path the helpers in storage.py build
+(week_dir(), day_field_path(), internal_doc_path(), ...). A backend decides
+where the bytes actually live:
+
+- FilesystemBackend: the classic directory tree under curriculum/LatinA/
+  (atomic renames, mtime-validated read cache).
+- SQLiteBackend: one WAL-mode database with a row per artifact keyed by
+  (week, day, field). A week is one indexed range instead of ~150 files, so
+  listing, bundling and validating a week are single queries. materialize()
+  writes the directory layout back out for exports and tooling that needs
+  real files.
+
+Paths are mapped to keys relative to the curriculum base:
+    Week05/Day2_5.2/01_class_name.txt  -> (5, 2, "01_class_name.txt")
+    Week05/internal_documents/x.json   -> (5, 0, "internal_documents/x.json")
+    master_analysis.json               -> (0, 0, "master_analysis.json")
+"""
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Read cache bounds (file contents, not parsed objects)
+READ_CACHE_MAX_ENTRIES = 4096
+READ_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_WEEK_DIR = re.compile(r"^Week(\d+)$")
+_DAY_DIR = re.compile(r"^Day(\d+)(?:_|$)")
+
+# Week-relative location of the Phase 1 week spec (used for week status)
+WEEK_SPEC_FIELD = "internal_documents/week_spec.json"
+
+
+def artifact_key(base: Path, path: Path) -> Tuple[int, int, str]:
+    """
+    Map a curriculum path to its (week, day, field) key.
+
+    Raises:
+        ValueError: If path is outside base
+    """
+    parts = Path(path).relative_to(base).parts
+    week = day = 0
+    if parts and _WEEK_DIR.match(parts[0]):
+        week = int(_WEEK_DIR.match(parts[0]).group(1))
+        parts = parts[1:]
+        if len(parts) > 1 and _DAY_DIR.match(parts[0]):
+            day = int(_DAY_DIR.match(parts[0]).group(1))
+            parts = parts[1:]
+    return week, day, "/".join(parts)
+
+
+class _ReadCache:
+    """
+    Thread-safe LRU of file bytes keyed by path and validated by (mtime_ns, size).
+
+    Only raw bytes are cached. read_json() parses them with orjson on every
+    call, which is cheaper than deep-copying a cached object and means callers
+    always get a private, freely mutable result.
+    """
+
+    def __init__(self, max_entries: int = READ_CACHE_MAX_ENTRIES, max_bytes: int = READ_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = Lock()
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, path: Path) -> bytes:
+        key = str(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.invalidate(path)
+            raise FileNotFoundError(f"File not found: {path}")
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        data = path.read_bytes()
+        # Only cache if the file did not change while we read it
+        if len(data) == stat.st_size and len(data) <= self.max_bytes:
+            with self.lock:
+                old = self.entries.pop(key, None)
+                if old is not None:
+                    self.total_bytes -= len(old[1])
+                self.entries[key] = (signature, data)
+                self.total_bytes += len(data)
+                while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                    _, (_, evicted) = self.entries.popitem(last=False)
+                    self.total_bytes -= len(evicted)
+        return data
+
+    def invalidate(self, path: Path) -> None:
+        with self.lock:
+            entry = self.entries.pop(str(path), None)
+            if entry is not None:
+                self.total_bytes -= len(entry[1])
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self.entries),
+                "size_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def _fsync_path(path: Path) -> None:
+    """fsync a file or directory (directories are skipped where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class StorageBackend:
+    """Interface for curriculum artifact storage."""
+
+    name = "base"
+
+    def __init__(self, base: Callable[[], Path]):
+        """
+        Initialize backend.
+
+        Args:
+            base: Returns the curriculum base directory (resolved per call)
+        """
+        self.base = base
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Read an artifact. Raises FileNotFoundError if missing."""
+        raise NotImplementedError
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        """Write one artifact atomically."""
+        raise NotImplementedError
+
+    def write_many(self, items: Dict[Path, bytes]) -> None:
+        """Write several artifacts as one durable commit."""
+        raise NotImplementedError
+
+    def exists(self, path: Path) -> bool:
+        """True if path is an artifact or a directory containing artifacts."""
+        raise NotImplementedError
+
+    def size(self, path: Path) -> int:
+        """Size of an artifact in bytes. Raises FileNotFoundError if missing."""
+        raise NotImplementedError
+
+    def read_day(self, week: int, day: int) -> Dict[str, bytes]:
+        """All artifacts of a day as day-relative field -> bytes."""
+        raise NotImplementedError
+
+    def week_overview(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Summary of every stored week.
+
+        Returns:
+            Week number -> {"has_spec": bool, "days": int, "last_modified": float}
+        """
+        raise NotImplementedError
+
+    def week_info(self, week: int) -> Optional[Dict[str, Any]]:
+        """week_overview() entry for one week, or None if it is not stored."""
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend counters for diagnostics."""
+        return {"backend": self.name}
+
+
+class FilesystemBackend(StorageBackend):
+    """Artifacts as files in the curriculum directory tree."""
+
+    name = "filesystem"
+
+    def __init__(self, base: Callable[[], Path], read_cache: Optional[_ReadCache] = None):
+        super().__init__(base)
+        self.read_cache = read_cache or _ReadCache()
+
+    def read_bytes(self, path: Path) -> bytes:
+        return self.read_cache.read(path)
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        """Write data to a sibling temp file and rename it over path."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        # os.open honours the umask, unlike mkstemp's 0600
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self.read_cache.invalidate(path)
+
+    def write_many(self, items: Dict[Path, bytes]) -> None:
+        """
+        Stage items under <base>/.staging/, fsync them in one pass, then rename.
+
+        Staging inside the curriculum base keeps the renames on one filesystem.
+        Each rename is atomic; every touched directory is fsynced once.
+        """
+        if not items:
+            return
+        staging_root = self.base() / ".staging"
+        staging_root.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix="batch-", dir=staging_root))
+        try:
+            staged = {}
+            for index, (path, data) in enumerate(items.items()):
+                staged_path = staging_dir / f"{index:04d}_{path.name}"
+                staged_path.write_bytes(data)
+                staged[path] = staged_path
+            for staged_path in staged.values():
+                _fsync_path(staged_path)
+
+            directories = set()
+            for path, staged_path in staged.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(staged_path, path)
+                self.read_cache.invalidate(path)
+                directories.add(path.parent)
+            for directory in directories:
+                _fsync_path(directory)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def size(self, path: Path) -> int:
+        return path.stat().st_size
+
+    def read_day(self, week: int, day: int) -> Dict[str, bytes]:
+        week_path = self.base() / f"Week{week:02d}"
+        if not week_path.exists():
+            return {}
+        files = {}
+        for day_path in week_path.iterdir():
+            match = _DAY_DIR.match(day_path.name)
+            if not day_path.is_dir() or not match or int(match.group(1)) != day:
+                continue
+            for file_path in day_path.rglob("*"):
+                if file_path.is_file():
+                    files[file_path.relative_to(day_path).as_posix()] = self.read_cache.read(file_path)
+        return files
+
+    @staticmethod
+    def _week_info(week_path: Path) -> Dict[str, Any]:
+        return {
+            "has_spec": (week_path / WEEK_SPEC_FIELD).exists(),
+            "days": len([d for d in week_path.glob("Day*") if d.is_dir()]),
+            "last_modified": week_path.stat().st_mtime,
+        }
+
+    def week_overview(self) -> Dict[int, Dict[str, Any]]:
+        base = self.base()
+        if not base.exists():
+            return {}
+        overview = {}
+        for week_path in base.iterdir():
+            match = _WEEK_DIR.match(week_path.name)
+            if not match or not week_path.is_dir():
+                continue
+            overview[int(match.group(1))] = self._week_info(week_path)
+        return overview
+
+    def week_info(self, week: int) -> Optional[Dict[str, Any]]:
+        week_path = self.base() / f"Week{week:02d}"
+        if not week_path.is_dir():
+            return None
+        return self._week_info(week_path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "read_cache": self.read_cache.get_stats()}
+
+
+class SQLiteBackend(StorageBackend):
+    """Artifacts as rows of one WAL-mode SQLite database."""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Path, base: Callable[[], Path]):
+        """
+        Initialize SQLite backend.
+
+        Args:
+            db_path: Database file (created if missing)
+            base: Returns the curriculum base directory the paths are relative to
+        """
+        super().__init__(base)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = Lock()
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS artifacts (
+                week INTEGER NOT NULL,
+                day INTEGER NOT NULL,
+                field TEXT NOT NULL,
+                path TEXT NOT NULL UNIQUE,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                PRIMARY KEY (week, day, field)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _rel(self, path: Path) -> str:
+        return Path(path).relative_to(self.base()).as_posix()
+
+    def read_bytes(self, path: Path) -> bytes:
+        with self.lock:
+            row = self._conn.execute(
+                "SELECT content FROM artifacts WHERE week = ? AND day = ? AND field = ?",
+                artifact_key(self.base(), path)
+            ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"File not found: {path}")
+        return bytes(row[0])
+
+    def _upsert(self, items: Iterable[Tuple[Path, bytes]]) -> None:
+        base = self.base()
+        now = time.time_ns()
+        rows = [
+            (*artifact_key(base, path), self._rel(path), data, len(data), now)
+            for path, data in items
+        ]
+        with self.lock:
+            with self._conn:
+                self._conn.executemany(
+                    """
+                    INSERT INTO artifacts (week, day, field, path, content, size, mtime_ns)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (week, day, field) DO UPDATE SET
+                        path = excluded.path,
+                        content = excluded.content,
+                        size = excluded.size,
+                        mtime_ns = excluded.mtime_ns
+                    """,
+                    rows
+                )
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        self._upsert([(path, data)])
+
+    def write_many(self, items: Dict[Path, bytes]) -> None:
+        """Write all items in one transaction."""
+        if items:
+            self._upsert(items.items())
+
+    def exists(self, path: Path) -> bool:
+        rel = self._rel(path)
+        # Directory check as an indexed range scan: "a/b/" <= path < "a/b0"
+        with self.lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM artifacts WHERE path = ? OR (path >= ? AND path < ?) LIMIT 1",
+                (rel, rel + "/", rel + "0")
+            ).fetchone()
+        return row is not None
+
+    def size(self, path: Path) -> int:
+        with self.lock:
+            row = self._conn.execute(
+                "SELECT size FROM artifacts WHERE week = ? AND day = ? AND field = ?",
+                artifact_key(self.base(), path)
+            ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"File not found: {path}")
+        return row[0]
+
+    def read_day(self, week: int, day: int) -> Dict[str, bytes]:
+        with self.lock:
+            rows = self._conn.execute(
+                "SELECT field, content FROM artifacts WHERE week = ? AND day = ?",
+                (week, day)
+            ).fetchall()
+        return {field: bytes(content) for field, content in rows}
+
+    def week_overview(self, week: Optional[int] = None) -> Dict[int, Dict[str, Any]]:
+        week_filter = "week > 0" if week is None else "week = ?"
+        params = (WEEK_SPEC_FIELD,) if week is None else (WEEK_SPEC_FIELD, week)
+        with self.lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT week,
+                       MAX(day = 0 AND field = ?),
+                       COUNT(DISTINCT CASE WHEN day > 0 THEN day END),
+                       MAX(mtime_ns)
+                FROM artifacts
+                WHERE {week_filter}
+                GROUP BY week
+                """,
+                params
+            ).fetchall()
+        return {
+            week: {"has_spec": bool(has_spec), "days": days, "last_modified": mtime_ns / 1e9}
+            for week, has_spec, days, mtime_ns in rows
+        }
+
+    def week_info(self, week: int) -> Optional[Dict[str, Any]]:
+        return self.week_overview(week).get(week)
+
+    def import_tree(self, source: Optional[Path] = None) -> int:
+        """
+        Load every file under source (default: the curriculum base) into the database.
+
+        Returns:
+            Number of artifacts imported
+        """
+        source = Path(source) if source is not None else self.base()
+        db_files = {self.db_path.name, f"{self.db_path.name}-wal", f"{self.db_path.name}-shm"}
+        items = {}
+        for file_path in sorted(source.rglob("*")):
+            rel = file_path.relative_to(source)
+            # Skip staging/hidden files, zipped exports and the database itself
+            if (
+                not file_path.is_file()
+                or rel.parts[0].startswith(".")
+                or rel.parts[0] == "exports"
+                or file_path.name in db_files
+            ):
+                continue
+            items[self.base() / rel] = file_path.read_bytes()
+        self.write_many(items)
+        return len(items)
+
+    def materialize(self, dest: Path, week: Optional[int] = None) -> int:
+        """
+        Write stored artifacts out as the regular directory layout.
+
+        Args:
+            dest: Directory that plays the role of the curriculum base
+            week: Only this week (default: everything)
+
+        Files that already hold the stored bytes are left alone, so their
+        mtimes (and incremental exports keyed on them) stay valid.
+
+        Returns:
+            Number of files written
+        """
+        query = "SELECT path, content FROM artifacts"
+        params: tuple = ()
+        if week is not None:
+            query += " WHERE week = ?"
+            params = (week,)
+        with self.lock:
+            rows = self._conn.execute(query, params).fetchall()
+        written = 0
+        for rel, content in rows:
+            target = Path(dest) / rel
+            try:
+                if target.stat().st_size == len(content) and target.read_bytes() == content:
+                    continue
+            except FileNotFoundError:
+                target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+            written += 1
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM artifacts"
+            ).fetchone()
+        return {"backend": self.name, "db_path": str(self.db_path), "artifacts": count, "size_bytes": total}
@@ -1,10 +1,42 @@
-"""Usage tracking for LLM API calls and cost estimation."""
+"""Usage tracking for LLM API calls and cost estimation.
+
+Usage is kept in memory and persisted in two files under curriculum/usage/:
+
+- ledger.jsonl: append-only, one JSON record per LLM call. track() only
+  updates the in-memory aggregates and buffers the record; buffered records
+  are appended in one write every flush_interval seconds (and at exit).
+- summary.json: a compacted snapshot of the aggregates (same shape as the
+  old summary file) plus the ledger offset it already includes. When the
+  ledger grows past compact_bytes it is folded into the snapshot and a fresh
+  ledger is started.
+
+Calls can carry attribution (week, day, phase, prompt task, attempt, cache
+hit, latency); breakdown() rolls those up for /api/v1/usage/breakdown and the
+usage_report CLI. Cache hits are attributed but not counted as API requests.
+
+Several processes (the API and its generation jobs) can share the files:
+appends and compactions hold an exclusive lock on ledger.lock, and each flush
+first replays records other processes appended since the last flush, so
+get_summary() and the budget check see their spend without reading the disk.
+"""
+import atexit
+import logging
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
 import orjson
 from threading import Lock
 
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
 
 # Rough cost estimates per 1M tokens (as of 2025) - OpenAI only
 COST_PER_1M_TOKENS = {
@@ -14,35 +46,199 @@ COST_PER_1M_TOKENS = {
     "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
 }
 
+# Session records kept in the summary
+MAX_SESSIONS = 1000
+
+# Attribution dimensions recorded per call (see UsageTracker.breakdown)
+DIMENSIONS = ("week", "day", "phase", "task", "model", "cache_hit")
+
 
 class UsageTracker:
-    """Thread-safe usage tracker for LLM API calls."""
+    """Thread- and process-safe usage tracker for LLM API calls."""
 
-    def __init__(self, storage_path: Optional[Path] = None):
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        flush_interval: float = 2.0,
+        compact_bytes: int = 4 * 1024 * 1024
+    ):
         """
         Initialize usage tracker.
 
         Args:
-            storage_path: Path to JSON file for persisting usage data.
-                         Defaults to curriculum/usage/summary.json
+            storage_path: Path to the JSON summary snapshot; the ledger and lock
+                         file live next to it. Defaults to curriculum/usage/summary.json
+            flush_interval: Seconds records are buffered before being appended
+                           to the ledger (0 = append on every call)
+            compact_bytes: Fold the ledger into the snapshot once it is this large
         """
         if storage_path is None:
             storage_path = Path(__file__).parent.parent.parent / "curriculum" / "usage" / "summary.json"
 
         self.storage_path = storage_path
+        self.ledger_path = storage_path.parent / "ledger.jsonl"
+        self.lock_path = storage_path.parent / "ledger.lock"
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.compact_bytes = compact_bytes
+
         self.lock = Lock()
-        self._load()
+        self.flush_lock = Lock()
+        self._buffer: List[bytes] = []
+        self._timer: Optional[threading.Timer] = None
+        self._ledger_offset = 0
+        self._ledger_inode: Optional[int] = None
+
+        with self._file_lock():
+            self._load()
+        atexit.register(self.flush)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive cross-process lock on ledger.lock."""
+        with open(self.lock_path, "a+b") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
 
-    def _load(self):
-        """Load existing usage data from disk."""
+    def _ledger_stat(self) -> Optional[os.stat_result]:
+        try:
+            return self.ledger_path.stat()
+        except FileNotFoundError:
+            return None
+
+    def _load(self, unflushed: Iterable[bytes] = ()):
+        """
+        Load the snapshot and replay the ledger after it (file lock held).
+
+        Args:
+            unflushed: Records already applied to the old aggregates but not yet
+                       in the ledger; re-applied together with the buffer in the
+                       same lock hold as the swap, so a concurrent track() is
+                       counted exactly once
+        """
+        snapshot = None
         if self.storage_path.exists():
             try:
-                self.data = orjson.loads(self.storage_path.read_bytes())
+                snapshot = orjson.loads(self.storage_path.read_bytes())
             except Exception:
-                self.data = self._init_data()
+                snapshot = None
+        if snapshot is None:
+            snapshot = self._init_data()
+        offset = snapshot.pop("ledger_offset", 0)
+        snapshot_inode = snapshot.pop("ledger_inode", None)
+        with self.lock:
+            self.data = snapshot
+            for line in [*unflushed, *self._buffer]:
+                self._apply(orjson.loads(line))
+
+        # The offset only applies to the ledger the snapshot was taken from
+        stat = self._ledger_stat()
+        self._ledger_inode = stat.st_ino if stat else None
+        if stat is None or stat.st_ino != snapshot_inode or stat.st_size < offset:
+            offset = 0
+        self._ledger_offset = offset
+        self._replay()
+
+    def _replay(self):
+        """Apply ledger records appended after our offset (file lock held)."""
+        if self._ledger_stat() is None:
+            return
+        with open(self.ledger_path, "rb") as ledger:
+            ledger.seek(self._ledger_offset)
+            chunk = ledger.read()
+        end = chunk.rfind(b"\n") + 1
+        with self.lock:
+            for line in chunk[:end].splitlines():
+                try:
+                    self._apply(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt usage ledger line in {self.ledger_path}")
+        self._ledger_offset += end
+
+    def _write_snapshot(self):
+        """Atomically replace summary.json with the current aggregates (file lock held)."""
+        with self.lock:
+            snapshot = dict(self.data, ledger_offset=self._ledger_offset, ledger_inode=self._ledger_inode)
+            snapshot["last_updated"] = datetime.utcnow().isoformat() + "Z"
+            payload = orjson.dumps(snapshot, option=orjson.OPT_INDENT_2)
+        tmp_path = self.storage_path.with_name(f".{self.storage_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.storage_path)
+
+    def _start_new_ledger(self):
+        """Replace the ledger with an empty file (file lock held)."""
+        tmp_path = self.ledger_path.with_name(f".{self.ledger_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(b"")
+        os.replace(tmp_path, self.ledger_path)
+        self._ledger_offset = 0
+        self._ledger_inode = self.ledger_path.stat().st_ino
+
+    def _sync_with_ledger(self, pending: List[bytes]):
+        """Catch up with other processes before appending (file lock held)."""
+        stat = self._ledger_stat()
+        inode = stat.st_ino if stat else None
+        if inode != self._ledger_inode:
+            # Another process compacted or reset: reload its snapshot, keep our unflushed records
+            self._load(pending)
         else:
-            self.data = self._init_data()
+            self._replay()
+
+    def flush(self):
+        """Append buffered records to the ledger, compacting it when it is large."""
+        with self.flush_lock:
+            with self.lock:
+                pending, self._buffer = self._buffer, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if not pending:
+                return
+            with self._file_lock():
+                self._sync_with_ledger(pending)
+                fd = os.open(self.ledger_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+                try:
+                    os.write(fd, b"".join(pending))
+                    self._ledger_offset = os.fstat(fd).st_size
+                    self._ledger_inode = os.fstat(fd).st_ino
+                finally:
+                    os.close(fd)
+                if self._ledger_offset >= self.compact_bytes:
+                    self._compact_locked()
+
+    def refresh(self):
+        """Pick up records other processes appended (one stat() when nothing changed)."""
+        stat = self._ledger_stat()
+        if stat is None or (stat.st_ino == self._ledger_inode and stat.st_size == self._ledger_offset):
+            return
+        with self.flush_lock, self._file_lock():
+            self._sync_with_ledger([])
+
+    def _compact_locked(self):
+        # The snapshot names the old ledger and its end, so a crash before the
+        # new ledger is in place cannot count records twice
+        self._replay()
+        self._write_snapshot()
+        self._start_new_ledger()
+
+    def compact(self):
+        """Fold the ledger into summary.json and start an empty ledger."""
+        self.flush()
+        with self.flush_lock, self._file_lock():
+            self._sync_with_ledger([])
+            self._compact_locked()
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
 
     def _init_data(self) -> Dict[str, Any]:
         """Initialize empty usage data structure."""
@@ -53,16 +249,76 @@ class UsageTracker:
             "estimated_cost_usd": 0.0,
             "by_provider": {},
             "by_model": {},
+            "by_call": {},
             "sessions": [],
             "last_updated": datetime.utcnow().isoformat() + "Z"
         }
 
-    def _save(self):
-        """Persist usage data to disk."""
-        self.data["last_updated"] = datetime.utcnow().isoformat() + "Z"
-        self.storage_path.write_bytes(
-            orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
-        )
+    def _apply_attribution(self, record: Dict[str, Any]):
+        """Add a record to the per-(week, day, phase, task, model, cache hit) aggregates."""
+        dims = {dim: record.get(dim) for dim in DIMENSIONS}
+        dims["cache_hit"] = bool(dims["cache_hit"])
+        key = "|".join(str(dims[dim]) for dim in DIMENSIONS)
+        by_call = self.data.setdefault("by_call", {})
+        if key not in by_call:
+            by_call[key] = {
+                **dims,
+                "requests": 0,
+                "retries": 0,
+                "tokens_prompt": 0,
+                "tokens_completion": 0,
+                "cost_usd": 0.0,
+                "latency_s": 0.0,
+                "max_latency_s": 0.0
+            }
+        entry = by_call[key]
+        latency = record.get("latency_s") or 0.0
+        entry["requests"] += 1
+        entry["retries"] += 1 if (record.get("attempt") or 1) > 1 else 0
+        entry["tokens_prompt"] += record["tokens_prompt"]
+        entry["tokens_completion"] += record["tokens_completion"]
+        entry["cost_usd"] += record["cost_usd"]
+        entry["latency_s"] += latency
+        entry["max_latency_s"] = max(entry["max_latency_s"], latency)
+
+    def _apply(self, record: Dict[str, Any]):
+        """Add one ledger record to the in-memory aggregates (self.lock held)."""
+        tokens_prompt = record["tokens_prompt"]
+        tokens_completion = record["tokens_completion"]
+        cost = record["cost_usd"]
+
+        self._apply_attribution(record)
+        if record.get("cache_hit"):
+            # Served from the response cache: no API request was made
+            return
+
+        # Update totals
+        self.data["total_requests"] += 1
+        self.data["total_tokens_prompt"] += tokens_prompt
+        self.data["total_tokens_completion"] += tokens_completion
+        self.data["estimated_cost_usd"] += cost
+
+        # Update by provider and by model
+        for group, key in (("by_provider", record["provider"]), ("by_model", record["model"])):
+            if key not in self.data[group]:
+                self.data[group][key] = {
+                    "requests": 0,
+                    "tokens_prompt": 0,
+                    "tokens_completion": 0,
+                    "cost_usd": 0.0
+                }
+            entry = self.data[group][key]
+            entry["requests"] += 1
+            entry["tokens_prompt"] += tokens_prompt
+            entry["tokens_completion"] += tokens_completion
+            entry["cost_usd"] += cost
+
+        # Add session record, keeping only the most recent ones
+        sessions = self.data["sessions"]
+        sessions.append({**record, "cost_usd": round(cost, 4)})
+        if len(sessions) > MAX_SESSIONS:
+            del sessions[:len(sessions) - MAX_SESSIONS]
+        self.data["last_updated"] = record["timestamp"]
 
     def track(
         self,
@@ -70,7 +326,14 @@ class UsageTracker:
         model: str,
         tokens_prompt: int,
         tokens_completion: int,
-        operation: str = "generation"
+        operation: str = "generation",
+        week: Optional[int] = None,
+        day: Optional[int] = None,
+        phase: Optional[str] = None,
+        task: Optional[str] = None,
+        attempt: Optional[int] = None,
+        cache_hit: bool = False,
+        latency_s: Optional[float] = None
     ):
         """
         Record a single LLM API call.
@@ -81,59 +344,48 @@ class UsageTracker:
             tokens_prompt: Input tokens used
             tokens_completion: Output tokens generated
             operation: Type of operation (e.g., "generation", "week_spec", "day_document")
+            week: Week the call generated content for
+            day: Day number (0 for week-level work)
+            phase: Pipeline phase (phase0, planning, day_fields, document, assessment)
+            task: Prompt task (e.g. "task_day_document")
+            attempt: Attempt number within the caller's retry loop
+            cache_hit: Served from the response cache (no cost, not an API request)
+            latency_s: Wall-clock seconds the call took
         """
+        if cache_hit:
+            tokens_prompt = tokens_completion = 0
+        record = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "provider": provider,
+            "model": model,
+            "operation": operation,
+            "tokens_prompt": tokens_prompt,
+            "tokens_completion": tokens_completion,
+            "cost_usd": self._estimate_cost(model, tokens_prompt, tokens_completion)
+        }
+        attribution = {
+            "week": week,
+            "day": day,
+            "phase": phase,
+            "task": task,
+            "attempt": attempt,
+            "cache_hit": cache_hit or None,
+            "latency_s": round(latency_s, 4) if latency_s is not None else None
+        }
+        record.update({key: value for key, value in attribution.items() if value is not None})
+        line = orjson.dumps(record) + b"\n"
+
         with self.lock:
-            # Calculate cost
-            cost = self._estimate_cost(model, tokens_prompt, tokens_completion)
-
-            # Update totals
-            self.data["total_requests"] += 1
-            self.data["total_tokens_prompt"] += tokens_prompt
-            self.data["total_tokens_completion"] += tokens_completion
-            self.data["estimated_cost_usd"] += cost
-
-            # Update by provider
-            if provider not in self.data["by_provider"]:
-                self.data["by_provider"][provider] = {
-                    "requests": 0,
-                    "tokens_prompt": 0,
-                    "tokens_completion": 0,
-                    "cost_usd": 0.0
-                }
-            self.data["by_provider"][provider]["requests"] += 1
-            self.data["by_provider"][provider]["tokens_prompt"] += tokens_prompt
-            self.data["by_provider"][provider]["tokens_completion"] += tokens_completion
-            self.data["by_provider"][provider]["cost_usd"] += cost
-
-            # Update by model
-            if model not in self.data["by_model"]:
-                self.data["by_model"][model] = {
-                    "requests": 0,
-                    "tokens_prompt": 0,
-                    "tokens_completion": 0,
-                    "cost_usd": 0.0
-                }
-            self.data["by_model"][model]["requests"] += 1
-            self.data["by_model"][model]["tokens_prompt"] += tokens_prompt
-            self.data["by_model"][model]["tokens_completion"] += tokens_completion
-            self.data["by_model"][model]["cost_usd"] += cost
-
-            # Add session record
-            self.data["sessions"].append({
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "provider": provider,
-                "model": model,
-                "operation": operation,
-                "tokens_prompt": tokens_prompt,
-                "tokens_completion": tokens_completion,
-                "cost_usd": round(cost, 4)
-            })
-
-            # Keep only last 1000 sessions
-            if len(self.data["sessions"]) > 1000:
-                self.data["sessions"] = self.data["sessions"][-1000:]
-
-            self._save()
+            self._apply(record)
+            self._buffer.append(line)
+            schedule = self._timer is None and self.flush_interval > 0
+            if schedule:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if self.flush_interval <= 0:
+            self.flush()
 
     def _estimate_cost(self, model: str, tokens_prompt: int, tokens_completion: int) -> float:
         """
@@ -162,15 +414,82 @@ class UsageTracker:
         return cost_input + cost_output
 
     def get_summary(self) -> Dict[str, Any]:
-        """Get current usage summary."""
+        """Get current usage summary (from memory; no disk access)."""
         with self.lock:
-            return self.data.copy()
+            summary = self.data.copy()
+            summary.pop("by_call", None)  # see breakdown()
+            summary["by_provider"] = {k: dict(v) for k, v in self.data["by_provider"].items()}
+            summary["by_model"] = {k: dict(v) for k, v in self.data["by_model"].items()}
+            summary["sessions"] = list(self.data["sessions"])
+            return summary
+
+    def breakdown(
+        self,
+        group_by: Iterable[str] = ("week", "phase", "task"),
+        **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        Aggregate cost and latency by attribution dimensions (from memory).
+
+        Args:
+            group_by: Dimensions to group by (any of DIMENSIONS)
+            **filters: Keep only calls whose dimension equals the value (e.g. week=3)
+
+        Returns:
+            Dict with group_by, rows sorted by cost then total latency, and totals
+
+        Raises:
+            ValueError: If a group_by or filter name is not a dimension
+        """
+        group_by = list(group_by)
+        unknown = [dim for dim in list(group_by) + list(filters) if dim not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown usage dimensions: {unknown}. Choose from {list(DIMENSIONS)}")
 
-    def reset(self):
-        """Reset all usage data."""
         with self.lock:
-            self.data = self._init_data()
-            self._save()
+            entries = [dict(entry) for entry in self.data.get("by_call", {}).values()]
+
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        for entry in entries:
+            if any(entry.get(dim) != value for dim, value in filters.items()):
+                continue
+            key = tuple(entry.get(dim) for dim in group_by)
+            row = rows.get(key)
+            if row is None:
+                row = rows[key] = {
+                    **dict(zip(group_by, key)),
+                    "requests": 0, "cache_hits": 0, "retries": 0,
+                    "tokens_prompt": 0, "tokens_completion": 0, "cost_usd": 0.0,
+                    "latency_s": 0.0, "max_latency_s": 0.0
+                }
+            for metric in ("requests", "retries", "tokens_prompt", "tokens_completion", "cost_usd", "latency_s"):
+                row[metric] += entry[metric]
+            row["cache_hits"] += entry["requests"] if entry["cache_hit"] else 0
+            row["max_latency_s"] = max(row["max_latency_s"], entry["max_latency_s"])
+
+        totals = {"requests": 0, "cache_hits": 0, "retries": 0, "cost_usd": 0.0, "latency_s": 0.0}
+        for row in rows.values():
+            for metric in totals:
+                totals[metric] += row[metric]
+            row["avg_latency_s"] = round(row["latency_s"] / row["requests"], 3)
+            row["cache_hit_rate"] = round(row["cache_hits"] / row["requests"], 3)
+            row["cost_usd"] = round(row["cost_usd"], 4)
+            row["latency_s"] = round(row["latency_s"], 3)
+            row["max_latency_s"] = round(row["max_latency_s"], 3)
+        totals["cost_usd"] = round(totals["cost_usd"], 4)
+        totals["latency_s"] = round(totals["latency_s"], 3)
+
+        ordered = sorted(rows.values(), key=lambda row: (-row["cost_usd"], -row["latency_s"]))
+        return {"group_by": group_by, "filters": filters, "rows": ordered, "totals": totals}
+
+    def reset(self):
+        """Reset all usage data (in every process sharing the files)."""
+        with self.flush_lock, self._file_lock():
+            with self.lock:
+                self.data = self._init_data()
+                self._buffer = []
+            self._start_new_ledger()
+            self._write_snapshot()
 
 
 # Global tracker instance
@@ -178,8 +497,12 @@ _tracker: Optional[UsageTracker] = None
 
 
 def get_tracker() -> UsageTracker:
-    """Get global usage tracker instance."""
+    """Get global usage tracker instance (configured from settings)."""
     global _tracker
     if _tracker is None:
-        _tracker = UsageTracker()
+        from ..config import settings
+        _tracker = UsageTracker(
+            flush_interval=settings.USAGE_FLUSH_INTERVAL_S,
+            compact_bytes=settings.USAGE_COMPACT_BYTES
+        )
     return _tracker
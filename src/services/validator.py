@@ -1,20 +1,34 @@
-"""Validation service for curriculum content."""
+"""Validation service for curriculum content.
+
+Each day is loaded once with the storage backend's read_day() (a single
+indexed query on the SQLite backend) and its fields are validated from that
+result instead of one exists/size/read round trip per file.
+"""
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
+
+import orjson
+
 from .storage import (
-    week_dir,
     day_dir,
     week_spec_dir,
     role_context_dir,
     compile_day_flint_bundle,
     compile_week_spec,
     compile_role_context,
-    get_day_fields,
-    detect_day_layout,
+    day_layout_from_files,
+    get_storage_backend,
+    read_json,
+    path_exists,
+    file_size,
+    DAY_FIELDS,
+    LEGACY_DAY_FIELDS,
+    DOCUMENT_FOR_SPARKY_FILES,
     WEEK_SPEC_PARTS,
     ROLE_CONTEXT_PARTS
 )
+from .metrics import VALIDATION_ISSUES, WEEK_VALIDATIONS
 
 
 class ValidationError:
@@ -62,7 +76,11 @@ class ValidationResult:
         )
 
 
-def validate_day_fields(week_number: int, day_number: int) -> ValidationResult:
+def validate_day_fields(
+    week_number: int,
+    day_number: int,
+    files: Optional[Dict[str, bytes]] = None
+) -> ValidationResult:
     """
     Validate that all required Flint field files exist for a day (6 or 7 fields).
 
@@ -71,19 +89,25 @@ def validate_day_fields(week_number: int, day_number: int) -> ValidationResult:
     - 7-field layout required for new days; 6-field is legacy
     - JSON files are valid JSON
     - Files are not empty (except where appropriate)
+
+    Args:
+        week_number: Week number
+        day_number: Day number (1-4)
+        files: The day as returned by read_day(); loaded here if not given
     """
     result = ValidationResult()
-    day_path = day_dir(week_number, day_number)
+    if files is None:
+        files = get_storage_backend().read_day(week_number, day_number)
 
-    if not day_path.exists():
+    if not files and not path_exists(day_dir(week_number, day_number)):
         result.add_error(
             f"Week{week_number:02d}/Day{day_number}",
             "Day directory does not exist"
         )
         return result
 
-    layout = detect_day_layout(week_number, day_number)
-    fields = get_day_fields(week_number, day_number)
+    layout = day_layout_from_files(files)
+    fields = DAY_FIELDS if layout == "7field" else LEGACY_DAY_FIELDS
 
     if layout == "6field":
         result.add_warning(
@@ -92,84 +116,86 @@ def validate_day_fields(week_number: int, day_number: int) -> ValidationResult:
         )
 
     for field in fields:
-        field_path = day_path / field
         location = f"Week{week_number:02d}/Day{day_number}/{field}"
 
-        if not field_path.exists():
-            result.add_error(location, "Field file missing")
-            continue
-
         # Special handling for 06_document_for_sparky/ directory
         if field == "06_document_for_sparky/":
-            if not field_path.is_dir():
+            if field.rstrip("/") in files:
                 result.add_error(location, "Should be a directory, not a file")
                 continue
+            if not any(name.startswith(field) for name in files):
+                result.add_error(location, "Field file missing")
+                continue
 
             # Validate the 6 document files inside
-            from .storage import DOCUMENT_FOR_SPARKY_FILES
             for doc_file in DOCUMENT_FOR_SPARKY_FILES:
-                doc_path = field_path / doc_file
+                content = files.get(field + doc_file)
                 doc_location = f"{location}{doc_file}"
 
-                if not doc_path.exists():
+                if content is None:
                     result.add_error(doc_location, "Document file missing")
-                elif doc_path.stat().st_size == 0:
+                elif not content:
                     result.add_warning(doc_location, "Document file is empty")
             continue
 
+        content = files.get(field)
+        if content is None:
+            result.add_error(location, "Field file missing")
+            continue
+
         # Validate JSON files
         if field.endswith(".json"):
             try:
-                with field_path.open("r", encoding="utf-8") as f:
-                    json.load(f)
+                orjson.loads(content)
             except json.JSONDecodeError as e:
                 result.add_error(location, f"Invalid JSON: {e}")
 
         # Check for empty files (warning, not error)
-        if field_path.stat().st_size == 0:
+        if not content:
             result.add_warning(location, "Field file is empty")
+            continue
 
         # Check for placeholder content
-        if field_path.stat().st_size > 0:
-            content = field_path.read_text(encoding="utf-8")
-            placeholder_patterns = [
-                "[brief description",
-                "[activity description",
-                "[concept",
-                "{{",
-                "Week Title",
-                "Weekly Theme",
-                "Students will be able to...",
-                "Students will demonstrate..."
-            ]
-            for pattern in placeholder_patterns:
-                if pattern.lower() in content.lower():
-                    result.add_error(location, f"Contains placeholder text: '{pattern}'")
-                    break
+        text = content.decode("utf-8").lower()
+        placeholder_patterns = [
+            "[brief description",
+            "[activity description",
+            "[concept",
+            "{{",
+            "Week Title",
+            "Weekly Theme",
+            "Students will be able to...",
+            "Students will demonstrate..."
+        ]
+        for pattern in placeholder_patterns:
+            if pattern.lower() in text:
+                result.add_error(location, f"Contains placeholder text: '{pattern}'")
+                break
 
     # Validate role_context structure if present
-    if layout == "7field":
-        rc_path = day_path / "04_role_context.json"
-        if rc_path.exists():
-            try:
-                rc_data = json.loads(rc_path.read_text(encoding="utf-8"))
-                required_keys = ["sparky_role", "focus_mode", "hints_enabled"]
-                for key in required_keys:
-                    if key not in rc_data:
-                        result.add_warning(
-                            f"Week{week_number:02d}/Day{day_number}/04_role_context.json",
-                            f"role_context missing recommended key: {key}"
-                        )
-            except Exception as e:
-                result.add_error(
-                    f"Week{week_number:02d}/Day{day_number}/04_role_context.json",
-                    f"role_context validation failed: {e}"
-                )
+    if layout == "7field" and "04_role_context.json" in files:
+        try:
+            rc_data = orjson.loads(files["04_role_context.json"])
+            required_keys = ["sparky_role", "focus_mode", "hints_enabled"]
+            for key in required_keys:
+                if key not in rc_data:
+                    result.add_warning(
+                        f"Week{week_number:02d}/Day{day_number}/04_role_context.json",
+                        f"role_context missing recommended key: {key}"
+                    )
+        except Exception as e:
+            result.add_error(
+                f"Week{week_number:02d}/Day{day_number}/04_role_context.json",
+                f"role_context validation failed: {e}"
+            )
 
     return result
 
 
-def validate_day_4_spiral_content(week_number: int) -> ValidationResult:
+def validate_day_4_spiral_content(
+    week_number: int,
+    day4_files: Optional[Dict[str, bytes]] = None
+) -> ValidationResult:
     """
     Validate that Day 4 includes adequate spiral/review content (≥25% rule).
 
@@ -177,6 +203,10 @@ def validate_day_4_spiral_content(week_number: int) -> ValidationResult:
     - Day 4 guidelines mention prior content or review
     - Week spec includes spiral links (for weeks >= 2)
     - Assessment has ≥25% quiz questions from prior weeks
+
+    Args:
+        week_number: Week number
+        day4_files: Day 4 as returned by read_day(); loaded here if not given
     """
     result = ValidationResult()
 
@@ -187,15 +217,16 @@ def validate_day_4_spiral_content(week_number: int) -> ValidationResult:
         )
         return result
 
-    day4_path = day_dir(week_number, 4)
+    if day4_files is None:
+        day4_files = get_storage_backend().read_day(week_number, 4)
 
     # Handle both legacy and new field naming
-    layout = detect_day_layout(week_number, 4)
+    layout = day_layout_from_files(day4_files)
     guidelines_file = "05_guidelines_for_sparky.md" if layout == "7field" else "04_guidelines_for_sparky.md"
-    guidelines_path = day4_path / guidelines_file
+    guidelines = day4_files.get(guidelines_file)
 
-    if guidelines_path.exists():
-        content = guidelines_path.read_text(encoding="utf-8").lower()
+    if guidelines is not None:
+        content = guidelines.decode("utf-8").lower()
         spiral_keywords = ["spiral", "review", "prior", "previous", "25%"]
 
         if not any(keyword in content for keyword in spiral_keywords):
@@ -214,11 +245,9 @@ def validate_day_4_spiral_content(week_number: int) -> ValidationResult:
     from .storage import week_spec_part_path
 
     assessment_path = week_spec_part_path(week_number, "07_assessment.json")
-    if assessment_path.exists():
+    if path_exists(assessment_path):
         try:
-            import json
-            with assessment_path.open("r", encoding="utf-8") as f:
-                assessment_data = json.load(f)
+            assessment_data = read_json(assessment_path)
 
             # Check prior_content_percentage field
             prior_pct = assessment_data.get("prior_content_percentage", 0)
@@ -252,7 +281,7 @@ def validate_week_spec(week_number: int) -> ValidationResult:
     result = ValidationResult()
     spec_dir = week_spec_dir(week_number)
 
-    if not spec_dir.exists():
+    if not path_exists(spec_dir):
         result.add_error(
             f"Week{week_number:02d}/Week_Spec",
             "Week_Spec directory does not exist"
@@ -263,15 +292,14 @@ def validate_week_spec(week_number: int) -> ValidationResult:
         part_path = spec_dir / part
         location = f"Week{week_number:02d}/Week_Spec/{part}"
 
-        if not part_path.exists():
+        if not path_exists(part_path):
             result.add_error(location, "Spec part file missing")
             continue
 
         # Validate JSON files
         if part.endswith(".json"):
             try:
-                with part_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = read_json(part_path)
 
                 # Validate metadata structure
                 if part == "01_metadata.json":
@@ -301,15 +329,14 @@ def validate_week_spec(week_number: int) -> ValidationResult:
     # Check for spiral links in weeks >= 2
     if week_number >= 2:
         spiral_links_path = spec_dir / "09_spiral_links.json"
-        if spiral_links_path.exists():
+        if path_exists(spiral_links_path):
             try:
-                with spiral_links_path.open("r", encoding="utf-8") as f:
-                    spiral_data = json.load(f)
-                    if not spiral_data or not any(spiral_data.values()):
-                        result.add_warning(
-                            f"Week{week_number:02d}/Week_Spec/09_spiral_links.json",
-                            "Week >= 2 should include spiral links to previous content"
-                        )
+                spiral_data = read_json(spiral_links_path)
+                if not spiral_data or not any(spiral_data.values()):
+                    result.add_warning(
+                        f"Week{week_number:02d}/Week_Spec/09_spiral_links.json",
+                        "Week >= 2 should include spiral links to previous content"
+                    )
             except json.JSONDecodeError:
                 pass
 
@@ -327,7 +354,7 @@ def validate_role_context(week_number: int) -> ValidationResult:
     result = ValidationResult()
     context_dir = role_context_dir(week_number)
 
-    if not context_dir.exists():
+    if not path_exists(context_dir):
         result.add_error(
             f"Week{week_number:02d}/Role_Context",
             "Role_Context directory does not exist"
@@ -338,14 +365,13 @@ def validate_role_context(week_number: int) -> ValidationResult:
         part_path = context_dir / part
         location = f"Week{week_number:02d}/Role_Context/{part}"
 
-        if not part_path.exists():
+        if not path_exists(part_path):
             result.add_error(location, "Context part file missing")
             continue
 
         # All role context parts should be valid JSON
         try:
-            with part_path.open("r", encoding="utf-8") as f:
-                json.load(f)
+            read_json(part_path)
         except json.JSONDecodeError as e:
             result.add_error(location, f"Invalid JSON: {e}")
 
@@ -366,7 +392,7 @@ def validate_internal_documents(week_number: int) -> ValidationResult:
     from .storage import internal_documents_dir, INTERNAL_DOCUMENTS
     internal_dir = internal_documents_dir(week_number)
 
-    if not internal_dir.exists():
+    if not path_exists(internal_dir):
         result.add_error(
             f"Week{week_number:02d}/internal_documents",
             "internal_documents directory does not exist"
@@ -378,15 +404,14 @@ def validate_internal_documents(week_number: int) -> ValidationResult:
         doc_path = internal_dir / doc
         location = f"Week{week_number:02d}/internal_documents/{doc}"
 
-        if not doc_path.exists():
+        if not path_exists(doc_path):
             result.add_error(location, "Required document missing")
             continue
 
         # Validate JSON files
         if doc.endswith(".json"):
             try:
-                with doc_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = read_json(doc_path)
 
                 # Validate week_spec.json structure
                 if doc == "week_spec.json":
@@ -411,7 +436,7 @@ def validate_internal_documents(week_number: int) -> ValidationResult:
                 result.add_error(location, f"Invalid JSON: {e}")
 
         # Check for empty files
-        if doc_path.stat().st_size == 0:
+        if file_size(doc_path) == 0:
             result.add_warning(location, "Document is empty")
 
     return result
@@ -432,18 +457,18 @@ def validate_week(week_number: int) -> ValidationResult:
     result = ValidationResult()
 
     # Validate week directory exists
-    week_path = week_dir(week_number)
-    if not week_path.exists():
+    backend = get_storage_backend()
+    if backend.week_info(week_number) is None:
         result.add_error(
             f"Week{week_number:02d}",
             "Week directory does not exist"
         )
-        return result
+        return _counted(result)
 
     # Detect architecture version
     from .storage import internal_documents_dir
     internal_docs_dir = internal_documents_dir(week_number)
-    is_v11_architecture = internal_docs_dir.exists()
+    is_v11_architecture = path_exists(internal_docs_dir)
 
     if is_v11_architecture:
         result.add_info(
@@ -472,17 +497,26 @@ def validate_week(week_number: int) -> ValidationResult:
         result.warnings.extend(context_result.warnings)
         result.info.extend(context_result.info)
 
-    # Validate all days
-    for day_num in range(1, 5):
-        day_result = validate_day_fields(week_number, day_num)
+    # Validate all days, loading each one once
+    days = {day_num: backend.read_day(week_number, day_num) for day_num in range(1, 5)}
+    for day_num, files in days.items():
+        day_result = validate_day_fields(week_number, day_num, files)
         result.errors.extend(day_result.errors)
         result.warnings.extend(day_result.warnings)
         result.info.extend(day_result.info)
 
     # Validate Day 4 spiral content
-    spiral_result = validate_day_4_spiral_content(week_number)
+    spiral_result = validate_day_4_spiral_content(week_number, days[4])
     result.errors.extend(spiral_result.errors)
     result.warnings.extend(spiral_result.warnings)
     result.info.extend(spiral_result.info)
 
+    return _counted(result)
+
+
+def _counted(result: ValidationResult) -> ValidationResult:
+    """Record a validate_week() outcome in the metrics."""
+    WEEK_VALIDATIONS.inc(result="valid" if result.is_valid() else "invalid")
+    VALIDATION_ISSUES.inc(len(result.errors), severity="error")
+    VALIDATION_ISSUES.inc(len(result.warnings), severity="warning")
     return result
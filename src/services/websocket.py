@@ -1,52 +1,198 @@
-"""WebSocket manager for real-time progress updates during curriculum generation."""
-from typing import Dict, List
+"""WebSocket manager for real-time progress updates during curriculum generation.
+
+Every connection has its own writer task and bounded send queue, so a slow
+client only delays itself: broadcast() serializes a message once with orjson,
+appends the same bytes to each subscribed client's queue and returns without
+awaiting any socket. When a queue is full the oldest progress message is
+dropped (a newer one supersedes it); validation, error and control messages
+are never dropped. Messages go out as binary frames holding UTF-8 JSON.
+
+Clients receive every week's messages by default. Sending
+{"type": "subscribe", "weeks": [3]} narrows a connection to those weeks;
+{"type": "unsubscribe", "weeks": [3]} removes them again and
+{"type": "subscribe", "weeks": null} restores all weeks.
+"""
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set
 from fastapi import WebSocket
 import asyncio
 import logging
+import orjson
+
+from ..config import settings
+from .metrics import get_registry
 
 logger = logging.getLogger(__name__)
 
+# Message types that may be dropped when a client's queue is full
+DROPPABLE_TYPES = {"progress"}
+
+
+class _Client:
+    """One connection: its week subscription, send queue and writer task."""
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.queue_size = queue_size
+        self.queue: deque = deque()  # (payload bytes or str, droppable)
+        self.ready = asyncio.Event()
+        self.weeks: Optional[Set[int]] = None  # None = all weeks
+        self.dropped = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def enqueue(self, payload, droppable: bool) -> None:
+        if len(self.queue) >= self.queue_size:
+            for i, (_, old_droppable) in enumerate(self.queue):
+                if old_droppable:
+                    del self.queue[i]
+                    self.dropped += 1
+                    break
+            else:
+                if droppable:
+                    # Full of messages that must be kept: drop the new progress instead
+                    self.dropped += 1
+                    return
+        self.queue.append((payload, droppable))
+        self.ready.set()
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time progress updates."""
 
-    def __init__(self):
+    def __init__(self, queue_size: int = 100):
+        """
+        Initialize connection manager.
+
+        Args:
+            queue_size: Messages buffered per connection before progress is dropped
+        """
+        self.queue_size = queue_size
         self.active_connections: List[WebSocket] = []
+        self.clients: Dict[WebSocket, _Client] = {}
         self.generation_status: Dict[int, Dict] = {}  # week_number -> status
+        self.dropped = 0  # progress messages dropped by disconnected clients
 
     async def connect(self, websocket: WebSocket):
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
+        client = _Client(websocket, self.queue_size)
+        client.task = asyncio.create_task(self._writer(client))
+        self.clients[websocket] = client
         self.active_connections.append(websocket)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        """Remove a WebSocket connection."""
+        """Remove a WebSocket connection and stop its writer."""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        client = self.clients.pop(websocket, None)
+        if client is not None:
+            self.dropped += client.dropped
+            if client.task is not None and client.task is not asyncio.current_task():
+                client.task.cancel()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
+    async def _writer(self, client: _Client):
+        """Send a client's queued messages in order until it disconnects."""
+        websocket = client.websocket
+        while True:
+            await client.ready.wait()
+            while client.queue:
+                payload, _ = client.queue.popleft()
+                try:
+                    if isinstance(payload, str):
+                        await websocket.send_text(payload)
+                    else:
+                        await websocket.send_bytes(payload)
+                except Exception as e:
+                    logger.error(f"Error sending to websocket: {e}")
+                    self.disconnect(websocket)
+                    return
+            client.ready.clear()
+
+    def _enqueue(self, websocket: WebSocket, message: dict) -> None:
+        client = self.clients.get(websocket)
+        if client is not None:
+            client.enqueue(orjson.dumps(message), droppable=message.get("type") in DROPPABLE_TYPES)
+
     async def send_personal_message(self, message: dict, websocket: WebSocket):
-        """Send a message to a specific connection."""
+        """Queue a message for a specific connection."""
+        self._enqueue(websocket, message)
+
+    def subscribe(self, websocket: WebSocket, weeks: Optional[Iterable[int]]):
+        """Limit a connection to weeks (None: all weeks)."""
+        client = self.clients.get(websocket)
+        if client is None:
+            return
+        if weeks is None:
+            client.weeks = None
+        else:
+            client.weeks = (client.weeks or set()) | {int(w) for w in weeks}
+
+    def unsubscribe(self, websocket: WebSocket, weeks: Iterable[int]):
+        """Stop sending weeks to a connection that subscribed to them."""
+        client = self.clients.get(websocket)
+        if client is not None and client.weeks is not None:
+            client.weeks = client.weeks - {int(w) for w in weeks}
+
+    def wants(self, websocket: WebSocket, week: Optional[int]) -> bool:
+        """Whether a connection receives messages about week."""
+        client = self.clients.get(websocket)
+        if client is None:
+            return False
+        return client.weeks is None or week is None or week in client.weeks
+
+    async def handle_message(self, websocket: WebSocket, data: str):
+        """Handle a client message: "ping" or a subscribe/unsubscribe command."""
+        client = self.clients.get(websocket)
+        if client is None:
+            return
+        if data == "ping":
+            client.enqueue("pong", droppable=False)
+            return
         try:
-            await websocket.send_json(message)
-        except Exception as e:
-            logger.error(f"Error sending message to websocket: {e}")
-            self.disconnect(websocket)
-
-    async def broadcast(self, message: dict):
-        """Broadcast a message to all connected clients."""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to websocket: {e}")
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+            command = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return
+        if not isinstance(command, dict):
+            return
+        if command.get("type") == "subscribe":
+            self.subscribe(websocket, command.get("weeks"))
+        elif command.get("type") == "unsubscribe":
+            self.unsubscribe(websocket, command.get("weeks") or [])
+        else:
+            return
+        weeks = client.weeks
+        self._enqueue(websocket, {"type": "subscribed", "weeks": sorted(weeks) if weeks is not None else None})
+
+    async def broadcast(self, message: dict, week: Optional[int] = None):
+        """
+        Queue a message for all connected clients (subscribed to week, if given).
+
+        The message is serialized once; sending happens on each client's writer task.
+        """
+        payload = orjson.dumps(message)
+        droppable = message.get("type") in DROPPABLE_TYPES
+        for client in list(self.clients.values()):
+            if client.weeks is None or week is None or week in client.weeks:
+                client.enqueue(payload, droppable)
+
+    async def drain(self, timeout: float = 5.0):
+        """Wait until every client's queue has been sent (or timeout)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while any(client.queue for client in self.clients.values()) and loop.time() < deadline:
+            await asyncio.sleep(0.01)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get connection, queue depth and dropped-message counts."""
+        clients = list(self.clients.values())
+        return {
+            "connections": len(clients),
+            "queued": sum(len(client.queue) for client in clients),
+            "max_queued": max((len(client.queue) for client in clients), default=0),
+            "dropped": self.dropped + sum(client.dropped for client in clients)
+        }
 
     async def update_progress(self, week: int, day: int, field: int, total_fields: int,
                              status: str, message: str, attempt: int = 1, max_attempts: int = 10):
@@ -77,7 +223,18 @@ class ConnectionManager:
         }
 
         self.generation_status[week] = progress
-        await self.broadcast(progress)
+        await self.broadcast(progress, week=week)
+
+    async def publish_event(self, event: Dict[str, Any]):
+        """
+        Broadcast a progress bus event to the clients subscribed to its week.
+
+        Args:
+            event: Event delivered by the progress bus
+        """
+        week = event.get("week")
+        self.generation_status[week] = event
+        await self.broadcast(event, week=week)
 
     async def update_validation(self, week: int, is_valid: bool, summary: str,
                                error_count: int = 0, warning_count: int = 0):
@@ -100,7 +257,7 @@ class ConnectionManager:
             "warningCount": warning_count
         }
 
-        await self.broadcast(validation)
+        await self.broadcast(validation, week=week)
 
     async def send_error(self, week: int, error: str):
         """
@@ -116,7 +273,7 @@ class ConnectionManager:
             "message": error
         }
 
-        await self.broadcast(error_msg)
+        await self.broadcast(error_msg, week=week)
 
     def get_status(self, week: int) -> Dict:
         """Get current generation status for a week."""
@@ -124,4 +281,18 @@ class ConnectionManager:
 
 
 # Global connection manager instance
-manager = ConnectionManager()
+manager = ConnectionManager(queue_size=settings.WS_SEND_QUEUE_SIZE)
+
+
+def _collect_metrics():
+    stats = manager.get_stats()
+    return [
+        ("tequila_websocket_clients", "gauge", "Connected WebSocket clients", [({}, stats["connections"])]),
+        ("tequila_websocket_queued_messages", "gauge", "Messages waiting in WebSocket send queues",
+         [({}, stats["queued"])]),
+        ("tequila_websocket_dropped_messages_total", "counter", "Progress messages dropped for slow clients",
+         [({}, stats["dropped"])]),
+    ]
+
+
+get_registry().add_collector("websocket", _collect_metrics)
@@ -0,0 +1,217 @@
+"""In-process week scheduler driven by the curriculum prerequisite DAG.
+
+Weeks are ordered by curriculum_outline.get_prerequisites() and a week starts
+as soon as every prerequisite that is part of the same run has succeeded, on a
+pool of ``jobs`` worker threads. Prerequisites outside the run are assumed to
+be generated already. All weeks share one LLM client and usage tracker, and
+each state transition is recorded in a per-week status journal
+(logs/week_status.json) so a crashed run shows what finished.
+
+A week that fails or is aborted marks every week depending on it as
+"blocked"; independent weeks keep running. An on_failure callback can instead
+let a failed week's dependents go ahead (the sequential CLI's "continue with
+next week?" prompt) or stop the run.
+
+The shipped outline lists all earlier weeks as prerequisites, and that is a
+real dependency: Phase 0 backward analysis reads every earlier week's
+week_spec.json through the knowledge ledger. Any run over that outline is
+therefore a single chain, whatever weeks it selects, and ``jobs`` only pays
+off with an outline whose prerequisites leave some weeks independent.
+"""
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+
+import orjson
+
+from .curriculum_outline import get_prerequisites
+
+logger = logging.getLogger(__name__)
+
+# Week status values written to the journal
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_ABORTED = "aborted"
+STATUS_BLOCKED = "blocked"
+
+
+def build_week_graph(
+    weeks: List[int],
+    prerequisites: Callable[[int], List[int]] = get_prerequisites
+) -> Dict[int, List[int]]:
+    """
+    Map each week to the prerequisites it must wait for in this run.
+
+    Args:
+        weeks: Weeks to generate
+        prerequisites: Lookup for a week's prerequisite weeks
+
+    Returns:
+        Dict of week -> sorted prerequisite weeks that are also in ``weeks``
+    """
+    selected = set(weeks)
+    return {
+        week: sorted(p for p in prerequisites(week) if p in selected and p != week)
+        for week in sorted(selected)
+    }
+
+
+def dependency_depth(graph: Dict[int, List[int]]) -> int:
+    """Length of the longest prerequisite chain (lower bound on sequential steps)."""
+    depth: Dict[int, int] = {}
+    for week in sorted(graph):
+        depth[week] = 1 + max((depth[p] for p in graph[week] if p in depth), default=0)
+    return max(depth.values(), default=0)
+
+
+class WeekScheduler:
+    """Run week generation over the prerequisite DAG with bounded concurrency."""
+
+    def __init__(
+        self,
+        run_week: Callable[[int], bool],
+        jobs: int = 1,
+        journal_path: Optional[Path] = None,
+        prerequisites: Callable[[int], List[int]] = get_prerequisites
+    ):
+        """
+        Initialize week scheduler.
+
+        Args:
+            run_week: Generates one week; returns False if the week was aborted
+            jobs: Maximum number of weeks generated concurrently
+            journal_path: Status journal path. Defaults to logs/week_status.json
+            prerequisites: Lookup for a week's prerequisite weeks
+        """
+        if journal_path is None:
+            from ..config import settings
+            journal_path = settings.logs_path / "week_status.json"
+
+        self.run_week = run_week
+        self.jobs = max(1, jobs)
+        self.journal_path = journal_path
+        self.prerequisites = prerequisites
+        self.lock = Lock()
+        self.journal: Dict[str, Dict] = {}
+        self._stop = False
+
+    def _record(self, week: int, status: str, **fields):
+        """Update one week's journal entry and persist the journal."""
+        with self.lock:
+            entry = self.journal.setdefault(str(week), {"week": week})
+            entry["status"] = status
+            entry["updated_at"] = datetime.utcnow().isoformat() + "Z"
+            entry.update(fields)
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self.journal_path.write_bytes(orjson.dumps(self.journal, option=orjson.OPT_INDENT_2))
+
+    def stop(self):
+        """Stop launching new weeks; running weeks are allowed to finish."""
+        self._stop = True
+
+    def _run_one(self, week: int) -> bool:
+        self._record(week, STATUS_RUNNING, started_at=datetime.utcnow().isoformat() + "Z")
+        return self.run_week(week)
+
+    def run(
+        self,
+        weeks: List[int],
+        on_failure: Optional[Callable[[int, BaseException], bool]] = None
+    ) -> Dict[int, str]:
+        """
+        Generate weeks in prerequisite order.
+
+        Args:
+            weeks: Weeks to generate
+            on_failure: Called with (week, error) when a week raises. Return
+                        True to let the week's dependents run anyway (it
+                        stays "failed" but no longer blocks them), False to
+                        stop launching further weeks. Without it, dependents
+                        of a failed week are blocked.
+
+        Returns:
+            Dict of week -> final status
+
+        Raises:
+            KeyboardInterrupt: Re-raised after recording the weeks that were
+                               running as aborted; it does not wait for them
+        """
+        graph = build_week_graph(weeks, self.prerequisites)
+        status: Dict[int, str] = {}
+        for week in graph:
+            status[week] = STATUS_PENDING
+            self._record(week, STATUS_PENDING, prerequisites=graph[week])
+
+        logger.info(
+            f"Scheduling {len(graph)} weeks with {self.jobs} job(s); "
+            f"dependency depth {dependency_depth(graph)}"
+        )
+
+        running: Dict[Future, int] = {}
+        waived = set()  # Failed weeks on_failure chose to continue past
+        pool = ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="week")
+        try:
+            while True:
+                # Block dependents of failed weeks, then launch every ready week
+                for week in graph:
+                    if status[week] != STATUS_PENDING:
+                        continue
+                    prereq_states = [
+                        STATUS_SUCCESS if p in waived else status[p] for p in graph[week]
+                    ]
+                    if any(s in (STATUS_FAILED, STATUS_ABORTED, STATUS_BLOCKED) for s in prereq_states):
+                        status[week] = STATUS_BLOCKED
+                        self._record(week, STATUS_BLOCKED)
+                    elif (
+                        not self._stop
+                        and len(running) < self.jobs
+                        and all(s == STATUS_SUCCESS for s in prereq_states)
+                    ):
+                        status[week] = STATUS_RUNNING
+                        running[pool.submit(self._run_one, week)] = week
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    week = running.pop(future)
+                    finished_at = datetime.utcnow().isoformat() + "Z"
+                    try:
+                        completed = future.result()
+                    except BaseException as e:
+                        status[week] = STATUS_FAILED
+                        self._record(week, STATUS_FAILED, finished_at=finished_at, error=str(e))
+                        logger.error(f"Week {week} failed: {e}")
+                        if on_failure is not None:
+                            if on_failure(week, e):
+                                waived.add(week)
+                            else:
+                                self.stop()
+                        continue
+
+                    if completed:
+                        status[week] = STATUS_SUCCESS
+                        self._record(week, STATUS_SUCCESS, finished_at=finished_at)
+                    else:
+                        status[week] = STATUS_ABORTED
+                        self._record(week, STATUS_ABORTED, finished_at=finished_at)
+                        self.stop()
+        except KeyboardInterrupt:
+            # Ctrl+C lands in wait() on this thread: give up on running weeks
+            # instead of letting the pool join them
+            self.stop()
+            finished_at = datetime.utcnow().isoformat() + "Z"
+            for week in running.values():
+                status[week] = STATUS_ABORTED
+                self._record(week, STATUS_ABORTED, finished_at=finished_at, error="Interrupted")
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+
+        return status
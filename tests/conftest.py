@@ -0,0 +1,27 @@
+"""Shared pytest fixtures."""
+import pytest
+
+from src.services import exporter, knowledge_ledger, storage
+from src.services.prompts import phase0_research
+from src.services.storage_backends import SQLiteBackend
+
+# Modules that import get_curriculum_base by name and so need their own patch
+CURRICULUM_BASE_USERS = (storage, exporter, knowledge_ledger, phase0_research)
+
+
+@pytest.fixture
+def curriculum_tmp(tmp_path, monkeypatch):
+    """Point the storage layer and everything built on it at an empty curriculum tree."""
+    for module in CURRICULUM_BASE_USERS:
+        monkeypatch.setattr(module, "get_curriculum_base", lambda: tmp_path)
+    monkeypatch.setattr(knowledge_ledger, "_ledger", None)
+    return tmp_path
+
+
+@pytest.fixture
+def sqlite_store(curriculum_tmp):
+    """Use a SQLite week store under curriculum_tmp as the storage backend."""
+    backend = SQLiteBackend(curriculum_tmp / "curriculum.sqlite", lambda: storage.get_curriculum_base())
+    storage.set_storage_backend(backend)
+    yield backend
+    storage.set_storage_backend(None)
@@ -0,0 +1,80 @@
+"""Tests for the /api/v1/weeks curriculum index."""
+import pytest
+
+from src.services import storage
+from src.services.curriculum_index import CurriculumIndex
+
+
+@pytest.fixture
+def index(curriculum_tmp):
+    index = CurriculumIndex(poll_interval=0)
+    storage.add_write_listener(index.on_write)
+    yield index
+    storage.remove_write_listener(index.on_write)
+
+
+def week_entry(payload, week):
+    return payload["weeks"][week - 1]
+
+
+def test_writes_update_index_incrementally(index):
+    payload, etag = index.snapshot()
+    assert week_entry(payload, 2)["status"] == "not_generated"
+    assert index.snapshot()[1] == etag
+
+    with storage.atomic_batch():
+        storage.write_json(storage.internal_doc_path(2, "week_spec.json"), {"metadata": {}})
+        for day in range(1, 5):
+            storage.write_file(storage.day_field_path(2, day, "01_class_name.txt"), "Nouns")
+
+    payload, new_etag = index.snapshot()
+    assert new_etag != etag
+    assert week_entry(payload, 2)["status"] == "complete"
+    assert week_entry(payload, 2)["has_days"] == 4
+    assert index.builds == 1
+    assert index.refreshes == 1
+
+
+def test_watcher_poll_sees_outside_changes(index, curriculum_tmp):
+    index.snapshot()
+    (curriculum_tmp / "Week07" / "Day1_7.1").mkdir(parents=True)
+
+    assert index.poll() == [7]
+    payload, _ = index.snapshot()
+    assert week_entry(payload, 7)["status"] == "partial"
+    assert index.poll() == []
+
+
+def test_validation_state_goes_stale_after_change(index):
+    storage.write_file(storage.day_field_path(3, 1, "01_class_name.txt"), "Verbs")
+    index.snapshot()
+    index.record_validation(3, is_valid=False, errors=2, warnings=1)
+
+    payload, _ = index.snapshot()
+    assert week_entry(payload, 3)["validation"]["state"] == "invalid"
+    assert week_entry(payload, 3)["validation"]["errors"] == 2
+
+    storage.write_file(storage.day_field_path(3, 2, "01_class_name.txt"), "Verbs")
+    payload, _ = index.snapshot()
+    assert week_entry(payload, 3)["validation"]["state"] == "stale"
+
+
+def test_weeks_endpoint_honours_if_none_match(index, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import src.app as app_module
+
+    monkeypatch.setattr(app_module, "get_curriculum_index", lambda: index)
+    client = TestClient(app_module.app)
+
+    response = client.get("/api/v1/weeks")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert len(response.json()["weeks"]) == 35
+
+    assert client.get("/api/v1/weeks", headers={"If-None-Match": etag}).status_code == 304
+
+    storage.write_file(storage.day_field_path(1, 1, "01_class_name.txt"), "Nouns")
+    response = client.get("/api/v1/weeks", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
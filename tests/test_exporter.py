@@ -0,0 +1,268 @@
+"""Tests for the week ZIP exporter."""
+import hashlib
+import io
+import os
+import zipfile
+
+import orjson
+
+from src.services import exporter, storage
+
+
+def make_week(week: int = 3):
+    storage.write_json(storage.internal_doc_path(week, "week_spec.json"), {"metadata": {"week": week}})
+    for day in range(1, 5):
+        storage.write_file(storage.day_field_path(week, day, "01_class_name.txt"), f"Latin day {day}")
+        storage.write_file(storage.day_field_path(week, day, "07_sparkys_greeting.txt"), "Salve! " * 500)
+
+
+def tree_state(path):
+    return {p: p.stat().st_mtime_ns for p in sorted(path.rglob("*"))}
+
+
+def test_export_hashes_members_in_one_pass(curriculum_tmp, monkeypatch):
+    make_week(3)
+    week_path = storage.week_dir(3)
+    monkeypatch.setattr(exporter, "save_compiled_week_spec", lambda week: None)
+    monkeypatch.setattr(exporter, "save_compiled_role_context", lambda week: None)
+    before = tree_state(week_path)
+
+    opened = []
+    real_write_member = exporter._write_member
+    monkeypatch.setattr(
+        exporter, "_write_member",
+        lambda zipf, path, *args: opened.append(path) or real_write_member(zipf, path, *args)
+    )
+
+    zip_path = exporter.export_week_to_zip(3)
+
+    assert tree_state(week_path) == before  # nothing written into the week
+    assert len(opened) == len(set(opened)) == 9
+    assert not list(zip_path.parent.glob("*.tmp"))
+
+    with zipfile.ZipFile(zip_path) as zipf:
+        manifest = orjson.loads(zipf.read("Week03/manifest.json"))
+        assert manifest["file_count"] == 9
+        for entry in manifest["files"]:
+            data = zipf.read(f"Week03/{entry['path']}")
+            assert hashlib.sha256(data).hexdigest() == entry["sha256"]
+            assert len(data) == entry["size_bytes"]
+        assert zipf.getinfo("Week03/Day1_3.1/07_sparkys_greeting.txt").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_stale_manifest_in_week_is_not_exported(curriculum_tmp, monkeypatch):
+    make_week(4)
+    (storage.week_dir(4) / "manifest.json").write_text("stale")
+
+    zip_path = exporter.export_week_to_zip(4)
+
+    with zipfile.ZipFile(zip_path) as zipf:
+        names = zipf.namelist()
+        assert names.count("Week04/manifest.json") == 1
+        manifest = orjson.loads(zipf.read("Week04/manifest.json"))
+    assert "manifest.json" not in {entry["path"] for entry in manifest["files"]}
+
+
+def read_members(zip_path):
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert zipf.testzip() is None
+        return {name: zipf.read(name) for name in zipf.namelist()}
+
+
+def test_incremental_export_reuses_unchanged_members(curriculum_tmp):
+    make_week(5)
+    first = exporter.export_week(5)
+    assert first["status"] == "exported" and first["reused"] == 0
+
+    assert exporter.export_week(5)["status"] == "unchanged"
+
+    greeting = storage.day_field_path(5, 2, "07_sparkys_greeting.txt")
+    storage.write_file(greeting, "Salvete, discipuli!")
+    report = exporter.export_week(5)
+    assert report["status"] == "exported"
+    assert report["compressed"] == 1
+    assert report["reused"] == report["files"] - 1
+    assert report["bytes_read"] == len("Salvete, discipuli!")
+
+    members = read_members(report["zip_path"])
+    assert members["Week05/Day2_5.2/07_sparkys_greeting.txt"] == b"Salvete, discipuli!"
+    manifest = orjson.loads(members["Week05/manifest.json"])
+    for entry in manifest["files"]:
+        assert hashlib.sha256(members[f"Week05/{entry['path']}"]).hexdigest() == entry["sha256"]
+
+    full = exporter.export_week(5, incremental=False)
+    assert full["reused"] == 0 and full["compressed"] == full["files"]
+    assert read_members(full["zip_path"]).keys() == members.keys()
+
+
+def test_raw_copy_falls_back_to_recompressing(curriculum_tmp, monkeypatch):
+    make_week(8)
+    zip_path = exporter.export_week_to_zip(8)
+    arcname = "Week08/Day1_8.1/07_sparkys_greeting.txt"
+
+    # Corrupt one compressed member but keep the archive's recorded size and mtime
+    with zipfile.ZipFile(zip_path) as zipf:
+        info = zipf.getinfo(arcname)
+    st = zip_path.stat()
+    with open(zip_path, "r+b") as handle:
+        handle.seek(info.header_offset + 30 + len(arcname.encode()) + 2)
+        byte = handle.read(1)
+        handle.seek(-1, os.SEEK_CUR)
+        handle.write(bytes([byte[0] ^ 0xFF]))
+    os.utime(zip_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    storage.write_file(storage.day_field_path(8, 2, "01_class_name.txt"), "Changed")
+    report = exporter.export_week(8)
+    assert report["reused"] == report["files"] - 2  # the edited file and the corrupt member
+    members = read_members(report["zip_path"])
+    assert members[arcname] == b"Salve! " * 500
+
+    # A zipfile without the private header offsets recompresses everything
+    storage.write_file(storage.day_field_path(8, 2, "01_class_name.txt"), "Changed again")
+    with monkeypatch.context() as patch:
+        patch.delattr(zipfile, "_FH_SIGNATURE")
+        report = exporter.export_week(8)
+    assert report["reused"] == 0 and report["compressed"] == report["files"]
+    assert read_members(report["zip_path"])[arcname] == b"Salve! " * 500
+
+
+def test_replaced_archive_invalidates_saved_state(curriculum_tmp):
+    make_week(6)
+    zip_path = exporter.export_week_to_zip(6)
+    zip_path.write_bytes(b"not a zip")
+
+    report = exporter.export_week(6)
+    assert report["status"] == "exported" and report["reused"] == 0
+    assert "Week06/manifest.json" in read_members(zip_path)
+
+
+def test_export_weeks_aggregates_pool_results(curriculum_tmp):
+    for week in (1, 2, 3):
+        make_week(week)
+    (exporter.get_exports_dir() / "Week03.zip").mkdir(parents=True)  # cannot be replaced by a file
+
+    seen = []
+    report = exporter.export_weeks([1, 2, 3, 9], jobs=2, on_result=seen.append)
+
+    assert report["jobs"] == 2
+    assert [r["week"] for r in report["results"]] == [1, 2]
+    assert [e["week"] for e in report["errors"]] == [3]
+    assert report["skipped"] == [9]
+    assert sorted(outcome["week"] for outcome in seen) == [1, 2, 3]
+    assert report["exported"] == 2
+    assert report["source_bytes"] == sum(r["source_bytes"] for r in report["results"])
+    assert report["throughput_mb_s"] >= 0
+    assert "Week01/manifest.json" in read_members(report["results"][0]["zip_path"])
+    assert exporter.format_export_result(report["errors"][0]).startswith("✗ Failed to export Week 3")
+
+    again = exporter.export_weeks([1, 2], jobs=1)
+    assert again["unchanged"] == 2 and again["bytes_read"] == 0
+
+
+def test_bulk_exports_endpoint(curriculum_tmp, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import src.app as app_module
+
+    monkeypatch.delenv("API_AUTH_KEY", raising=False)
+    make_week(2)
+    client = TestClient(app_module.app)
+
+    response = client.post("/api/v1/exports", params={"weeks": "1-2", "jobs": 1})
+    assert response.status_code == 200
+    report = response.json()
+    assert report["skipped"] == [1]
+    assert report["results"][0]["zip_path"].endswith("Week02.zip")
+
+    assert client.post("/api/v1/exports", params={"weeks": "5-2"}).status_code == 400
+
+
+def test_stream_weeks_zip_yields_bounded_chunks(curriculum_tmp):
+    make_week(2)
+    make_week(3)
+    storage.write_file(storage.day_field_path(3, 4, "07_sparkys_greeting.txt"), "x" * (3 * exporter.EXPORT_CHUNK_SIZE))
+
+    chunks = list(exporter.stream_weeks_zip([2, 3]))
+    assert len(chunks) > 3
+    assert max(len(chunk) for chunk in chunks) < exporter.EXPORT_CHUNK_SIZE
+    assert not exporter.get_exports_dir().exists()  # nothing staged on disk
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zipf:
+        assert zipf.testzip() is None
+        for week in ("Week02", "Week03"):
+            manifest = orjson.loads(zipf.read(f"{week}/manifest.json"))
+            for entry in manifest["files"]:
+                assert hashlib.sha256(zipf.read(f"{week}/{entry['path']}")).hexdigest() == entry["sha256"]
+
+    stream = exporter.stream_weeks_zip([3])
+    next(stream)
+    stream.close()  # abandoned download
+
+
+def test_download_endpoints(curriculum_tmp, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import src.app as app_module
+
+    monkeypatch.setenv("API_AUTH_KEY", "secret")
+    make_week(4)
+    client = TestClient(app_module.app)
+
+    assert client.get("/api/v1/exports/download", params={"weeks": "4"}).status_code == 401
+    client.headers["X-API-Key"] = "secret"
+    streamed = client.get("/api/v1/exports/download", params={"weeks": "4"})
+    assert streamed.status_code == 200
+    assert 'filename="LatinA_Week04.zip"' in streamed.headers["content-disposition"]
+    assert "Week04/manifest.json" in zipfile.ZipFile(io.BytesIO(streamed.content)).namelist()
+    assert client.get("/api/v1/exports/download", params={"weeks": "4-5"}).status_code == 404
+
+    assert client.get("/api/v1/weeks/4/export/download").status_code == 404
+    zip_path = exporter.export_week_to_zip(4)
+
+    response = client.get("/api/v1/weeks/4/export/download")
+    assert response.status_code == 200
+    assert response.content == zip_path.read_bytes()
+    etag = response.headers["etag"]
+
+    assert client.get("/api/v1/weeks/4/export/download", headers={"If-None-Match": etag}).status_code == 304
+    partial = client.get("/api/v1/weeks/4/export/download", headers={"Range": "bytes=0-9"})
+    assert partial.status_code == 206
+    assert partial.content == zip_path.read_bytes()[:10]
+
+
+def test_deterministic_exports_are_byte_identical(curriculum_tmp):
+    make_week(7)
+    first = exporter.export_week(7, deterministic=True)
+    first_bytes = first["zip_path"].read_bytes()
+
+    for path in storage.week_dir(7).rglob("*"):  # same content, new mtimes
+        os.utime(path, ns=(1, 10 ** 18))
+    rebuilt = exporter.export_week(7, deterministic=True, incremental=False)
+    assert rebuilt["zip_path"].read_bytes() == first_bytes
+    assert rebuilt["content_hash"] == first["content_hash"]
+
+    storage.write_file(storage.day_field_path(7, 3, "01_class_name.txt"), "Changed")
+    changed = exporter.export_week(7, deterministic=True)
+    assert changed["reused"] > 0 and changed["content_hash"] != first["content_hash"]
+    incremental_bytes = changed["zip_path"].read_bytes()
+    full = exporter.export_week(7, deterministic=True, incremental=False)
+    assert full["zip_path"].read_bytes() == incremental_bytes  # raw-copied members match recompressed ones
+
+    with zipfile.ZipFile(changed["zip_path"]) as zipf:
+        names = zipf.namelist()
+        assert names[:-1] == sorted(names[:-1])
+        assert {info.date_time for info in zipf.infolist()} == {exporter.DETERMINISTIC_DATE_TIME}
+        manifest = orjson.loads(zipf.read("Week07/manifest.json"))
+    assert "export_date" not in manifest
+    assert manifest["content_hash"] == changed["content_hash"]
+
+    streamed = b"".join(exporter.stream_weeks_zip([7], deterministic=True))
+    assert streamed == b"".join(exporter.stream_weeks_zip([7], deterministic=True))
+
+    from fastapi.testclient import TestClient
+
+    import src.app as app_module
+
+    response = TestClient(app_module.app).get("/api/v1/weeks/7/export/download")
+    assert response.headers["etag"] == f'"{changed["content_hash"]}"'
+    assert exporter.export_week(7, deterministic=False)["reused"] == 0  # other mode: rebuilt
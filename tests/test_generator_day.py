@@ -0,0 +1,254 @@
+"""Tests for concurrent day generation in generator_day."""
+import threading
+import time
+
+import pytest
+
+from src.services import generator_day
+
+
+class DayStubs:
+    """Stand-ins for the per-day generation steps that track concurrency."""
+
+    def __init__(self, delay: float = 0.05, fail_days=()):
+        self.delay = delay
+        self.fail_days = set(fail_days)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.documents_done = set()
+        self.assessment_saw = None
+
+    def fields(self, week, day, client):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if day in self.fail_days:
+            raise RuntimeError(f"day {day} broke")
+        return [f"W{week}D{day}/01_class_name.txt"]
+
+    def document(self, week, day, client):
+        with self.lock:
+            self.documents_done.add(day)
+        return f"W{week}D{day}/document_for_sparky"
+
+    def assessment(self, week, client):
+        self.assessment_saw = set(self.documents_done)
+        return {"quiz_packet": "QuizPacket.txt", "teacher_key": "TeacherKey.txt", "status": "success"}
+
+
+@pytest.fixture
+def stubs(monkeypatch):
+    def install(**kwargs):
+        day_stubs = DayStubs(**kwargs)
+        monkeypatch.setattr(generator_day, "generate_day_fields", day_stubs.fields)
+        monkeypatch.setattr(generator_day, "generate_day_document", day_stubs.document)
+        monkeypatch.setattr(generator_day, "generate_day4_assessment", day_stubs.assessment)
+        return day_stubs
+    return install
+
+
+def test_days_run_concurrently_then_assessment(stubs):
+    day_stubs = stubs()
+    results = generator_day.hydrate_week_days(5, client=None)
+
+    assert list(results) == [1, 2, 3, 4]
+    assert day_stubs.max_in_flight == 4
+    assert 4 in day_stubs.assessment_saw
+    assert results[4]["assessment_paths"]["quiz_packet"] == "QuizPacket.txt"
+    for day, result in results.items():
+        assert result["status"] == "success"
+        assert result["field_paths"] == [f"W5D{day}/01_class_name.txt"]
+
+
+def test_day_failure_is_isolated(stubs):
+    stubs(delay=0, fail_days={2})
+    results = generator_day.hydrate_week_days(5, client=None)
+
+    assert results[2] == {"week": 5, "day": 2, "status": "error", "error": "day 2 broke"}
+    assert results[1]["status"] == results[3]["status"] == "success"
+    assert "assessment_paths" in results[4]
+
+
+def test_assessment_skipped_when_day4_fails(stubs):
+    day_stubs = stubs(delay=0, fail_days={4})
+    results = generator_day.hydrate_week_days(5, client=None)
+
+    assert results[4]["status"] == "error"
+    assert day_stubs.assessment_saw is None
+
+
+def test_serial_hydrate_still_runs_assessment(stubs):
+    stubs(delay=0)
+    result = generator_day.hydrate_day_from_llm(5, 4, client=None)
+    assert result["assessment_paths"]["teacher_key"] == "TeacherKey.txt"
+
+
+class FieldStubs:
+    """Stand-ins for the per-field LLM steps of generate_day_fields."""
+
+    def __init__(self, delay: float = 0.05, fail=None):
+        self.delay = delay
+        self.fail = fail
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.summary_class_name = None
+
+    def _work(self, name):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if name == self.fail:
+            raise RuntimeError(f"{name} broke")
+
+    def fields(self, week, day, week_spec, client):
+        self._work("fields")
+        return {"class_name": "Latin Nouns", "grade_level": "3-5"}
+
+    def role_context(self, week_spec, day, client):
+        self._work("role_context")
+        return {"sparky_role": "guide"}
+
+    def guidelines(self, week_spec, day, role_context, client):
+        assert role_context == {"sparky_role": "guide"}
+        self._work("guidelines")
+        return "Be kind."
+
+    def summary(self, week, day, class_name, week_spec, client):
+        self.summary_class_name = class_name
+        self._work("summary")
+        return "Today we study Latin nouns."
+
+    def greeting(self, week_spec, day, role_context, client):
+        self._work("greeting")
+        return "Salvete!"
+
+
+@pytest.fixture
+def field_stubs(tmp_path, monkeypatch):
+    from src.services import storage
+
+    monkeypatch.setattr(storage, "get_curriculum_base", lambda: tmp_path)
+    spec_path = storage.internal_doc_path(6, "week_spec.json")
+    storage.write_json(spec_path, {"metadata": {"title": "Nouns"}})
+
+    def install(**kwargs):
+        field = FieldStubs(**kwargs)
+        monkeypatch.setattr(generator_day, "_generate_fields_data", field.fields)
+        monkeypatch.setattr(generator_day, "_generate_role_context_data", field.role_context)
+        monkeypatch.setattr(generator_day, "_generate_guidelines", field.guidelines)
+        monkeypatch.setattr(generator_day, "_generate_summary", field.summary)
+        monkeypatch.setattr(generator_day, "_generate_greeting", field.greeting)
+        return field
+    return install
+
+
+def test_day_fields_run_in_two_concurrent_chains(field_stubs):
+    from src.services.storage import day_field_path, read_json
+
+    field = field_stubs()
+    started = time.perf_counter()
+    paths = generator_day.generate_day_fields(6, 2, client=None)
+    elapsed = time.perf_counter() - started
+
+    # Longest chain is two calls deep (fields -> summary, role_context -> greeting)
+    assert elapsed < field.delay * 4
+    assert field.max_in_flight >= 2
+    assert field.summary_class_name == "Latin Nouns"
+    assert len(paths) == 6
+    assert day_field_path(6, 2, "02_summary.md").read_text(encoding="utf-8") == "Today we study Latin nouns."
+    assert read_json(day_field_path(6, 2, "04_role_context.json")) == {"sparky_role": "guide"}
+
+
+def test_day_fields_write_nothing_when_a_field_fails(field_stubs):
+    from src.services.storage import day_field_path
+
+    field_stubs(delay=0, fail="greeting")
+    with pytest.raises(RuntimeError, match="greeting broke"):
+        generator_day.generate_day_fields(6, 2, client=None)
+
+    summary_path = day_field_path(6, 2, "02_summary.md")
+    assert "Today we study" not in summary_path.read_text(encoding="utf-8")
+
+
+class Terminal:
+    """stdin stand-in that claims to be interactive."""
+
+    def isatty(self):
+        return True
+
+
+def test_failure_prompts_from_concurrent_days_take_turns(monkeypatch, capsys):
+    state = {"open": 0, "overlapped": False}
+
+    def slow_input(prompt):
+        state["open"] += 1
+        state["overlapped"] |= state["open"] > 1
+        time.sleep(0.02)
+        state["open"] -= 1
+        return "y"
+
+    monkeypatch.setattr(generator_day.sys, "stdin", Terminal())
+    monkeypatch.setattr("builtins.input", slow_input)
+    threads = [
+        threading.Thread(target=generator_day._prompt_user_to_continue, args=(5, day, "document_for_sparky"))
+        for day in range(1, 5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not state["overlapped"]
+    assert capsys.readouterr().out.count("GENERATION FAILED") == 4
+
+def test_full_week_dry_run_without_network(tmp_path, monkeypatch):
+    """Planning (PHASE 0 + 1) and all four days run on DRY_RUN placeholders."""
+    from types import SimpleNamespace
+
+    from src.config import settings
+    from src.services import knowledge_ledger, storage
+    from src.services.generator_week import generate_week_planning, scaffold_week
+    from src.services.llm_client import OpenAIClient
+    from src.services.prompts import phase0_research
+
+    for module in (storage, knowledge_ledger, phase0_research):
+        monkeypatch.setattr(module, "get_curriculum_base", lambda: tmp_path)
+    monkeypatch.setattr(knowledge_ledger, "_ledger", None)
+    monkeypatch.setattr(settings, "logs_path", tmp_path / "logs")
+    monkeypatch.setattr(settings, "DRY_RUN", True)
+
+    def no_network(**kwargs):
+        raise AssertionError("dry run reached the OpenAI API")
+
+    client = OpenAIClient(api_key="dry-run")
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=no_network)))
+
+    scaffold_week(5)
+    generate_week_planning(5, client)
+    results = generator_day.hydrate_week_days(5, client)
+
+    assert all(result["status"] == "success" for result in results.values())
+    assert "assessment_paths" in results[4]
+
+
+def test_failure_prompt_without_terminal_aborts(monkeypatch):
+    def no_input(prompt):
+        raise AssertionError("prompted without a terminal")
+
+    monkeypatch.setattr("builtins.input", no_input)
+    assert generator_day._prompt_user_to_continue(5, 1, "document_for_sparky") is False
+
+    def closed_stdin(prompt):
+        raise EOFError
+
+    monkeypatch.setattr(generator_day.sys, "stdin", Terminal())
+    monkeypatch.setattr("builtins.input", closed_stdin)
+    assert generator_day._prompt_user_to_continue(5, 1, "document_for_sparky") is False
@@ -0,0 +1,175 @@
+"""Tests for the background generation job queue."""
+import sys
+import time
+
+import pytest
+
+from src.services.job_queue import (
+    ABORTED,
+    ABORTED_EXIT_CODE,
+    CANCELLED,
+    FAILED,
+    SUCCEEDED,
+    JobQueue,
+    parse_progress,
+)
+from src.services.progress_bus import get_progress_bus
+from src.services.rate_limiter import RATE_LIMIT_SHARE_ENV
+
+SCRIPT = """
+import sys, time
+print("  Scaffolding Week 3...")
+print("  === PHASE 1: Week Planning ===")
+print("  === PHASE 2: Day Generation ===")
+for day in range(1, 5):
+    print(f"  Day {day}:")
+time.sleep(float(sys.argv[1]))
+sys.exit(int(sys.argv[2]))
+"""
+
+
+def fake_command(sleep=0.0, code=0):
+    def command(week, params):
+        return [sys.executable, "-c", SCRIPT, str(sleep), str(code)]
+    return command
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    queues = []
+
+    def make(**kwargs):
+        events = []
+        queue = JobQueue(
+            db_path=tmp_path / "jobs.sqlite",
+            log_dir=tmp_path / "jobs",
+            on_progress=events.append,
+            **kwargs
+        )
+        queue.events = events
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        queue.shutdown()
+
+
+def wait_for(queue, job_id, statuses, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job stuck in {queue.get(job_id)['status']}")
+
+
+def test_parse_progress():
+    assert parse_progress("  Day 3:\n") == {"step": 6, "day": 3, "message": "Generating Day 3"}
+    assert parse_progress("  === PHASE 1: Week Planning ===")["step"] == 2
+    assert parse_progress("    ✓ week_spec.json generated") is None
+
+
+def test_job_runs_and_reports_progress(make_queue):
+    queue = make_queue(command=fake_command())
+    job = queue.submit(3)
+    assert job["status"] == "queued" and job["deduplicated"] is False
+
+    job = wait_for(queue, job["id"], {SUCCEEDED, FAILED})
+    assert job["status"] == SUCCEEDED
+    assert job["return_code"] == 0
+
+    steps = [event["step"] for event in queue.events]
+    assert steps == sorted(steps)
+    assert [event["day"] for event in queue.events if event["day"]] == [1, 2, 3, 4]
+    assert queue.events[-1]["status"] == SUCCEEDED
+
+    logs = queue.logs(job["id"])
+    assert "PHASE 2" in logs["text"]
+    assert queue.logs(job["id"], offset=logs["offset"])["text"] == ""
+
+
+def test_child_progress_events_are_forwarded_to_bus(make_queue):
+    script = (
+        "from src.services.progress_bus import publish_progress\n"
+        "print('  Day 2:', end='', flush=True)\n"
+        "publish_progress(7, day=2, phase='document', tokens=9)\n"
+        "print()\n"
+    )
+    queue = make_queue(command=lambda week, params: [sys.executable, "-c", script])
+    bus = get_progress_bus()
+    events = []
+    token = bus.subscribe(events.append, weeks=[7])
+    try:
+        job = wait_for(queue, queue.submit(7)["id"], {SUCCEEDED, FAILED})
+        bus.flush()
+    finally:
+        bus.unsubscribe(token)
+
+    assert job["status"] == SUCCEEDED
+    assert [(e["phase"], e["tokens"], e["job_id"]) for e in events] == [("document", 9, job["id"])]
+    assert queue.logs(job["id"])["text"] == "  Day 2:\n"  # nothing spliced into the output
+
+
+def test_children_are_told_their_rate_limit_share(make_queue):
+    script = f"import os; print(os.environ['{RATE_LIMIT_SHARE_ENV}'])"
+    queue = make_queue(command=lambda week, params: [sys.executable, "-c", script], max_workers=3)
+    job = wait_for(queue, queue.submit(4)["id"], {SUCCEEDED, FAILED})
+    assert queue.logs(job["id"])["text"] == "3\n"
+
+
+def test_same_week_is_deduplicated(make_queue):
+    queue = make_queue(command=fake_command(sleep=0.5))
+    first = queue.submit(3)
+    second = queue.submit(3)
+    other = queue.submit(4)
+
+    assert second["id"] == first["id"] and second["deduplicated"] is True
+    assert other["id"] != first["id"]
+    assert queue.active_count() == 2
+
+
+def test_cancel_terminates_running_job(make_queue):
+    queue = make_queue(command=fake_command(sleep=30))
+    job = queue.submit(5)
+    wait_for(queue, job["id"], {"running"})
+
+    started = time.monotonic()
+    assert queue.cancel(job["id"])["status"] == CANCELLED
+    time.sleep(0.2)
+    assert queue.get(job["id"])["status"] == CANCELLED
+    assert time.monotonic() - started < 5
+
+
+def test_cancel_queued_job_never_runs(make_queue):
+    queue = make_queue(command=fake_command(sleep=0.5))
+    running = queue.submit(1)
+    queued = queue.submit(2)
+    queue.cancel(queued["id"])
+
+    wait_for(queue, running["id"], {SUCCEEDED})
+    time.sleep(0.1)
+    assert queue.get(queued["id"])["started_at"] is None
+
+
+def test_failed_and_interrupted_jobs(make_queue):
+    queue = make_queue(command=fake_command(code=3))
+    job = wait_for(queue, queue.submit(6)["id"], {SUCCEEDED, FAILED})
+    assert job["status"] == FAILED
+    assert job["error"] == "Exited with code 3"
+
+    aborted = make_queue(command=fake_command(code=ABORTED_EXIT_CODE))
+    job = wait_for(aborted, aborted.submit(8)["id"], {SUCCEEDED, FAILED, ABORTED})
+    assert job["status"] == ABORTED
+    assert job["error"].startswith("Aborted")
+    assert aborted.events[-1]["status"] == ABORTED
+
+    slow = make_queue(command=fake_command(sleep=30))
+    pending = slow.submit(7)
+    wait_for(slow, pending["id"], {"running"})
+
+    # A new queue on the same table (server restart) fails the orphaned job
+    restarted = make_queue(command=fake_command())
+    assert restarted.get(pending["id"])["status"] == FAILED
+    assert restarted.get(pending["id"])["error"] == "Interrupted by server restart"
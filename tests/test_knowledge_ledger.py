@@ -0,0 +1,109 @@
+"""Tests for the incremental student knowledge ledger."""
+from src.services import storage
+from src.services.knowledge_ledger import KnowledgeLedger, extract_week_delta
+
+
+def _write_spec(week, spec):
+    storage.write_json(storage.internal_doc_path(week, "week_spec.json"), spec)
+
+
+class TestExtractWeekDelta:
+    """Test delta extraction from week_spec layouts."""
+
+    def test_llm_layout(self):
+        spec = {
+            "metadata": {"week": 2, "title": "First Declension"},
+            "vocabulary": [{"latin": "puella", "english": "girl", "part_of_speech": "noun"}],
+            "grammar_focus": "First declension singular; nominative case",
+        }
+        delta = extract_week_delta(2, spec)
+        assert delta["vocabulary"] == [{"word": "puella", "english": "girl", "part_of_speech": "noun"}]
+        assert delta["grammar_concepts"] == ["First declension singular", "nominative case"]
+        assert delta["title"] == "First Declension"
+
+    def test_reverse_engineered_layout(self):
+        spec = {
+            "metadata": {"title": "Week 11"},
+            "vocabulary": {"core_items": ["amō (love)", "portō (carry)"]},
+            "objectives": {"grammar_focus": "conjugate -āre verbs"},
+        }
+        delta = extract_week_delta(11, spec)
+        assert [v["word"] for v in delta["vocabulary"]] == ["amō", "portō"]
+        assert delta["vocabulary"][0]["english"] == "love"
+        assert delta["grammar_concepts"] == ["conjugate -āre verbs"]
+
+
+class TestKnowledgeLedger:
+    """Test ledger merging and persistence."""
+
+    def test_falls_back_to_outline_for_missing_weeks(self, curriculum_tmp):
+        ledger = KnowledgeLedger()
+        cumulative = ledger.cumulative_before(3)
+
+        assert cumulative["prior_weeks_reviewed"] == [1, 2]
+        words = [v["word"] for v in cumulative["cumulative_latin_vocabulary"]]
+        assert "puella" in words
+        assert (curriculum_tmp / "knowledge_ledger.json").exists()
+
+    def test_generated_spec_overrides_outline(self, curriculum_tmp):
+        _write_spec(1, {"vocabulary": [{"latin": "salve", "english": "hello"}], "grammar_focus": "alphabet"})
+        ledger = KnowledgeLedger()
+        cumulative = ledger.cumulative_before(2)
+
+        assert cumulative["cumulative_latin_vocabulary"] == [{
+            "word": "salve",
+            "english": "hello",
+            "week_introduced": 1,
+            "part_of_speech": None,
+            "mastery_expected": False,
+        }]
+        assert cumulative["cumulative_grammar_concepts"][0]["concept"] == "alphabet"
+
+    def test_empty_scaffold_spec_uses_outline(self, curriculum_tmp):
+        _write_spec(1, {})
+        delta = KnowledgeLedger().deltas_before(2)[0]
+        assert delta["source"] == "outline"
+
+    def test_stale_spec_is_reread(self, curriculum_tmp):
+        _write_spec(1, {"vocabulary": [{"latin": "salve"}], "grammar_focus": "alphabet"})
+        ledger = KnowledgeLedger()
+        ledger.deltas_before(2)
+
+        _write_spec(1, {"vocabulary": [{"latin": "vale"}, {"latin": "salve"}], "grammar_focus": "alphabet"})
+        words = [v["word"] for v in ledger.deltas_before(2)[0]["vocabulary"]]
+        assert words == ["vale", "salve"]
+
+    def test_first_occurrence_wins(self, curriculum_tmp):
+        _write_spec(1, {"vocabulary": [{"latin": "salve"}], "grammar_focus": "alphabet"})
+        _write_spec(2, {"vocabulary": [{"latin": "Salve"}, {"latin": "puella"}], "grammar_focus": "1st declension"})
+        vocab = KnowledgeLedger().cumulative_before(3)["cumulative_latin_vocabulary"]
+
+        assert [(v["word"], v["week_introduced"]) for v in vocab] == [("salve", 1), ("puella", 2)]
+        assert vocab[0]["mastery_expected"] is True
+
+    def test_digest_size_is_bounded(self, curriculum_tmp):
+        ledger = KnowledgeLedger()
+        early = ledger.digest(6)
+        late = ledger.digest(35)
+
+        assert len(late["recent_weeks"]) == len(early["recent_weeks"]) == 3
+        assert len(late["earlier_week_titles"]) <= 12
+        assert late["weeks_completed"] == 34
+
+    def test_record_week_spec_persists(self, curriculum_tmp):
+        _write_spec(4, {"vocabulary": [{"latin": "aqua"}], "grammar_focus": "genitive"})
+        KnowledgeLedger().record_week_spec(4, storage.read_json(storage.internal_doc_path(4, "week_spec.json")))
+
+        reloaded = KnowledgeLedger()
+        assert reloaded.data["weeks"]["4"]["vocabulary"][0]["word"] == "aqua"
+        assert reloaded.data["weeks"]["4"]["spec_sha256"]
+
+    def test_works_on_sqlite_backend(self, sqlite_store, curriculum_tmp):
+        _write_spec(1, {"vocabulary": [{"latin": "salve"}], "grammar_focus": "alphabet"})
+        assert KnowledgeLedger().deltas_before(2)[0]["source"] == "week_spec"
+        assert not (curriculum_tmp / "knowledge_ledger.json").exists()
+
+        reloaded = KnowledgeLedger()
+        assert reloaded.data["weeks"]["1"]["vocabulary"][0]["word"] == "salve"
+        _write_spec(1, {"vocabulary": [{"latin": "vale"}], "grammar_focus": "alphabet"})
+        assert reloaded.deltas_before(2)[0]["vocabulary"][0]["word"] == "vale"
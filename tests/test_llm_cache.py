@@ -0,0 +1,107 @@
+"""Tests for the content-addressed LLM response cache."""
+import pytest
+
+from src.services.llm_cache import ResponseCache, CachedLLMClient, cache_key
+from src.services.llm_client import LLMResponse
+from tests.test_llm_client import FakeLLMClient
+
+
+class CountingClient(FakeLLMClient):
+    """Fake client returning a distinct response per call."""
+
+    model = "gpt-4o"
+    temp = 0.25
+
+    def generate(self, prompt, system=None, json_schema=None):
+        super().generate(prompt, system, json_schema)
+        return LLMResponse(
+            text=f"response {self.call_count}",
+            tokens_prompt=100,
+            tokens_completion=50,
+            model=self.model,
+            provider="openai"
+        )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(db_path=tmp_path / "llm.sqlite")
+
+
+def test_cache_key_depends_on_every_input():
+    """Changing any keyed input should change the hash."""
+    base = cache_key("gpt-4o", 0.2, "sys", "prompt", {"type": "object"})
+    assert base == cache_key("gpt-4o", 0.2, "sys", "prompt", {"type": "object"})
+    assert base != cache_key("gpt-4o-mini", 0.2, "sys", "prompt", {"type": "object"})
+    assert base != cache_key("gpt-4o", 0.3, "sys", "prompt", {"type": "object"})
+    assert base != cache_key("gpt-4o", 0.2, "other", "prompt", {"type": "object"})
+    assert base != cache_key("gpt-4o", 0.2, "sys", "prompt2", {"type": "object"})
+    assert base != cache_key("gpt-4o", 0.2, "sys", "prompt", None)
+
+
+def test_rerun_is_served_from_disk(tmp_path):
+    """A new process (fresh wrapper) should replay the stored response for free."""
+    db_path = tmp_path / "llm.sqlite"
+
+    first = CachedLLMClient(CountingClient(), ResponseCache(db_path=db_path))
+    assert first.generate("salve", system="sys").text == "response 1"
+
+    inner = CountingClient()
+    second = CachedLLMClient(inner, ResponseCache(db_path=db_path))
+    replay = second.generate("salve", system="sys")
+
+    assert replay.text == "response 1"
+    assert replay.cached is True
+    assert replay.tokens_prompt == 0
+    assert inner.call_count == 0
+    assert second.cache.get_stats()["hits"] == 1
+    assert second.cache.get_stats()["tokens_saved"] == 150
+
+
+def test_repeat_within_run_is_treated_as_retry(cache):
+    """Re-sending a prompt in the same run must reach the model again."""
+    inner = CountingClient()
+    client = CachedLLMClient(inner, cache)
+
+    client.generate("salve")
+    retry = client.generate("salve")
+
+    assert retry.text == "response 2"
+    assert inner.call_count == 2
+
+    # The latest response is what the next run replays
+    rerun = CachedLLMClient(CountingClient(), cache)
+    assert rerun.generate("salve").text == "response 2"
+
+
+def test_refresh_skips_reads_but_writes(cache):
+    """refresh=True should bypass cached entries and overwrite them."""
+    CachedLLMClient(CountingClient(), cache).generate("salve")
+
+    inner = CountingClient()
+    refreshed = CachedLLMClient(inner, cache, refresh=True).generate("salve")
+    assert refreshed.cached is False
+    assert inner.call_count == 1
+
+
+def test_lru_eviction_by_size(tmp_path):
+    """Least recently used entries should be evicted past max_bytes."""
+    cache = ResponseCache(db_path=tmp_path / "llm.sqlite", max_bytes=600)
+    for i in range(10):
+        cache.put(f"k{i}", LLMResponse(text="x" * 100, model="gpt-4o", provider="openai"))
+
+    stats = cache.get_stats()
+    assert stats["size_bytes"] <= 600
+    assert stats["evictions"] > 0
+    assert cache.get("k0") is None
+    assert cache.get("k9") is not None
+
+
+def test_wrapper_exposes_inner_attributes(cache):
+    """Callers reading client.model / client.client should still work."""
+    inner = CountingClient()
+    inner.client = object()
+    client = CachedLLMClient(inner, cache)
+
+    assert client.model == "gpt-4o"
+    assert client.client is inner.client
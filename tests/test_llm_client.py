@@ -1,6 +1,12 @@
 """Tests for LLM client abstraction."""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
-from src.services.llm_client import LLMClient, LLMResponse
+from src.services.llm_client import LLMClient, LLMResponse, AsyncOpenAIClient
 
 
 class FakeLLMClient(LLMClient):
@@ -14,7 +20,7 @@ class FakeLLMClient(LLMClient):
         self.last_prompt = None
         self.last_system = None
 
-    def generate(self, prompt, system=None, json_schema=None):
+    def generate(self, prompt, system=None, json_schema=None, **overrides):
         """Return canned response and track calls."""
         self.call_count += 1
         self.last_prompt = prompt
@@ -81,3 +87,158 @@ def test_llm_response_json_optional():
     assert response.text == "plain text response"
     assert response.json is None
     assert response.raw is None
+
+
+# ============================================================================
+# ASYNC CLIENT (offline, against a local OpenAI-compatible server)
+# ============================================================================
+
+class _FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Minimal /chat/completions endpoint that echoes the user prompt."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.requests.append(body)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+
+        prompt = body["messages"][-1]["content"]
+        payload = json.dumps({
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": json.dumps({"echo": prompt})}
+            }],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10}
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_openai_server():
+    """Run a fake OpenAI-compatible server on an ephemeral port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOpenAIHandler)
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.requests = []
+    server.delay = 0.05
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _async_client(server, max_connections=20):
+    host, port = server.server_address
+    return AsyncOpenAIClient(
+        api_key="test-key",
+        base_url=f"http://{host}:{port}/v1",
+        max_connections=max_connections
+    )
+
+
+def test_base_agenerate_delegates_to_generate():
+    """LLMClient.agenerate should fall back to generate() in a thread."""
+    fake = FakeLLMClient()
+    response = asyncio.run(fake.agenerate("async prompt", system="sys"))
+
+    assert response.json == {"test": "response"}
+    assert fake.call_count == 1
+    assert fake.last_prompt == "async prompt"
+
+
+def test_async_client_response_contract(fake_openai_server):
+    """agenerate should return the same LLMResponse shape as generate."""
+    client = _async_client(fake_openai_server)
+
+    async def run():
+        try:
+            return await client.agenerate("salve", system="You are Sparky")
+        finally:
+            await client.aclose()
+
+    response = asyncio.run(run())
+
+    assert response.json == {"echo": "salve"}
+    assert response.tokens_prompt == 7
+    assert response.tokens_completion == 3
+    assert response.provider == "openai"
+    assert response.model == "gpt-4o"
+    assert fake_openai_server.requests[0]["messages"][0]["role"] == "system"
+
+
+def test_async_client_sync_generate_matches(fake_openai_server):
+    """The sync path of AsyncOpenAIClient should still work."""
+    client = _async_client(fake_openai_server)
+    response = client.generate("vale")
+
+    assert response.json == {"echo": "vale"}
+    assert response.tokens_prompt == 7
+
+
+def test_async_client_bounded_pool(fake_openai_server):
+    """Concurrent calls should never exceed max_connections in flight."""
+    client = _async_client(fake_openai_server, max_connections=2)
+
+    async def run():
+        try:
+            return await asyncio.gather(*[client.agenerate(f"p{i}") for i in range(6)])
+        finally:
+            await client.aclose()
+
+    responses = asyncio.run(run())
+
+    assert [r.json["echo"] for r in responses] == [f"p{i}" for i in range(6)]
+    assert len(fake_openai_server.requests) == 6
+    assert 1 <= fake_openai_server.max_in_flight <= 2
+
+
+def test_async_client_dry_run(monkeypatch):
+    """Dry-run mode should return the placeholder without any network."""
+    from src.config import settings
+    monkeypatch.setattr(settings, "DRY_RUN", True)
+    client = AsyncOpenAIClient(api_key="test-key", base_url="http://127.0.0.1:9/v1")
+
+    response = asyncio.run(client.agenerate("anything"))
+
+    assert response.provider == "dry-run"
+    assert response.tokens_prompt == 0
+
+
+def test_build_request_per_call_overrides():
+    """Per-call model/temperature/response_format overrides shape the request."""
+    from src.services.llm_client import OpenAIClient
+
+    client = OpenAIClient(api_key="test", model="gpt-4o", temp=0.2, max_tokens=500)
+
+    request = client._build_request(
+        "prompt", "system", None, model="gpt-4o-mini", temperature=0.7,
+        response_format={"type": "json_object"}
+    )
+    assert request["model"] == "gpt-4o-mini"
+    assert request["temperature"] == 0.7
+    assert request["response_format"] == {"type": "json_object"}
+
+    reasoning = client._build_request("prompt", "system", None, model="o1-mini", temperature=0.3)
+    assert reasoning["model"] == "o1-mini"
+    assert "temperature" not in reasoning and "max_tokens" not in reasoning
+    assert reasoning["messages"] == [{"role": "user", "content": "system\n\nprompt"}]
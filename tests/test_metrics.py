@@ -0,0 +1,100 @@
+"""Tests for the Prometheus metrics registry and its instrumentation."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.metrics import Registry, get_registry
+
+
+def test_counter_and_gauge_render_with_labels():
+    registry = Registry()
+    requests = registry.counter("t_requests_total", "Requests", ("model",))
+    requests.inc(model="gpt-4o")
+    requests.inc(2, model='quo"ted')
+    registry.gauge("t_depth", "Depth").set(3)
+
+    text = registry.render()
+    assert "# TYPE t_requests_total counter" in text
+    assert 't_requests_total{model="gpt-4o"} 1' in text
+    assert 't_requests_total{model="quo\\"ted"} 2' in text
+    assert "t_depth 3" in text
+    assert registry.counter("t_requests_total", "Requests", ("model",)) is requests
+
+    with pytest.raises(ValueError):
+        registry.gauge("t_requests_total", "Requests", ("model",))
+    with pytest.raises(ValueError):
+        requests.inc(task="x")
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    latency = registry.histogram("t_seconds", "Latency", ("op",), buckets=(0.1, 1))
+    for value in (0.05, 0.5, 5):
+        latency.observe(value, op="read")
+
+    text = registry.render()
+    assert 't_seconds_bucket{op="read",le="0.1"} 1' in text
+    assert 't_seconds_bucket{op="read",le="1"} 2' in text
+    assert 't_seconds_bucket{op="read",le="+Inf"} 3' in text
+    assert 't_seconds_sum{op="read"} 5.55' in text
+    assert 't_seconds_count{op="read"} 3' in text
+
+
+def test_collectors_are_read_at_render_time(tmp_path):
+    registry = Registry()
+    depth = {"queued": 1}
+    registry.add_collector("jobs", lambda: [
+        ("t_jobs", "gauge", "Jobs", [({"status": s}, n) for s, n in depth.items()])
+    ])
+    registry.add_collector("broken", lambda: 1 / 0)
+
+    depth["queued"] = 4
+    text = registry.render()
+    assert 't_jobs{status="queued"} 4' in text
+    assert "# collector broken failed: ZeroDivisionError" in text
+
+    path = registry.write(tmp_path / "out" / "metrics.prom")
+    assert 't_jobs{status="queued"} 4' in path.read_text()
+
+
+def test_instrumented_client_updates_llm_metrics(monkeypatch):
+    from src.services import instrumented_client
+    from src.services.instrumented_client import InstrumentedClient
+    from src.services.metrics import LLM_REQUESTS, LLM_RETRIES, LLM_TOKENS
+
+    monkeypatch.setattr(instrumented_client, "get_tracker", lambda: SimpleNamespace(track=lambda **kw: None))
+
+    class Client:
+        def __init__(self):
+            self.calls = 0
+
+        def generate(self, prompt, **kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                raise TimeoutError("slow")
+            return SimpleNamespace(text="ok", tokens_prompt=10, tokens_completion=5, model="m-test",
+                                   provider="openai", cached=False)
+
+    client = InstrumentedClient(Client(), 7, 1, "day_fields", "summary", "task_metrics_test")
+    with pytest.raises(TimeoutError):
+        client.generate(prompt="p", model="m-test")
+    client.generate(prompt="p")
+
+    assert LLM_REQUESTS.value(model="m-test", task="task_metrics_test", status="error") == 1
+    assert LLM_REQUESTS.value(model="m-test", task="task_metrics_test", status="ok") == 1
+    assert LLM_RETRIES.value(task="task_metrics_test") == 1
+    assert LLM_TOKENS.value(model="m-test", kind="completion") == 5
+    assert 'tequila_llm_request_seconds_count{model="m-test",task="task_metrics_test",cache_hit="False"} 1' \
+        in get_registry().render()
+
+
+def test_metrics_endpoint_serves_text_format():
+    from fastapi.testclient import TestClient
+
+    import src.app as app_module
+
+    response = TestClient(app_module.app).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE tequila_llm_requests_total counter" in response.text
+    assert "tequila_websocket_clients" in response.text
@@ -0,0 +1,205 @@
+"""Tests for the PHASE 0 research dependency-graph executor."""
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.llm_client import LLMClient, LLMResponse
+from src.services.prompts import phase0_research
+from src.services.prompts.phase0_research import (
+    _run_task_graph,
+    execute_phase0_research,
+    get_master_analysis,
+)
+
+
+class FakePhase0LLM(LLMClient):
+    """LLMClient stand-in that records concurrency and per-call overrides."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.models = []
+
+    def generate(self, prompt, system=None, json_schema=None, model=None,
+                 temperature=None, response_format=None):
+        with self.lock:
+            self.calls += 1
+            self.models.append(model)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+
+        content = {
+            "cumulative_latin_vocabulary": [{"word": "salve"}],
+            "vocabulary_seeds_for_future": [],
+            "standard_vocabulary_for_this_topic": ["puella"],
+            "new_latin_words": [{"word": "puella"}],
+            "recycled_latin_words": [{"word": "salve"}],
+        }
+        return LLMResponse(text=json.dumps(content), json=content)
+
+
+class TestTaskGraph:
+    """Test the generic DAG scheduler."""
+
+    def test_dependencies_see_upstream_results(self):
+        tasks = {
+            "a": ([], lambda r: 1, "a"),
+            "b": ([], lambda r: 2, "b"),
+            "c": (["a", "b"], lambda r: r["a"] + r["b"], "c"),
+        }
+        results, timings = _run_task_graph(tasks)
+        assert results == {"a": 1, "b": 2, "c": 3}
+        assert set(timings) == {"a", "b", "c"}
+
+    def test_independent_tasks_overlap(self):
+        def slow(r):
+            time.sleep(0.1)
+            return True
+
+        tasks = {name: ([], slow, name) for name in "abcd"}
+        started = time.perf_counter()
+        _run_task_graph(tasks, max_workers=4)
+        assert time.perf_counter() - started < 0.3
+
+    def test_unknown_dependency_rejected(self):
+        with pytest.raises(ValueError, match="unknown"):
+            _run_task_graph({"a": (["missing"], lambda r: 1, "a")})
+
+    def test_cycle_rejected(self):
+        tasks = {
+            "a": (["b"], lambda r: 1, "a"),
+            "b": (["a"], lambda r: 2, "b"),
+        }
+        with pytest.raises(ValueError, match="cycle"):
+            _run_task_graph(tasks)
+
+    def test_failure_propagates(self):
+        def boom(r):
+            raise RuntimeError("api down")
+
+        tasks = {
+            "a": ([], boom, "a"),
+            "b": (["a"], lambda r: 2, "b"),
+        }
+        with pytest.raises(RuntimeError, match="api down"):
+            _run_task_graph(tasks)
+
+
+def test_execute_phase0_keeps_layout_and_runs_concurrently(curriculum_tmp):
+    """The plan keeps its 12 keys and independent calls overlap."""
+    fake = FakePhase0LLM()
+    plan = execute_phase0_research(2, fake)
+
+    assert list(plan) == [
+        "00_week_entry",
+        "01_backward_analysis",
+        "02_forward_analysis",
+        "03_pedagogical_research",
+        "04_vocabulary_plan",
+        "05_session_duration",
+        "06_virtue_faith_strategy",
+        "07_assessment_plan",
+        "08_differentiation_plan",
+        "09_materials_list",
+        "10_master_analysis",
+        "11_alignment_guide",
+    ]
+    assert fake.calls == 9
+    assert fake.max_in_flight > 1
+    for key, output in plan.items():
+        assert "wall_time_s" in output["_metadata"], key
+    assert plan["09_materials_list"]["flashcard_sets"][0]["cards"] == ["puella"]
+
+
+def test_backward_analysis_prompt_stays_flat(curriculum_tmp):
+    """Backward analysis prompt size should not grow with the week number."""
+    from src.services.prompts.phase0_research import task_backward_analysis
+
+    early = task_backward_analysis(6, FakePhase0LLM(delay=0))
+    late = task_backward_analysis(35, FakePhase0LLM(delay=0))
+
+    assert late["_metadata"]["digest_chars"] < early["_metadata"]["digest_chars"] * 2
+    assert late["prior_weeks_reviewed"] == list(range(1, 35))
+    assert len(late["cumulative_latin_vocabulary"]) > len(early["cumulative_latin_vocabulary"])
+
+
+@pytest.fixture
+def master_samples(tmp_path, monkeypatch):
+    """Point the gold standard sample paths at a temp corpus."""
+    week1 = tmp_path / "masters" / "Week 1"
+    week11 = tmp_path / "masters" / "Week 11"
+    (week1 / "1.1").mkdir(parents=True)
+    (week11 / "11.1").mkdir(parents=True)
+    (week1 / "1.1" / "02_summary.md").write_text("Salvete!", encoding="utf-8")
+    (week11 / "11.1" / "02_summary.md").write_text("Valete!", encoding="utf-8")
+    monkeypatch.setattr(phase0_research, "MASTER_WEEK_1_PATH", week1)
+    monkeypatch.setattr(phase0_research, "MASTER_WEEK_11_PATH", week11)
+    return week1
+
+
+class TestMasterAnalysisCache:
+    """Test reuse of the gold standard analysis across weeks."""
+
+    def test_analysis_computed_once_across_weeks(self, curriculum_tmp, master_samples):
+        fake = FakePhase0LLM(delay=0)
+        execute_phase0_research(2, fake)
+        calls_first_week = fake.calls
+
+        plan = execute_phase0_research(3, fake)
+        assert fake.calls - calls_first_week == calls_first_week - 1
+        assert "reused_from" in plan["10_master_analysis"]["_metadata"]
+        assert (curriculum_tmp / "master_analysis.json").exists()
+
+    def test_sample_change_invalidates(self, curriculum_tmp, master_samples):
+        fake = FakePhase0LLM(delay=0)
+        get_master_analysis(fake)
+        get_master_analysis(fake)
+        assert fake.calls == 1
+
+        (master_samples / "1.1" / "02_summary.md").write_text("Salvete, discipuli!", encoding="utf-8")
+        get_master_analysis(fake)
+        assert fake.calls == 2
+
+    def test_cache_hits_on_sqlite_backend(self, sqlite_store, master_samples):
+        fake = FakePhase0LLM(delay=0)
+        get_master_analysis(fake)
+        assert "reused_from" in get_master_analysis(fake)["_metadata"]
+        assert fake.calls == 1
+
+    def test_force_recomputes(self, curriculum_tmp, master_samples):
+        fake = FakePhase0LLM(delay=0)
+        get_master_analysis(fake)
+        analysis = get_master_analysis(fake, force=True)
+        assert fake.calls == 2
+        assert "reused_from" not in analysis["_metadata"]
+
+
+def test_phase0_uses_per_call_model_overrides(curriculum_tmp):
+    fake = FakePhase0LLM(delay=0)
+    execute_phase0_research(2, fake)
+    assert fake.models.count("o1-mini") == 3
+    assert set(fake.models) == {"gpt-4o", "o1-mini"}
+
+
+def test_phase0_dry_run_makes_no_network_calls(curriculum_tmp, monkeypatch):
+    from src.config import settings
+    from src.services.llm_client import OpenAIClient
+
+    def no_network(**kwargs):
+        raise AssertionError("dry run reached the OpenAI API")
+
+    monkeypatch.setattr(settings, "DRY_RUN", True)
+    client = OpenAIClient(api_key="dry-run")
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=no_network)))
+
+    plan = execute_phase0_research(4, client)
+    assert len(plan) == 12
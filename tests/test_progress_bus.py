@@ -0,0 +1,97 @@
+"""Tests for the generation progress event bus."""
+import threading
+import time
+
+import orjson
+
+from src.services.progress_bus import (
+    PROGRESS_LINE_PREFIX,
+    ProgressBus,
+    parse_progress_line,
+)
+
+
+def collect(bus, weeks=None):
+    events = []
+    bus.subscribe(events.append, weeks=weeks)
+    return events
+
+
+def test_publish_without_subscribers_is_dropped():
+    bus = ProgressBus()
+    bus.publish(3, phase="day_fields", field="summary")
+    assert bus.get_stats()["published"] == 0
+    assert bus._thread is None
+
+
+def test_bursts_are_coalesced_and_tokens_summed():
+    bus = ProgressBus(interval=60)
+    events = collect(bus)
+    with bus.cond:  # hold the dispatcher back so everything lands in one batch
+        bus.publish(3, day=1, phase="day_fields", field="summary", status="generating", attempt=1)
+        bus.publish(3, day=1, phase="day_fields", field="summary", status="generated", attempt=1, tokens=100)
+        bus.publish(3, day=1, phase="day_fields", field="summary", status="generated", attempt=2, tokens=50)
+        bus.publish(3, day=1, phase="day_fields", field="greeting", status="generating")
+        bus.flush()
+
+    assert [e["field"] for e in events] == ["summary", "greeting"]
+    summary = events[0]
+    assert summary["attempt"] == 2
+    assert summary["tokens"] == 150
+    assert summary["coalesced"] == 2
+    assert summary["week_tokens"] == 150
+    assert bus.get_stats()["published"] == 4
+
+
+def test_dispatcher_throttles_until_terminal_status():
+    bus = ProgressBus(interval=0.3)
+    events = collect(bus)
+    delivered = threading.Event()
+    bus.subscribe(lambda e: delivered.set())
+
+    bus.publish(3, phase="phase0", field="a")
+    assert delivered.wait(2)  # first batch goes out at once
+    delivered.clear()
+    count = len(events)
+
+    bus.publish(3, phase="phase0", field="b")
+    time.sleep(0.05)
+    assert len(events) == count  # held back by the interval
+
+    bus.publish(3, phase="planning", status="completed")
+    assert delivered.wait(2)
+    bus.close()
+    assert {e["field"] for e in events} >= {"a", "b"}
+
+
+def test_week_filtered_subscription():
+    bus = ProgressBus(interval=60)
+    week3 = collect(bus, weeks=[3])
+    every = collect(bus)
+    bus.publish(3, phase="job")
+    bus.publish(4, phase="job")
+    bus.flush()
+    assert [e["week"] for e in week3] == [3]
+    assert sorted(e["week"] for e in every) == [3, 4]
+
+
+def test_failing_subscriber_does_not_block_others():
+    bus = ProgressBus(interval=60)
+
+    def broken(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(broken)
+    events = collect(bus)
+    bus.publish(1, phase="job")
+    bus.flush()
+    assert len(events) == 1
+
+
+def test_progress_line_round_trip():
+    event = {"type": "progress", "week": 2, "phase": "document", "tokens": 7}
+    line = PROGRESS_LINE_PREFIX + orjson.dumps(event).decode() + "\n"
+    assert parse_progress_line(line) == event
+    assert parse_progress_line("  Day 1: ok\n") is None
+    assert parse_progress_line(PROGRESS_LINE_PREFIX + "{not json") is None
+
@@ -0,0 +1,109 @@
+"""Tests for the per-model token-bucket rate limiter."""
+import threading
+import time
+
+from src.services import rate_limiter
+from src.services.rate_limiter import (
+    RATE_LIMIT_SHARE_ENV,
+    RateLimiter,
+    TokenBucket,
+    estimate_tokens,
+    request_token_estimate,
+)
+
+
+class TestTokenBucket:
+    """Test bucket blocking and reconciliation."""
+
+    def test_blocks_until_refilled(self):
+        bucket = TokenBucket(600)  # 10 per second
+        assert bucket.acquire(600) == 0.0
+
+        started = time.perf_counter()
+        waited = bucket.acquire(3)
+        assert 0.2 < time.perf_counter() - started < 1.0
+        assert waited > 0.2
+
+    def test_refund_frees_capacity(self):
+        bucket = TokenBucket(600)
+        bucket.acquire(600)
+        bucket.adjust(-500)
+        started = time.perf_counter()
+        bucket.acquire(400)
+        assert time.perf_counter() - started < 0.1
+
+    def test_overdraft_goes_negative(self):
+        bucket = TokenBucket(600)
+        bucket.acquire(100)
+        bucket.adjust(600)
+        assert bucket.level < 0
+
+    def test_oversized_request_is_clamped(self):
+        bucket = TokenBucket(600)
+        assert bucket.acquire(10_000) == 0.0
+
+
+class TestRateLimiter:
+    """Test per-model limits and reconciliation."""
+
+    def test_unconfigured_model_is_not_limited(self):
+        limiter = RateLimiter({"gpt-4o": {"rpm": 1, "tpm": 10}})
+        for _ in range(5):
+            limiter.acquire("o3-mini", 10_000)
+        assert limiter.get_stats()["throttled"] == 0
+
+    def test_versioned_model_uses_longest_prefix(self):
+        limiter = RateLimiter({"gpt-4o": {"rpm": 1}, "gpt-4o-mini": {"rpm": 100}})
+        assert limiter._limit_key("gpt-4o-2024-08-06") == "gpt-4o"
+        assert limiter._limit_key("gpt-4o-mini-2024-07-18") == "gpt-4o-mini"
+
+    def test_reconcile_replaces_estimate(self):
+        limiter = RateLimiter({"m": {"tpm": 600}})
+        reservation = limiter.acquire("m", 500)
+        limiter.reconcile(reservation, 100)
+        limiter.reconcile(reservation, 100)  # Second reconcile is a no-op
+
+        started = time.perf_counter()
+        limiter.acquire("m", 450)
+        assert time.perf_counter() - started < 0.1
+        assert limiter.get_stats()["estimate_error_tokens"] == -400
+
+    def test_concurrent_callers_queue_instead_of_failing(self):
+        limiter = RateLimiter({"m": {"rpm": 600}})  # 10 requests per second after the burst
+        limiter.acquire("m", 0)
+        for _ in range(598):
+            limiter.acquire("m", 0)
+
+        finished = []
+
+        def call():
+            limiter.acquire("m", 0)
+            finished.append(time.perf_counter())
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(finished) == 4
+        assert max(finished) - started > 0.2
+        assert limiter.get_stats()["throttled"] >= 3
+
+
+def test_request_estimate_includes_completion_budget():
+    messages = [{"role": "user", "content": "x" * 400}]
+    assert estimate_tokens(messages) == 106
+    assert request_token_estimate({"messages": messages, "max_tokens": 50}) == 156
+    assert request_token_estimate({"messages": messages}, default_max_tokens=10) == 116
+
+
+def test_job_children_split_the_limits(monkeypatch):
+    from src.config import settings
+    monkeypatch.setattr(settings, "LLM_RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_RATE_LIMITS", {"gpt-4o": {"rpm": 500, "tpm": 30000}})
+    monkeypatch.setattr(rate_limiter, "_limiter", None)
+    monkeypatch.setenv(RATE_LIMIT_SHARE_ENV, "4")
+
+    assert rate_limiter.get_rate_limiter().limits == {"gpt-4o": {"rpm": 125, "tpm": 7500}}
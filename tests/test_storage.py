@@ -0,0 +1,180 @@
+"""Tests for storage: read cache, atomic batches and backends."""
+import os
+
+import pytest
+
+from src.services import storage
+from src.services.storage_backends import SQLiteBackend, _ReadCache, artifact_key
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    storage.clear_read_cache()
+    yield
+    storage.clear_read_cache()
+
+
+def test_repeat_reads_hit_the_cache(tmp_path):
+    path = tmp_path / "spec.json"
+    storage.write_json(path, {"title": "Nouns", "vocab": ["puella"]})
+
+    assert storage.read_json(path) == {"title": "Nouns", "vocab": ["puella"]}
+    assert storage.read_json(path)["title"] == "Nouns"
+    assert storage.read_file(path).startswith("{")
+
+    stats = storage.get_read_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["entries"] == 1
+
+
+def test_callers_get_independent_objects(tmp_path):
+    path = tmp_path / "spec.json"
+    storage.write_json(path, {"vocab": ["puella"]})
+
+    first = storage.read_json(path)
+    first["vocab"].append("agricola")
+    assert storage.read_json(path) == {"vocab": ["puella"]}
+
+
+def test_write_invalidates_entry(tmp_path):
+    path = tmp_path / "summary.md"
+    storage.write_file(path, "aaaa")
+    assert storage.read_file(path) == "aaaa"
+
+    # Same size and (on coarse filesystems) possibly the same mtime
+    stat = path.stat()
+    storage.write_file(path, "bbbb")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert storage.read_file(path) == "bbbb"
+
+
+def test_external_change_is_detected(tmp_path):
+    path = tmp_path / "summary.md"
+    storage.write_file(path, "short")
+    storage.read_file(path)
+
+    path.write_text("a longer body", encoding="utf-8")
+    assert storage.read_file(path) == "a longer body"
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        storage.read_file(tmp_path / "missing.txt")
+
+
+def test_lru_eviction_bounds_entries(tmp_path):
+    cache = _ReadCache(max_entries=2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.txt"
+        path.write_text(str(i), encoding="utf-8")
+        paths.append(path)
+        cache.read(path)
+
+    assert cache.get_stats()["entries"] == 2
+    cache.read(paths[0])
+    assert cache.get_stats()["misses"] == 4
+
+
+def test_batch_commits_all_files_together(curriculum_tmp):
+    first = curriculum_tmp / "Week01" / "Day1" / "01_class_name.txt"
+    second = curriculum_tmp / "Week01" / "Day1" / "04_role_context.json"
+
+    with storage.atomic_batch():
+        storage.write_file(first, "Latin Nouns")
+        storage.write_json(second, {"sparky_role": "guide"})
+        assert not first.exists()
+        # Reads inside the batch see staged content
+        assert storage.read_json(second) == {"sparky_role": "guide"}
+
+    assert first.read_text(encoding="utf-8") == "Latin Nouns"
+    assert storage.read_json(second) == {"sparky_role": "guide"}
+    assert list((curriculum_tmp / ".staging").iterdir()) == []
+
+
+def test_batch_rolls_back_on_error(curriculum_tmp):
+    path = curriculum_tmp / "Week01" / "Day1" / "02_summary.md"
+    storage.write_file(path, "old")
+
+    with pytest.raises(RuntimeError):
+        with storage.atomic_batch():
+            storage.write_file(path, "new")
+            with storage.atomic_batch():  # Nested batch joins the outer one
+                storage.write_file(path.with_name("03_grade_level.txt"), "3-5")
+            raise RuntimeError("generation failed")
+
+    assert storage.read_file(path) == "old"
+    assert not path.with_name("03_grade_level.txt").exists()
+    assert not (curriculum_tmp / ".staging").exists()
+
+
+def test_write_leaves_no_temp_files(curriculum_tmp):
+    path = curriculum_tmp / "Week01" / "internal_documents" / "week_spec.json"
+    storage.write_json(path, {"metadata": {}})
+    storage.write_json(path, {"metadata": {"title": "Nouns"}})
+
+    assert [p.name for p in path.parent.iterdir()] == ["week_spec.json"]
+    assert storage.read_json(path)["metadata"]["title"] == "Nouns"
+
+
+def test_artifact_keys(tmp_path):
+    assert artifact_key(tmp_path, tmp_path / "Week05" / "Day2_5.2" / "01_class_name.txt") == (5, 2, "01_class_name.txt")
+    assert artifact_key(tmp_path, tmp_path / "Week05" / "Day2_5.2" / "06_document_for_sparky" / "a.txt") == (
+        5, 2, "06_document_for_sparky/a.txt"
+    )
+    assert artifact_key(tmp_path, tmp_path / "Week05" / "internal_documents" / "week_spec.json") == (
+        5, 0, "internal_documents/week_spec.json"
+    )
+    assert artifact_key(tmp_path, tmp_path / "master_analysis.json") == (0, 0, "master_analysis.json")
+
+
+def test_sqlite_backend_round_trip(sqlite_store, curriculum_tmp):
+    class_name = storage.day_field_path(3, 1, "01_class_name.txt")
+    storage.write_file(class_name, "Latin Verbs")
+    storage.write_json(storage.day_field_path(3, 1, "04_role_context.json"), {"sparky_role": "guide"})
+    storage.write_file(storage.document_for_sparky_file_path(3, 1, "chant_chart_document.txt"), "amo, amas")
+
+    # Nothing is written as loose files
+    assert not storage.week_dir(3).exists()
+    assert storage.read_file(class_name) == "Latin Verbs"
+    assert storage.path_exists(storage.day_dir(3, 1))
+    assert storage.path_exists(storage.document_for_sparky_dir(3, 1))
+    assert not storage.path_exists(storage.day_dir(3, 2))
+    assert storage.file_size(class_name) == len("Latin Verbs")
+
+    bundle = storage.compile_day_flint_bundle(3, 1)
+    assert bundle["01_class_name.txt"] == "Latin Verbs"
+    assert bundle["04_role_context.json"] == {"sparky_role": "guide"}
+    assert bundle["06_document_for_sparky"]["chant_chart_document"] == "amo, amas"
+    assert bundle["02_summary.md"] is None
+
+
+def test_sqlite_batch_and_overview(sqlite_store):
+    with storage.atomic_batch():
+        storage.write_json(storage.internal_doc_path(4, "week_spec.json"), {"metadata": {}})
+        for day in (1, 2):
+            storage.write_file(storage.day_field_path(4, day, "01_class_name.txt"), f"Day {day}")
+
+    overview = sqlite_store.week_overview()
+    assert list(overview) == [4]
+    assert overview[4]["has_spec"] is True
+    assert overview[4]["days"] == 2
+
+
+def test_sqlite_materialize_writes_directory_layout(sqlite_store, curriculum_tmp):
+    storage.write_file(storage.day_field_path(2, 3, "02_summary.md"), "Summary")
+    storage.write_json(storage.internal_doc_path(2, "week_spec.json"), {"metadata": {}})
+
+    week_path = storage.materialize_week(2)
+    assert (week_path / "Day3_2.3" / "02_summary.md").read_text(encoding="utf-8") == "Summary"
+    assert (week_path / "internal_documents" / "week_spec.json").exists()
+
+
+def test_filesystem_tree_imports_into_sqlite(curriculum_tmp):
+    storage.write_file(storage.day_field_path(1, 1, "01_class_name.txt"), "Nouns")
+    storage.write_file(storage.day_field_path(1, 2, "01_class_name.txt"), "More Nouns")
+
+    backend = SQLiteBackend(curriculum_tmp / "db" / "store.sqlite", lambda: curriculum_tmp)
+    assert backend.import_tree() == 2
+    assert backend.read_day(1, 2) == {"01_class_name.txt": b"More Nouns"}
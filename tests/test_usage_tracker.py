@@ -0,0 +1,197 @@
+"""Tests for the append-only usage ledger behind UsageTracker."""
+import subprocess
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+
+from src.services.usage_tracker import UsageTracker
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def make(tmp_path, **kwargs):
+    kwargs.setdefault("flush_interval", 0)
+    return UsageTracker(storage_path=tmp_path / "summary.json", **kwargs)
+
+
+def ledger_lines(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    return path.read_bytes().splitlines() if path.exists() else []
+
+
+def test_track_updates_aggregates_and_appends(tmp_path):
+    tracker = make(tmp_path)
+    tracker.track("openai", "gpt-4o", 1_000_000, 0)
+    tracker.track("openai", "gpt-4o-mini", 0, 1_000_000, operation="day_document")
+
+    summary = tracker.get_summary()
+    assert summary["total_requests"] == 2
+    assert summary["estimated_cost_usd"] == pytest.approx(3.10)
+    assert summary["by_model"]["gpt-4o"]["requests"] == 1
+    assert summary["by_provider"]["openai"]["requests"] == 2
+    assert [s["operation"] for s in summary["sessions"]] == ["generation", "day_document"]
+    assert len(ledger_lines(tmp_path)) == 2
+    assert not (tmp_path / "summary.json").exists()  # no snapshot rewrite per call
+
+
+def test_records_are_buffered_until_flush(tmp_path):
+    tracker = make(tmp_path, flush_interval=60)
+    for _ in range(5):
+        tracker.track("openai", "gpt-4o", 10, 10)
+    assert tracker.get_summary()["total_requests"] == 5
+    assert ledger_lines(tmp_path) == []
+
+    tracker.flush()
+    assert len(ledger_lines(tmp_path)) == 5
+
+
+def test_reload_replays_ledger(tmp_path):
+    tracker = make(tmp_path)
+    tracker.track("openai", "gpt-4o", 100, 50)
+    tracker.track("openai", "gpt-4o", 100, 50)
+
+    reloaded = make(tmp_path)
+    assert reloaded.get_summary()["total_requests"] == 2
+    assert reloaded.get_summary()["total_tokens_prompt"] == 200
+
+
+def test_compaction_folds_ledger_into_snapshot(tmp_path):
+    tracker = make(tmp_path, compact_bytes=500)
+    for _ in range(10):
+        tracker.track("openai", "gpt-4o", 100, 50)
+
+    snapshot = orjson.loads((tmp_path / "summary.json").read_bytes())
+    assert snapshot["total_requests"] + len(ledger_lines(tmp_path)) == 10
+    assert (tmp_path / "ledger.jsonl").stat().st_size < 500
+
+    assert make(tmp_path).get_summary()["total_requests"] == 10
+    tracker.compact()
+    assert ledger_lines(tmp_path) == []
+    assert make(tmp_path).get_summary()["total_requests"] == 10
+
+
+def test_trackers_sharing_files_see_each_other(tmp_path):
+    first = make(tmp_path)
+    second = make(tmp_path)
+    first.track("openai", "gpt-4o", 100, 0)
+    second.track("openai", "gpt-4o", 100, 0)
+    assert second.get_summary()["total_requests"] == 2  # replayed first's record
+
+    first.refresh()
+    assert first.get_summary()["total_requests"] == 2
+
+    # Compaction by one tracker is picked up by the other without double counting
+    second.compact()
+    first.track("openai", "gpt-4o", 100, 0)
+    assert first.get_summary()["total_requests"] == 3
+    second.refresh()
+    assert second.get_summary()["total_requests"] == 3
+
+    first.reset()
+    second.refresh()
+    assert second.get_summary()["total_requests"] == 0
+
+
+def test_track_during_reload_is_counted_once(tmp_path):
+    first = make(tmp_path, flush_interval=3600)
+    second = make(tmp_path)
+    first.track("openai", "gpt-4o", 100, 0)
+    second.track("openai", "gpt-4o", 100, 0)
+    second.compact()
+
+    # A track() landing while the reload reads the ledger (self.lock released)
+    real_replay = first._replay
+    def replay_with_track():
+        first.track("openai", "gpt-4o", 100, 0)
+        real_replay()
+    first._replay = replay_with_track
+
+    first.flush()
+    assert first.get_summary()["total_requests"] == 3
+    first._replay = real_replay
+    first.flush()
+    assert make(tmp_path).get_summary()["total_requests"] == 3
+
+
+def test_concurrent_processes_lose_no_records(tmp_path):
+    script = (
+        "import sys; from pathlib import Path\n"
+        "from src.services.usage_tracker import UsageTracker\n"
+        "t = UsageTracker(storage_path=Path(sys.argv[1]), flush_interval=0.01, compact_bytes=4000)\n"
+        "for _ in range(40): t.track('openai', 'gpt-4o', 1, 1)\n"
+        "t.flush()\n"
+    )
+    procs = [
+        subprocess.Popen([sys.executable, "-c", script, str(tmp_path / "summary.json")], cwd=PROJECT_ROOT)
+        for _ in range(3)
+    ]
+    assert all(proc.wait(timeout=60) == 0 for proc in procs)
+    assert make(tmp_path).get_summary()["total_requests"] == 120
+
+
+def test_breakdown_groups_and_filters(tmp_path):
+    tracker = make(tmp_path)
+    tracker.track("openai", "gpt-4o", 1_000_000, 0, week=3, day=1, phase="document",
+                  task="task_day_document", attempt=1, latency_s=4.0)
+    tracker.track("openai", "gpt-4o", 1_000_000, 0, week=3, day=1, phase="document",
+                  task="task_day_document", attempt=2, latency_s=6.0)
+    tracker.track("openai", "gpt-4o", 1_000_000, 0, week=3, day=1, phase="day_fields",
+                  task="task_day_summary", attempt=1, cache_hit=True, latency_s=0.01)
+    tracker.track("openai", "gpt-4o-mini", 1000, 1000, week=4, phase="phase0",
+                  task="task_backward_analysis", latency_s=1.0)
+
+    report = tracker.breakdown(group_by=["task"], week=3)
+    rows = {row["task"]: row for row in report["rows"]}
+    assert list(rows) == ["task_day_document", "task_day_summary"]  # most expensive first
+    document = rows["task_day_document"]
+    assert document["requests"] == 2 and document["retries"] == 1
+    assert document["cost_usd"] == pytest.approx(5.0)
+    assert document["avg_latency_s"] == pytest.approx(5.0)
+    assert document["max_latency_s"] == pytest.approx(6.0)
+    summary = rows["task_day_summary"]
+    assert summary["cache_hit_rate"] == 1.0 and summary["cost_usd"] == 0
+    assert report["totals"]["requests"] == 3
+
+    # Cache hits are not API requests; attribution survives a reload
+    assert tracker.get_summary()["total_requests"] == 3
+    assert "by_call" not in tracker.get_summary()
+    phases = {row["phase"] for row in make(tmp_path).breakdown(group_by=["phase"])["rows"]}
+    assert phases == {"document", "day_fields", "phase0"}
+
+    with pytest.raises(ValueError):
+        tracker.breakdown(group_by=["prompt"])
+
+
+def test_instrumented_client_attributes_calls(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from src.services import instrumented_client
+    from src.services.instrumented_client import InstrumentedClient
+
+    tracker = make(tmp_path)
+    monkeypatch.setattr(instrumented_client, "get_tracker", lambda: tracker)
+
+    class Client:
+        model = "stub"
+
+        def __init__(self):
+            self.calls = 0
+
+        def generate(self, prompt, system=None, **kwargs):
+            self.calls += 1
+            return SimpleNamespace(text="ok", tokens_prompt=10, tokens_completion=5, model="gpt-4o",
+                                   provider="openai", cached=self.calls == 3)
+
+    client = InstrumentedClient(Client(), 5, 2, "document", "document_for_sparky", "task_day_document")
+    for _ in range(3):
+        assert client.generate(prompt="p").text == "ok"
+    assert client.model == "stub"
+    assert client.attempt == 3
+
+    row = tracker.breakdown(group_by=["week", "day", "task", "cache_hit"])["rows"]
+    by_hit = {r["cache_hit"]: r for r in row}
+    assert by_hit[False]["requests"] == 2 and by_hit[False]["retries"] == 1
+    assert by_hit[True]["requests"] == 1 and by_hit[True]["tokens_prompt"] == 0
+    assert by_hit[False]["week"] == 5 and by_hit[False]["task"] == "task_day_document"
@@ -1 +1,57 @@
-"""Placeholder module for future implementation."""
+"""Tests for week validation on the storage backends."""
+from src.services import storage
+from src.services.validator import validate_day_fields, validate_week
+
+
+def write_day(week: int, day: int):
+    for field in storage.DAY_FIELDS:
+        if field == "06_document_for_sparky/":
+            for doc_file in storage.DOCUMENT_FOR_SPARKY_FILES:
+                storage.write_file(storage.document_for_sparky_file_path(week, day, doc_file), "Salve!")
+        elif field == "04_role_context.json":
+            storage.write_json(
+                storage.day_field_path(week, day, field),
+                {"sparky_role": "guide", "focus_mode": "review", "hints_enabled": True}
+            )
+        else:
+            storage.write_file(storage.day_field_path(week, day, field), f"Day {day}: spiral review")
+
+
+def write_week(week: int):
+    storage.write_json(
+        storage.internal_doc_path(week, "week_spec.json"),
+        {"metadata": {"week": week}, "objectives": [], "grammar_focus": "nouns"}
+    )
+    storage.write_file(storage.internal_doc_path(week, "week_summary.md"), "Summary")
+    storage.write_json(storage.internal_doc_path(week, "role_context.json"), {"role": "guide"})
+    storage.write_json(storage.internal_doc_path(week, "generation_log.json"), {"ok": True})
+    for day in range(1, 5):
+        write_day(week, day)
+
+
+def test_validate_week_on_sqlite_reads_each_day_once(sqlite_store, monkeypatch):
+    write_week(3)
+    storage.write_file(storage.day_field_path(3, 2, "02_summary.md"), "")
+    storage.write_file(storage.day_field_path(3, 2, "01_class_name.txt"), "Week Title")
+
+    read_days = []
+    real_read_day = sqlite_store.read_day
+    monkeypatch.setattr(sqlite_store, "read_day", lambda week, day: read_days.append(day) or real_read_day(week, day))
+
+    result = validate_week(3)
+
+    assert read_days == [1, 2, 3, 4]
+    assert [e.location for e in result.errors] == ["Week03/Day2/01_class_name.txt"]
+    assert [w.location for w in result.warnings] == ["Week03/Day2/02_summary.md"]
+
+
+def test_missing_day_and_documents_are_reported(curriculum_tmp):
+    write_day(5, 1)
+    storage.write_file(storage.document_for_sparky_file_path(5, 1, "chant_chart_document.txt"), "")
+
+    result = validate_day_fields(5, 1)
+    assert [w.message for w in result.warnings] == ["Document file is empty"]
+    assert result.is_valid()
+
+    missing = validate_day_fields(5, 2)
+    assert [e.message for e in missing.errors] == ["Day directory does not exist"]
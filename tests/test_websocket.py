@@ -0,0 +1,114 @@
+"""Tests for the WebSocket connection manager's queued, per-week broadcast."""
+import asyncio
+
+import orjson
+
+from src.services.websocket import ConnectionManager
+
+
+class FakeSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_bytes(self, data):
+        await self.gate.wait()
+        await asyncio.sleep(self.delay)
+        self.sent.append(orjson.loads(data))
+
+    async def send_text(self, text):
+        await self.gate.wait()
+        self.sent.append(text)
+
+
+def test_week_subscriptions_and_ordering():
+    async def scenario():
+        manager = ConnectionManager()
+        narrow, wide = FakeSocket(), FakeSocket()
+        await manager.connect(narrow)
+        await manager.connect(wide)
+
+        await manager.handle_message(narrow, '{"type": "subscribe", "weeks": [3]}')
+        await manager.handle_message(narrow, "ping")
+        await manager.publish_event({"type": "progress", "week": 3})
+        await manager.publish_event({"type": "progress", "week": 4})
+        await manager.drain()
+        return narrow.sent, wide.sent, manager.get_status(4)
+
+    narrow, wide, status = asyncio.run(scenario())
+    assert narrow == [{"type": "subscribed", "weeks": [3]}, "pong", {"type": "progress", "week": 3}]
+    assert [m["week"] for m in wide] == [3, 4]
+    assert status == {"type": "progress", "week": 4}
+
+
+def test_slow_client_does_not_delay_others():
+    async def scenario():
+        manager = ConnectionManager()
+        slow, fast = FakeSocket(delay=0.5), FakeSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i in range(5):
+            await manager.broadcast({"type": "progress", "week": 1, "i": i}, week=1)
+        broadcast_time = loop.time() - started
+
+        while len(fast.sent) < 5:
+            await asyncio.sleep(0.01)
+        fast_time = loop.time() - started
+        slow_count = len(slow.sent)
+        for websocket in (slow, fast):
+            manager.disconnect(websocket)
+        return broadcast_time, fast_time, slow_count
+
+    broadcast_time, fast_time, slow_count = asyncio.run(scenario())
+    assert broadcast_time < 0.05
+    assert fast_time < 0.4
+    assert slow_count < 5
+
+
+def test_full_queue_drops_oldest_progress_only():
+    async def scenario():
+        manager = ConnectionManager(queue_size=3)
+        stuck = FakeSocket()
+        stuck.gate.clear()
+        await manager.connect(stuck)
+        await asyncio.sleep(0)
+
+        await manager.broadcast({"type": "validation", "week": 1})
+        for i in range(5):
+            await manager.broadcast({"type": "progress", "week": 1, "i": i})
+        await manager.broadcast({"type": "error", "week": 1})
+        stats = manager.get_stats()
+
+        stuck.gate.set()
+        await manager.drain()
+        return stuck.sent, stats
+
+    sent, stats = asyncio.run(scenario())
+    assert [m["type"] for m in sent] == ["validation", "progress", "error"]
+    assert sent[1]["i"] == 4
+    assert stats["dropped"] == 4
+    assert stats["connections"] == 1
+
+
+def test_failed_send_disconnects_client():
+    class Broken(FakeSocket):
+        async def send_bytes(self, data):
+            raise RuntimeError("closed")
+
+    async def scenario():
+        manager = ConnectionManager()
+        broken = Broken()
+        await manager.connect(broken)
+        await manager.broadcast({"type": "progress", "week": 1})
+        await asyncio.sleep(0.05)
+        return manager.active_connections
+
+    assert asyncio.run(scenario()) == []
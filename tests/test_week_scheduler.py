@@ -0,0 +1,134 @@
+"""Tests for the prerequisite-driven week scheduler."""
+import threading
+import time
+
+import orjson
+import pytest
+
+from src.services.week_scheduler import (
+    WeekScheduler,
+    build_week_graph,
+    dependency_depth,
+    STATUS_PENDING,
+    STATUS_SUCCESS,
+    STATUS_FAILED,
+    STATUS_ABORTED,
+    STATUS_BLOCKED,
+)
+
+
+# Two independent chains: 1 -> 2 -> 3 and 4 -> 5
+PREREQS = {1: [], 2: [1], 3: [1, 2], 4: [], 5: [4]}
+
+
+class Recorder:
+    """run_week stand-in that tracks ordering and concurrency."""
+
+    def __init__(self, delay: float = 0.05, fail=(), abort=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.abort = set(abort)
+        self.lock = threading.Lock()
+        self.order = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, week: int) -> bool:
+        with self.lock:
+            self.order.append(week)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if week in self.fail:
+            raise RuntimeError(f"week {week} broke")
+        return week not in self.abort
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return tmp_path / "week_status.json"
+
+
+def test_graph_only_waits_on_weeks_in_run():
+    graph = build_week_graph([2, 3, 5], PREREQS.get)
+    assert graph == {2: [], 3: [2], 5: []}
+    assert dependency_depth(build_week_graph(list(PREREQS), PREREQS.get)) == 3
+
+
+def test_prerequisites_run_first_and_chains_overlap(journal):
+    recorder = Recorder()
+    scheduler = WeekScheduler(recorder, jobs=2, journal_path=journal, prerequisites=PREREQS.get)
+    statuses = scheduler.run(list(PREREQS))
+
+    assert all(status == STATUS_SUCCESS for status in statuses.values())
+    assert recorder.max_in_flight == 2
+    for week, prereqs in PREREQS.items():
+        assert all(recorder.order.index(p) < recorder.order.index(week) for p in prereqs)
+
+    entries = orjson.loads(journal.read_bytes())
+    assert entries["3"]["status"] == STATUS_SUCCESS
+    assert entries["3"]["prerequisites"] == [1, 2]
+    assert "finished_at" in entries["3"]
+
+
+def test_single_job_is_serial(journal):
+    recorder = Recorder(delay=0.01)
+    WeekScheduler(recorder, jobs=1, journal_path=journal, prerequisites=PREREQS.get).run(list(PREREQS))
+    assert recorder.max_in_flight == 1
+
+
+def test_failure_blocks_only_dependents(journal):
+    recorder = Recorder(fail={1})
+    scheduler = WeekScheduler(recorder, jobs=2, journal_path=journal, prerequisites=PREREQS.get)
+    statuses = scheduler.run(list(PREREQS))
+
+    assert statuses[1] == STATUS_FAILED
+    assert statuses[2] == STATUS_BLOCKED
+    assert statuses[3] == STATUS_BLOCKED
+    assert statuses[4] == statuses[5] == STATUS_SUCCESS
+    assert "week 1 broke" in orjson.loads(journal.read_bytes())["1"]["error"]
+
+
+def test_abort_stops_launching_new_weeks(journal):
+    recorder = Recorder(delay=0.01, abort={1})
+    scheduler = WeekScheduler(recorder, jobs=1, journal_path=journal, prerequisites=PREREQS.get)
+    statuses = scheduler.run([1, 4, 5])
+
+    assert statuses[1] == STATUS_ABORTED
+    assert recorder.order == [1]
+
+
+def test_on_failure_can_stop_run(journal):
+    recorder = Recorder(delay=0.01, fail={1})
+    scheduler = WeekScheduler(recorder, jobs=1, journal_path=journal, prerequisites=PREREQS.get)
+    scheduler.run([1, 4, 5], on_failure=lambda week, error: False)
+    assert recorder.order == [1]
+
+
+def test_on_failure_can_let_dependents_run(journal):
+    recorder = Recorder(delay=0.01, fail={1})
+    scheduler = WeekScheduler(recorder, jobs=1, journal_path=journal, prerequisites=PREREQS.get)
+    statuses = scheduler.run([1, 2, 3], on_failure=lambda week, error: True)
+    assert recorder.order == [1, 2, 3]
+    assert statuses == {1: STATUS_FAILED, 2: STATUS_SUCCESS, 3: STATUS_SUCCESS}
+
+
+def test_interrupt_does_not_wait_for_running_weeks(journal, monkeypatch):
+    import src.services.week_scheduler as week_scheduler
+
+    def interrupted_wait(futures, return_when):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(week_scheduler, "wait", interrupted_wait)
+    recorder = Recorder(delay=0.5)
+    scheduler = WeekScheduler(recorder, jobs=2, journal_path=journal, prerequisites=PREREQS.get)
+
+    started = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        scheduler.run([1, 2, 4])
+    assert time.monotonic() - started < 0.4
+    assert scheduler.journal["1"]["status"] == STATUS_ABORTED
+    assert scheduler.journal["4"]["status"] == STATUS_ABORTED
+    assert scheduler.journal["2"]["status"] == STATUS_PENDING